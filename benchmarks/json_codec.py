@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Tempo de loads/dumps dos codecs JSON do wavelink (json, orjson e msgspec) com payloads gravados do lavalink.
+
+São usados os arquivos da pasta de payloads:
+
+* ``loadtracks_*.json``: respostas do /loadtracks (lidas como bytes, assim como nas requisições REST dos nodes);
+* ``*.jsonl``: frames recebidos pelo websocket, um por linha (lidos como str, assim como no websocket).
+
+Para o dumps são usados os mesmos payloads e os dados enviados ao atualizar os players (PATCH).
+
+Uso: python -m benchmarks.json_codec [pasta com payloads] [repetições]
+"""
+from __future__ import annotations
+
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wavelink.codec import JSONCodec, codecs
+
+payloads_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "payloads")
+
+
+def load_payloads(path: str):
+
+    rest = []
+    frames = []
+
+    for file in sorted(glob.glob(os.path.join(path, "loadtracks_*.json"))):
+        with open(file, "rb") as f:
+            rest.append(f.read())
+
+    for file in sorted(glob.glob(os.path.join(path, "*.jsonl"))):
+        with open(file, encoding="utf-8") as f:
+            frames.extend(line for line in f.read().splitlines() if line.strip())
+
+    return rest, frames
+
+
+def player_updates(rest: list) -> list:
+
+    decoder = JSONCodec()
+    updates = []
+
+    for body in rest:
+        data = decoder.loads(body)["data"]
+        tracks = data if isinstance(data, list) else data.get("tracks") or [data]
+        for track in tracks:
+            updates.append({"track": {"encoded": track["encoded"], "userData": {}}, "position": 0, "volume": 100,
+                            "paused": False, "filters": {"timescale": {"speed": 1.1, "pitch": 1.2, "rate": 1.0}}})
+            updates.append({"position": 61500, "paused": False})
+
+    return updates
+
+
+def bench(func, items: list, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            func(item)
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+
+    path = sys.argv[1] if len(sys.argv) > 1 else payloads_dir
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    rest, frames = load_payloads(path)
+
+    if not rest and not frames:
+        print(f"Nenhum payload encontrado em: {path}")
+        return
+
+    reference = JSONCodec()
+    decoded_rest = [reference.loads(b) for b in rest]
+    decoded_frames = [reference.loads(f) for f in frames]
+    updates = player_updates(rest)
+
+    print(f"Payloads: {len(rest)} loadtracks ({sum(map(len, rest)) // 1024} KB) | {len(frames)} frames do websocket | "
+          f"{len(updates)} atualizações de player | {rounds} repetições\n")
+
+    results = {}
+
+    for name, codec_cls in codecs.items():
+
+        try:
+            codec = codec_cls()
+        except ImportError:
+            print(f"{name}: não instalado")
+            continue
+
+        if [codec.loads(b) for b in rest] != decoded_rest or [codec.loads(f) for f in frames] != decoded_frames:
+            print(f"{name}: resultado do loads diferente do json!")
+
+        if [reference.loads(codec.dumps(d)) for d in decoded_frames] != decoded_frames:
+            print(f"{name}: resultado do dumps diferente do json!")
+
+        results[name] = {
+            "loads loadtracks": bench(codec.loads, rest, rounds),
+            "loads websocket": bench(codec.loads, frames, rounds),
+            "dumps loadtracks": bench(codec.dumps_bytes, decoded_rest, rounds),
+            "dumps websocket": bench(codec.dumps, decoded_frames, rounds),
+            "dumps players": bench(codec.dumps_bytes, updates, rounds),
+        }
+
+    base = results.get("json")
+
+    for name, timings in sorted(results.items(), key=lambda i: i[0] != "json"):
+        print(f"{name}:")
+        for key, value in timings.items():
+            ratio = f" ({base[key] / value:.1f}x)" if base and name != "json" else ""
+            print(f"  {key}: {value:.3f} ms{ratio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Simulação das estratégias de escolha de servidor de música (wavelink.NodeSelector) com nodes sintéticos.
+
+Para cada estratégia os players de vários servidores do discord são criados um a um (o node escolhido recebe o player e
+a carga do node aumenta) e é exibida a distribuição dos players entre os nodes. Para a estratégia hash também é
+exibida a quantidade de servidores que mudam de node ao adicionar/remover um node (comparando com guild_id % nodes).
+
+Os nodes são passados direto para o NodeSelector (o node "connecting", ainda sem stats, seria removido antes pelo
+wavelink.Client caso não esteja disponível).
+
+Uso: python -m benchmarks.node_selection [quantidade de servidores]
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wavelink.selection import NodeSelector
+from wavelink.stats import Stats
+
+
+class SimNode:
+    """Node com stats sintéticos: a carga de cpu e os frames perdidos aumentam conforme a quantidade de players."""
+
+    def __init__(self, identifier: str, region: str, cores: int, base_load: float, rest_latency=None,
+                 connected: bool = True):
+        self.identifier = identifier
+        self.region = region
+        self.cores = cores
+        self.base_load = base_load
+        self.rest_latency = rest_latency
+        self.connected = connected
+        self.players = {}
+        self.breaker = SimpleNamespace(is_open=False)
+
+    @property
+    def stats(self):
+
+        if not self.connected:
+            return None
+
+        load = min(self.base_load + len(self.players) * 0.004 / self.cores, 1.0)
+
+        return Stats(self, {
+            "uptime": 0, "players": len(self.players), "playingPlayers": len(self.players),
+            "memory": {"free": 0, "used": 0, "allocated": 0, "reservable": 0},
+            "cpu": {"cores": self.cores, "systemLoad": load, "lavalinkLoad": load},
+            "frameStats": {"sent": 3000, "nulled": int(max(load - 0.8, 0) * 3000), "deficit": 0},
+        })
+
+
+def sample_nodes():
+    return [
+        SimNode("br-1", "brazil", cores=4, base_load=0.05, rest_latency=0.04),
+        SimNode("br-2", "brazil", cores=2, base_load=0.20, rest_latency=0.06),
+        SimNode("us-1", "us", cores=8, base_load=0.10, rest_latency=0.18),
+        SimNode("eu-1", "europe", cores=4, base_load=0.30, rest_latency=0.25),
+        SimNode("eu-2", "europe", cores=4, base_load=0.00, rest_latency=None),
+        SimNode("connecting", "us", cores=4, base_load=0.00, connected=False),
+    ]
+
+
+def simulate(strategy: str, guilds: int):
+
+    nodes = sample_nodes()
+    selector = NodeSelector(strategy, region="brazil", latency_weight=1.0)
+
+    start = time.perf_counter()
+
+    for guild_id in range(guilds):
+        node = selector.select(nodes, guild_id=1000000000000000 + guild_id)
+        node.players[guild_id] = None
+
+    elapsed = (time.perf_counter() - start) / guilds * 1_000_000
+
+    counts = [len(n.players) for n in nodes]
+    spread = statistics.pstdev(counts) / statistics.mean(counts)
+
+    print(f"{strategy}: {elapsed:.1f} µs por escolha | desvio/média: {spread:.2f} | " +
+          " | ".join(f"{n.identifier}: {len(n.players)}" for n in nodes))
+
+
+def assignments(nodes: list, guild_ids: range) -> dict:
+    selector = NodeSelector("hash")
+    return {g: selector.select(nodes, guild_id=g).identifier for g in guild_ids}
+
+
+def moved(before: dict, after: dict) -> int:
+    return sum(1 for g in before if before[g] != after[g])
+
+
+def hash_movement(guilds: int):
+
+    guild_ids = range(1000000000000000, 1000000000000000 + guilds)
+    nodes = [SimNode(f"node-{n}", "us", cores=4, base_load=0.1) for n in range(5)]
+
+    before = assignments(nodes, guild_ids)
+
+    added = assignments(nodes + [SimNode("node-5", "us", cores=4, base_load=0.1)], guild_ids)
+    removed = assignments(nodes[:-1], guild_ids)
+
+    removed_node_guilds = sum(1 for n in before.values() if n == nodes[-1].identifier)
+
+    def modulo(amount: int):
+        return {g: g % amount for g in guild_ids}
+
+    print(f"\nhash (rendezvous) com {len(nodes)} nodes e {guilds} servidores:")
+    print(f"  adicionando 1 node: {moved(before, added)} servidores mudaram de node "
+          f"(ideal: ~{guilds // (len(nodes) + 1)}) | guild_id % nodes: {moved(modulo(5), modulo(6))}")
+    print(f"  removendo 1 node: {moved(before, removed)} servidores mudaram de node "
+          f"(players do node removido: {removed_node_guilds}) | guild_id % nodes: {moved(modulo(5), modulo(4))}")
+
+
+def main():
+
+    guilds = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+
+    print(f"Servidores: {guilds} | região preferida: brazil\n")
+
+    for strategy in NodeSelector.strategies:
+        simulate(strategy, guilds)
+
+    hash_movement(guilds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Tempo de renderização das skins customizadas: conversor anterior x skin compilada (skin_utils.compile_skin).
+
+As skins nativas (utils/music/skins) são módulos python e não passam pelo conversor, por isso apenas as skins
+customizadas de exemplo são comparadas.
+
+Uso: python -m benchmarks.skin_render [renderizações por skin]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import legacy_skin_converter
+from utils.music import skin_utils
+
+# mesmo modelo base do editor de skins (base_skin em utils/music/interactions.py).
+base_skin = {
+    "queue_max_entries": 7,
+    "queue_format": "`{track.number}) [{track.duration}]` [`{track.title_42}`]({track.url})",
+    "embeds": [
+        {
+            "title": "Próximas músicas:",
+            "description": "{queue_format}",
+            "color": "{guild.color}"
+        },
+        {
+            "description": "**Tocando agora:\n[{track.title}]({track.url})**\n\n**Duração:** `{track.duration}`\n**Pedido por:** {requester.mention}\n**Uploader**: `{track.author}`\n**Playlist de origem:** [`{playlist.name}`]({playlist.url})\n\n{player.log.emoji} **Última ação:** {player.log.text}",
+            "image": {
+              "url": "{track.thumb}"
+            },
+            "color": "{guild.color}",
+            "footer": {
+               "text": "Músicas na lista: {player.queue.size}"
+            }
+        }
+    ]
+}
+
+sample_skins = {
+    "base": base_skin,
+    "content": {
+        "content": "🎶 **{track.title_58}** (`{track.duration}`) - {requester.mention}\n{player.log.emoji} {player.log.text}",
+    },
+    "completa": {
+        "queue_max_entries": 10,
+        "queue_format": "`{track.number}.` [`{track.title_25}`]({track.url}) `{track.author}`",
+        "content": "Tocando em {guild.name}: {track.title_25}",
+        "embeds": [
+            {
+                "description": "{queue_format}",
+                "color": "{guild.color}",
+                "author": {"name": "{guild.name}", "icon_url": "{guild.icon}"},
+            },
+            {
+                "description": "[{track.title}]({track.url})\n{player.hint}",
+                "thumbnail": {"url": "{track.thumb}"},
+                "color": "{guild.color}",
+                "author": {"name": "{requester.display_name}", "icon_url": "{requester.avatar}"},
+                "footer": {"text": "Volume: {player.volume}% | Repetição: {player.loop.mode} | {player.queue.size} músicas",
+                           "icon_url": "{requester.avatar}"},
+                "fields": [
+                    {"name": "Reprodução automática", "value": "{player.autoplay}"},
+                    {"name": "Nightcore", "value": "{player.nightcore}"},
+                    {"name": "Playlist", "value": "[`{playlist.name}`]({playlist.url})"},
+                ],
+            },
+        ],
+    },
+}
+
+
+def fake_track(n: int):
+    return SimpleNamespace(
+        title=f"Sekai - Burn Me Down [NCS Release] {n}", author="NoCopyrightSounds",
+        uri=f"https://www.youtube.com/watch?v=2vFA0HL9k{n:02d}", duration=215000 + n, is_stream=False,
+        thumb="https://img.youtube.com/vi/2vFA0HL9kTk/mqdefault.jpg", playlist_name="NCS", playlist_url="https://youtube.com",
+        autoplay=False, requester=1
+    )
+
+
+def fake_objects():
+
+    avatar = SimpleNamespace(
+        replace=lambda **kwargs: SimpleNamespace(url="https://cdn.discordapp.com/avatar.png"),
+        with_static_format=lambda f: SimpleNamespace(url="https://cdn.discordapp.com/avatar.png")
+    )
+    member = SimpleNamespace(global_name="Membro", display_name="Membro", mention="<@1>", display_avatar=avatar)
+    guild = SimpleNamespace(
+        id=1, name="Servidor", icon=None, get_member=lambda i: member,
+        me=SimpleNamespace(color=SimpleNamespace(value=0x2b2d31), display_avatar=avatar)
+    )
+    player = SimpleNamespace(
+        current=fake_track(0), queue=[fake_track(n) for n in range(1, 30)], queue_autoplay=[], loop=False, volume=100,
+        autoplay=False, nightcore=False, current_hint="Dica: use o comando /play", command_log="Membro pulou a música.",
+        command_log_emoji="⏭️", controller_link="https://discord.com/channels/1/2/3", controller_mode=True
+    )
+    return guild, player
+
+
+def normalize(data: dict) -> dict:
+    return {k: [e.to_dict() if hasattr(e, "to_dict") else e for e in v] if k == "embeds" else v for k, v in data.items()}
+
+
+def bench(func, renders: int) -> float:
+    start = time.perf_counter()
+    for _ in range(renders):
+        func()
+    return (time.perf_counter() - start) / renders * 1_000_000
+
+
+def main():
+
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+
+    guild, player = fake_objects()
+
+    for name, skin in sample_skins.items():
+
+        if normalize(legacy_skin_converter.skin_converter(skin, guild, player=player)) != \
+                normalize(skin_utils.skin_converter(skin, guild, player=player, skin_name=name)):
+            print(f"Skin {name}: resultado diferente do conversor anterior!")
+
+        legacy = bench(lambda: legacy_skin_converter.skin_converter(skin, guild, player=player), renders)
+        uncached = bench(lambda: skin_utils.skin_converter(skin, guild, player=player), renders)
+        compiled = bench(lambda: skin_utils.skin_converter(skin, guild, player=player, skin_name=name), renders)
+
+        print(f"Skin {name}: anterior {legacy:.1f} µs | compilando a cada render {uncached:.1f} µs | "
+              f"compilada (cache) {compiled:.1f} µs ({(1 - compiled / legacy):.0%} a menos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Tempo para gerar o base64 das músicas (track_encoder.encode_track/encode_tracks) x encoder anterior.
+
+O base64 é gerado para cada música das playlists/álbuns do spotify e deezer (encode_track) e pode ser gerado para uma
+lista de músicas de uma vez (encode_tracks).
+
+Uso: python -m benchmarks.track_encoder [quantidade de músicas]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import legacy_track_encoder
+from utils.music import track_encoder
+
+
+def sample_track(n: int, v3: bool) -> dict:
+    identifier = f"{n:011d}"
+    track = {
+        "title": f"Sekai - Burn Me Down [NCS Release] {n} ♪",
+        "author": "NoCopyrightSounds",
+        "length": 215000 + n,
+        "identifier": identifier,
+        "isStream": False,
+        "uri": f"https://www.youtube.com/watch?v={identifier}",
+        "sourceName": "youtube",
+        "position": 0,
+    }
+    if v3:
+        track["artworkUrl"] = f"https://img.youtube.com/vi/{identifier}/mqdefault.jpg"
+        track["isrc"] = None if n % 2 else "GBCEN1700123"
+    return track
+
+
+def bench(func, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rounds = 20
+
+    for v3 in (False, True):
+
+        tracks = [sample_track(n, v3) for n in range(amount)]
+
+        if [legacy_track_encoder.encode_track(t)[1] for t in tracks] != track_encoder.encode_tracks(tracks):
+            print(f"v{3 if v3 else 2}: resultado diferente do encoder anterior!")
+
+        track = tracks[0]
+
+        legacy = bench(lambda: legacy_track_encoder.encode_track(track), amount * rounds) / (amount * rounds)
+        single = bench(lambda: track_encoder.encode_track(track), amount * rounds) / (amount * rounds)
+
+        legacy_batch = bench(lambda: [legacy_track_encoder.encode_track(t)[1] for t in tracks], rounds) / rounds
+        batch = bench(lambda: track_encoder.encode_tracks(tracks), rounds) / rounds
+
+        print(f"v{3 if v3 else 2} | 1 música: anterior {legacy * 1_000_000:.2f} µs | atual {single * 1_000_000:.2f} µs "
+              f"({legacy / single:.2f}x)")
+        print(f"v{3 if v3 else 2} | {amount} músicas: anterior {legacy_batch * 1000:.2f} ms | "
+              f"encode_tracks {batch * 1000:.2f} ms ({legacy_batch / batch:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
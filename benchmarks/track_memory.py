@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Memória usada por música nas filas do player: dict info completo x música compactada (TrackRecord).
+
+Uso: python -m benchmarks.track_memory [quantidade de músicas]
+"""
+from __future__ import annotations
+
+import base64
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.music.track_record import TrackRecord
+
+
+def sample_info(n: int) -> dict:
+    # formato das músicas retornadas pelo lavalink (v4) após os ajustes feitos pelo LavalinkTrack.
+    identifier = f"{n:011d}"
+    return {
+        "identifier": identifier,
+        "isSeekable": True,
+        "author": "NoCopyrightSounds",
+        "length": 215000 + n,
+        "isStream": False,
+        "position": 0,
+        "title": f"Sekai - Burn Me Down [NCS Release] {n}",
+        "uri": f"https://www.youtube.com/watch?v={identifier}",
+        "sourceName": "youtube",
+        "artworkUrl": f"https://img.youtube.com/vi/{identifier}/mqdefault.jpg",
+        "isrc": None,
+        "pluginInfo": {},
+        "id": base64.b64encode(os.urandom(180)).decode(),
+        "extra": {
+            "track_loops": 0,
+            "requester": 184889288436187136 + (n % 5),
+            "autoplay": "",
+        },
+    }
+
+
+def measure(amount: int, compact: bool) -> float:
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    if compact:
+        tracks = [TrackRecord(sample_info(n)) for n in range(amount)]
+    else:
+        tracks = [sample_info(n) for n in range(amount)]
+
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    del tracks
+    return used / amount
+
+
+def main():
+
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    before = measure(amount, compact=False)
+    after = measure(amount, compact=True)
+
+    print(f"Músicas: {amount}")
+    print(f"dict info: {before:.0f} bytes por música")
+    print(f"TrackRecord: {after:.0f} bytes por música ({(1 - after / before):.0%} a menos)")
+
+
+if __name__ == "__main__":
+    main()
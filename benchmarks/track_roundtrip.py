@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Verificação do encoder/decoder de músicas (utils/music/track_encoder.py) com músicas geradas aleatoriamente.
+
+Para cada música (v2 e v3, com texto não-ascii, streams, uri/artworkUrl/isrc nulos etc) é verificado que:
+
+* encode_track (caminho rápido) gera exatamente o mesmo resultado que encode_track_v2/encode_track_v3;
+* decode_track(encode_track(música)) retorna os mesmos valores da música original;
+* o decoder lê o texto em "modified utf-8" do java (como nas músicas geradas pelo lavalink).
+
+Uso: python -m benchmarks.track_roundtrip [quantidade de músicas] [seed]
+"""
+from __future__ import annotations
+
+import os
+import random
+import struct
+import sys
+from base64 import b64encode
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.music.track_encoder import DataWriter, decode_track, decode_tracks, encode_track, encode_track_v2, \
+    encode_track_v3, encode_tracks
+
+alphabet = "abcXYZ019 -_()[]/:?=&.çãéüñßøΩжこんにちは音楽🎵🔥\x00"
+
+
+def random_text(rnd: random.Random, min_size: int = 0, max_size: int = 40) -> str:
+    return "".join(rnd.choice(alphabet) for _ in range(rnd.randint(min_size, max_size)))
+
+
+def random_optional(rnd: random.Random):
+    return rnd.choice([None, "", random_text(rnd, 1)])
+
+
+def random_track(rnd: random.Random, v3: bool) -> dict:
+
+    stream = rnd.random() < 0.2
+
+    track = {
+        "title": random_text(rnd),
+        "author": random_text(rnd),
+        "length": 9223372036854775807 if stream else rnd.randint(0, 2 ** 40),
+        "identifier": random_text(rnd, 1),
+        "isStream": stream,
+        "uri": random_optional(rnd),
+        "sourceName": rnd.choice(["youtube", "soundcloud", "http", "deezer", "spotify"]),
+        "position": 0 if stream else rnd.randint(0, 2 ** 32),
+    }
+
+    if v3:
+        track["artworkUrl"] = random_optional(rnd)
+        track["isrc"] = random_optional(rnd)
+
+    return track
+
+
+def expected_info(track: dict) -> dict:
+    # o encoder remove os caracteres não-ascii do título/autor e grava strings vazias como nulas.
+    info = {
+        "title": track["title"].encode("ascii", "ignore").decode(),
+        "author": track["author"].encode("ascii", "ignore").decode(),
+        "length": track["length"],
+        "identifier": track["identifier"],
+        "isStream": track["isStream"],
+        "uri": track["uri"] or None,
+        "sourceName": track["sourceName"],
+        "position": track["position"],
+        "isSeekable": not track["isStream"],
+    }
+    if "artworkUrl" in track:
+        info["artworkUrl"] = track["artworkUrl"] or None
+        info["isrc"] = track["isrc"] or None
+    return info
+
+
+def java_utf(text: str) -> bytes:
+    # DataOutput.writeUTF do java: null como 0xC0 0x80 e caracteres fora do BMP como surrogates.
+    data = bytearray()
+    for unit in struct.unpack(f">{len(text.encode('utf-16-be')) // 2}H", text.encode("utf-16-be")):
+        if 0 < unit < 0x80:
+            data.append(unit)
+        elif unit < 0x800:
+            data += bytes((0xC0 | unit >> 6, 0x80 | unit & 0x3F))
+        else:
+            data += bytes((0xE0 | unit >> 12, 0x80 | unit >> 6 & 0x3F, 0x80 | unit & 0x3F))
+    return struct.pack(">H", len(data)) + bytes(data)
+
+
+def encode_java(track: dict) -> str:
+    # música v3 gravada como no lavaplayer (título/autor em modified utf-8, sem remover caracteres).
+    body = b"\x03" + java_utf(track["title"]) + java_utf(track["author"]) + struct.pack(">Q", track["length"]) + \
+        java_utf(track["identifier"]) + (b"\x01" if track["isStream"] else b"\x00")
+    for key in ("uri", "artworkUrl", "isrc"):
+        body += b"\x01" + java_utf(track[key]) if track[key] else b"\x00"
+    body += java_utf(track["sourceName"]) + struct.pack(">Q", track["position"])
+    return b64encode(struct.pack(">i", len(body) | (1 << 30)) + body).decode()
+
+
+def main():
+
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rnd = random.Random(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+
+    failures = []
+
+    tracks = [random_track(rnd, v3=n % 2 == 0) for n in range(amount)]
+
+    # caso fixo: stream com uri/artwork nulos e texto fora do BMP.
+    tracks.append({
+        "title": "Rádio 24h 🎵 ao vivo", "author": "Ação", "length": 9223372036854775807, "identifier": "ид/🎵",
+        "isStream": True, "uri": None, "sourceName": "http", "position": 0, "artworkUrl": None, "isrc": None
+    })
+
+    for track in tracks:
+
+        v3 = "artworkUrl" in track
+        version, encoded = encode_track(track)
+
+        if version != (3 if v3 else 2):
+            failures.append(("versão", track, version))
+            continue
+
+        if encoded != (encode_track_v3(track) if v3 else encode_track_v2(track)):
+            failures.append(("encoder rápido x DataWriter", track, encoded))
+
+        if (decoded := decode_track(encoded)) != expected_info(track):
+            failures.append(("decode(encode())", track, decoded))
+
+        if v3:
+            java_info = dict(expected_info(track), title=track["title"], author=track["author"])
+            if (decoded := decode_track(encode_java(track))) != java_info:
+                failures.append(("modified utf-8", track, decoded))
+
+    encoded_list = encode_tracks(tracks)
+
+    if decode_tracks(encoded_list + ["inválido"]) != [expected_info(t) for t in tracks] + [None]:
+        failures.append(("encode_tracks/decode_tracks", None, None))
+
+    # músicas truncadas devem falhar (e não retornar dados incorretos).
+    writer = DataWriter()
+    writer.write_byte(b"\x02")
+    writer.write_utf("incompleta")
+    try:
+        decode_track(b64encode(writer.finish()).decode())
+    except Exception:
+        pass
+    else:
+        failures.append(("música truncada", None, None))
+
+    for name, track, result in failures[:10]:
+        print(f"Falha [{name}]:\n  música: {track!r}\n  resultado: {result!r}")
+
+    print(f"Músicas verificadas: {len(tracks)} | falhas: {len(failures)}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,11 @@ DEFAULT_CONFIG = {
     ################
     "MONGO": "",
     "MONGO_TIMEOUT": 30,
+    "MONGO_WRITE_BEHIND": False,
+    "MONGO_WRITE_BEHIND_INTERVAL": 5,
+    "MONGO_WRITE_BEHIND_BATCH_SIZE": 500,
+    "MONGO_WRITE_BEHIND_MAX_PENDING": 5000,
+    "MONGO_WRITE_BEHIND_MAX_RETRIES": 5,
     "SENSITIVE_INFO_WARN": True,
 
     #########################
@@ -65,11 +70,33 @@ DEFAULT_CONFIG = {
     "PLAYER_INFO_BACKUP_INTERVAL": 45,
     "PLAYER_INFO_BACKUP_INTERVAL_MONGO": 300,
     "PLAYER_SESSIONS_MONGODB": False,
+    "PLAYER_RESUME_CONCURRENCY": 5,
+    "PLAYER_RESUME_VOICE_INTERVAL": 500,
+    "CONTROLLER_EDIT_WINDOW": 2000,
+    "CONTROLLER_EDIT_RATE": 20,
     "QUEUE_MAX_ENTRIES": 0,
     "ENABLE_DEFER_TYPING": True,
     "VOICE_CHANNEL_LATENCY_RECONNECT": 200,
+    "LAVALINK_JSON_CODEC": "auto",
+    "LAVALINK_NODE_STRATEGY": "penalty",
+    "LAVALINK_NODE_REGION": "",
+    "LAVALINK_NODE_LATENCY_WEIGHT": 1.0,
+    "LAVALINK_RESUME_TIMEOUT": 60,
+    "SEARCH_HEDGE": False,
+    "SEARCH_HEDGE_DELAY": 800,
+    "SEARCH_HEDGE_FANOUT": 3,
     "PLAYLIST_CACHE_SIZE": 500,
     "PLAYLIST_CACHE_TTL": 1800,
+    "PARTIAL_TRACK_CACHE_SIZE": 1000,
+    "PARTIAL_TRACK_CACHE_MAX_ENTRIES": 50000,
+    "PARTIAL_TRACK_CACHE_TTL": 80400,
+    "LOADTRACKS_CACHE_SIZE": 1000,
+    "LOADTRACKS_CACHE_TTL": 120,
+    "HTTP_POOL_LIMIT": 100,
+    "HTTP_POOL_LIMIT_PER_HOST": 0,
+    "HTTP_POOL_DNS_TTL": 300,
+    "HTTP_POOL_KEEPALIVE_TIMEOUT": 30,
+    "HTTP_POOL_TIMEOUT": 0,
     "USE_YTM_TRACKINFO_SCROBBLE": False,
     "ENABLE_SONGREQUEST_MENTION": True,
 
@@ -153,7 +180,10 @@ DEFAULT_CONFIG = {
     "YOUTUBE_TRACK_COOLDOWN": 20,
     "SILENT_PUBLICBOT_WARNING": False,
     "DBCACHE_SIZE": 1000,
-    "DBCACHE_TTL": 300
+    "DBCACHE_TTL": 300,
+    "DBCACHE_INVALIDATION": "",
+    "DBCACHE_INVALIDATION_BIND": "127.0.0.1:9701",
+    "DBCACHE_INVALIDATION_PEERS": "",
 }
 
 
@@ -203,17 +233,38 @@ def load_config():
         "PRESENCE_INTERVAL",
         "HINT_RATE",
         "MONGO_TIMEOUT",
+        "MONGO_WRITE_BEHIND_INTERVAL",
+        "MONGO_WRITE_BEHIND_BATCH_SIZE",
+        "MONGO_WRITE_BEHIND_MAX_PENDING",
+        "MONGO_WRITE_BEHIND_MAX_RETRIES",
         "INVITE_PERMISSIONS",
         "PREFIXED_POOL_TIMEOUT",
         "PLAYER_INFO_BACKUP_INTERVAL",
         "PLAYER_INFO_BACKUP_INTERVAL_MONGO",
+        "PLAYER_RESUME_CONCURRENCY",
+        "PLAYER_RESUME_VOICE_INTERVAL",
+        "CONTROLLER_EDIT_WINDOW",
+        "CONTROLLER_EDIT_RATE",
         "LAVALINK_RECONNECT_RETRIES",
         "QUEUE_MAX_ENTRIES",
         "VOICE_CHANNEL_LATENCY_RECONNECT",
+        "LAVALINK_RESUME_TIMEOUT",
+        "SEARCH_HEDGE_DELAY",
+        "SEARCH_HEDGE_FANOUT",
         "DBCACHE_SIZE",
         "DBCACHE_TTL",
         "PLAYLIST_CACHE_SIZE",
         "PLAYLIST_CACHE_TTL",
+        "PARTIAL_TRACK_CACHE_SIZE",
+        "PARTIAL_TRACK_CACHE_MAX_ENTRIES",
+        "PARTIAL_TRACK_CACHE_TTL",
+        "LOADTRACKS_CACHE_SIZE",
+        "LOADTRACKS_CACHE_TTL",
+        "HTTP_POOL_LIMIT",
+        "HTTP_POOL_LIMIT_PER_HOST",
+        "HTTP_POOL_DNS_TTL",
+        "HTTP_POOL_KEEPALIVE_TIMEOUT",
+        "HTTP_POOL_TIMEOUT",
         "SPOTIFY_PLAYLIST_EXTRA_PAGE_LIMIT",
         "BOT_ADD_REMOVE_LOG_CHANNEL_ID",
         "YOUTUBE_TRACK_COOLDOWN",
@@ -228,6 +279,20 @@ def load_config():
         except ValueError as e:
             raise Exception(f"Você usou uma configuração inválida! {i}: {CONFIG[i]}\n{repr(e)}")
 
+    # converter strings que requer valor float.
+    for i in [
+        "LAVALINK_NODE_LATENCY_WEIGHT",
+    ]:
+
+        if not CONFIG[i]:
+            CONFIG[i] = DEFAULT_CONFIG[i]
+            continue
+
+        try:
+            CONFIG[i] = float(CONFIG[i])
+        except ValueError as e:
+            raise Exception(f"Você usou uma configuração inválida! {i}: {CONFIG[i]}\n{repr(e)}")
+
     # converter strings que requer valor bool/nulo.
     for i in [
         "AUTO_SYNC_COMMANDS",
@@ -245,6 +310,8 @@ def load_config():
         "ENABLE_DISCORD_URLS_PLAYBACK",
         "PLAYER_SESSIONS_MONGODB",
         "SENSITIVE_INFO_WARN",
+        "MONGO_WRITE_BEHIND",
+        "SEARCH_HEDGE",
         "ENABLE_DEFER_TYPING",
         "ENABLE_COMMANDS_COOLDOWN",
 
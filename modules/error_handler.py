@@ -6,7 +6,6 @@ import traceback
 from typing import TYPE_CHECKING, Optional, Union
 
 import disnake
-from aiohttp import ClientSession
 from disnake.ext import commands
 
 from utils.music.converters import URL_REG
@@ -520,7 +519,7 @@ class ErrorHandler(commands.Cog):
         if file:
             kwargs["file"] = file
 
-        async with ClientSession() as session:
+        async with self.bot.pool.http.borrow("discord_webhook") as session:
             webhook = disnake.Webhook.from_url(self.bot.config["AUTO_ERROR_REPORT_WEBHOOK"], session=session)
             await webhook.send(**kwargs)
 
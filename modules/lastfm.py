@@ -6,7 +6,6 @@ import traceback
 from typing import TYPE_CHECKING, Optional, List
 
 import disnake
-from aiohttp import ClientSession
 from disnake.ext import commands
 from rapidfuzz import fuzz
 
@@ -644,7 +643,7 @@ class LastFmCog(commands.Cog):
         base_url = 'https://api.deezer.com/search'
         params = {'q': query, 'strict': 'on'}
 
-        async with ClientSession() as session:
+        async with self.bot.pool.http.borrow("deezer") as session:
             async with session.get(base_url, params=params) as response:
                 if response.status == 200:
                     data = await response.json()
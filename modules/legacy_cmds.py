@@ -12,7 +12,6 @@ from zipfile import ZipFile
 import disnake
 import dotenv
 import humanize
-from aiohttp import ClientSession
 from disnake.ext import commands
 from disnake.http import Route
 
@@ -218,18 +217,14 @@ class Owner(commands.Cog):
     @panel_command(aliases=["rds", "recarregarskins"], description="Recarregar skins.", emoji="🎨")
     async def reloadskins(self, ctx: Union[CustomContext, disnake.MessageInteraction]):
 
-        for m in list(sys.modules):
-            if not m.startswith("utils.music.skins."):
-                continue
-            try:
-                del sys.modules[m]
-            except:
-                continue
-
-        self.bot.pool.load_skins()
+        # apenas as skins com arquivos alterados são recarregadas.
+        changed = self.bot.pool.load_skins()
 
         txt = "**As skins foram recarregadas com sucesso!**"
 
+        if changed:
+            txt += "\n\n**Skins alteradas:** " + ", ".join(f"`{s}`" for s in changed)
+
         if isinstance(ctx, CustomContext):
             embed = disnake.Embed(colour=self.bot.get_color(ctx.me), description=txt)
             await ctx.send(embed=embed, view=self.owner_view)
@@ -1016,7 +1011,7 @@ class Owner(commands.Cog):
 
         can_connect(channel=ctx.author.voice.channel, guild=guild)
 
-        node: wavelink.Node = bot.music.get_best_node()
+        node: wavelink.Node = bot.music.get_best_node(guild_id=guild.id)
 
         if not node:
             raise GenericError("**Não há servidores de música disponível!**")
@@ -1127,7 +1122,7 @@ class Owner(commands.Cog):
         self.owner_view = PanelView(self.bot)
 
     async def download_lavalink_serverlist(self):
-        async with ClientSession() as session:
+        async with self.bot.pool.http.borrow() as session:
             async with session.get(self.bot.config["LAVALINK_SERVER_LIST"]) as r:
                 ini_file = await r.read()
                 with open("lavalink.ini", "wb") as f:
@@ -108,7 +108,7 @@ class YtOauthView(disnake.ui.View):
         except:
             pass
 
-        async with aiohttp.ClientSession() as session:
+        async with self.bot.pool.http.borrow("youtube") as session:
             data = await self.get_device_code(session)
             verification_url = f"{data['verification_url']}?user_code={data['user_code']}"
 
@@ -17,7 +17,6 @@ import aiofiles
 import disnake
 import humanize
 import psutil
-from aiohttp import ClientSession
 from disnake.ext import commands
 
 from utils.db import DBModel, db_models
@@ -1001,7 +1000,7 @@ class GuildLog(commands.Cog):
             )
 
         else:
-            async with ClientSession() as session:
+            async with self.bot.pool.http.borrow("discord_webhook") as session:
                 webhook = disnake.Webhook.from_url(self.hook_url, session=session)
                 await webhook.send(
                     content=", ".join(f"<@{owner_id}>" for owner_id in self.bot.owner_ids) or self.bot.owner.mention,
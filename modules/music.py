@@ -11,6 +11,7 @@ import sys
 import traceback
 import zlib
 from base64 import b64decode
+from collections import deque
 from contextlib import suppress
 from copy import deepcopy
 from io import BytesIO
@@ -19,7 +20,6 @@ from typing import Union, Optional
 from urllib.parse import urlparse, parse_qs, quote
 
 import aiofiles
-import aiohttp
 import disnake
 from async_timeout import timeout
 from disnake.ext import commands
@@ -105,6 +105,8 @@ class Music(commands.Cog):
         else:
             self.error_report_queue = None
 
+        self.search_stats = {}
+
     stage_cd = commands.CooldownMapping.from_cooldown(2, 45, commands.BucketType.guild)
     stage_mc = commands.MaxConcurrency(1, per=commands.BucketType.guild, wait=False)
 
@@ -852,7 +854,7 @@ class Music(commands.Cog):
             node = bot.music.get_node(server)
 
             if not node:
-                node = await self.get_best_node(bot)
+                node = await self.get_best_node(bot, guild_id=inter.guild_id)
 
             guild_data = await bot.get_data(inter.guild_id, db_name=DBModel.guilds)
 
@@ -1428,7 +1430,7 @@ class Music(commands.Cog):
                 raise GenericError("**A sua fila salva já foi excluída...**")
 
             tracks = await self.check_player_queue(inter.author, bot, guild.id, self.bot.pool.process_track_cls(data["tracks"])[0])
-            node = await self.get_best_node(bot)
+            node = await self.get_best_node(bot, guild_id=guild.id)
             queue_loaded = True
             source = False
 
@@ -1937,7 +1939,7 @@ class Music(commands.Cog):
                         ) as ydl:
                             playlist_data = await bot.loop.run_in_executor(None, lambda: ydl.extract_info(q, download=False))
 
-                        async with aiohttp.ClientSession() as session:
+                        async with bot.pool.http.borrow() as session:
                             async with session.get(playlist_data["thumbnails"][0]['url']) as response:
                                 if response.status != 200:
                                     response.raise_for_status()
@@ -3661,10 +3663,11 @@ class Music(commands.Cog):
             tracks.append(player.current.info)
 
         for t in player.queue:
-            t.info["id"] = t.id
+            info = t.to_info()
+            info["id"] = t.id
             if t.playlist:
-                t.info["playlist"] = {"name": t.playlist_name, "url": t.playlist_url}
-            tracks.append(t.info)
+                info["playlist"] = {"name": t.playlist_name, "url": t.playlist_url}
+            tracks.append(info)
 
         if len(tracks) < 3:
             raise GenericError(f"**É necessário ter no mínimo 3 músicas pra salvar (atual e/ou na fila)**")
@@ -6530,7 +6533,7 @@ class Music(commands.Cog):
         static_player = guild_data["player_controller"]
 
         if not node:
-            node = await self.get_best_node(bot)
+            node = await self.get_best_node(bot, guild_id=guild.id)
 
         global_data = await bot.get_global_data(guild.id, db_name=DBModel.guilds)
 
@@ -6879,6 +6882,8 @@ class Music(commands.Cog):
         except:
             pass
 
+        self.bot.loop.create_task(self.bot.pool.database.flush_pending_writes())
+
     async def interaction_message(self, inter: Union[disnake.Interaction, CustomContext], txt, emoji: str = "✅",
                                   rpc_update: bool = False, data: dict = None, store_embed: bool = False, force=False,
                                   defered=False, thumb=None, components=None):
@@ -6986,14 +6991,17 @@ class Music(commands.Cog):
             if node.is_available:
                 return
 
-            for player in list(node.players.values()):
+            # com a sessão ainda disponível para resume os players continuam no servidor (não é necessário movê-los).
+            if not node.can_resume:
 
-                try:
-                    player._new_node_task.cancel()
-                except:
-                    pass
+                for player in list(node.players.values()):
 
-                player._new_node_task = player.bot.loop.create_task(player._wait_for_new_node())
+                    try:
+                        player._new_node_task.cancel()
+                    except:
+                        pass
+
+                    player._new_node_task = player.bot.loop.create_task(player._wait_for_new_node())
 
             if self.bot.config["LAVALINK_RECONNECT_RETRIES"] and retries == self.bot.config["LAVALINK_RECONNECT_RETRIES"]:
                 print(f"❌ - {self.bot.user} - [{node.identifier}] Todas as tentativas de reconectar falharam...")
@@ -7038,6 +7046,57 @@ class Music(commands.Cog):
                 lst.remove(q)
             lst.append(q)
 
+    @commands.Cog.listener("on_wavelink_node_resumed")
+    async def node_resumed(self, node: wavelink.Node):
+
+        try:
+            session_players = {int(p["guildId"]): p for p in await node.fetch_session_players()}
+        except Exception:
+            traceback.print_exc()
+            session_players = {}
+
+        resumed = 0
+
+        for guild_id, player in list(node.players.items()):
+
+            try:
+                player._new_node_task.cancel()
+            except:
+                pass
+
+            data = session_players.get(guild_id)
+
+            if data and (data.get("track") or not player.current):
+                await player.update_state(data)
+                player.locked = False
+                resumed += 1
+                continue
+
+            # o player não existe mais no servidor: reenviar o estado de voz e retomar a música atual.
+            player.bot.loop.create_task(self.replay_resumed_player(player))
+
+        print(f"🔄 - {self.bot.user} - Sessão retomada no servidor de música: [{node.identifier}] | "
+              f"{resumed}/{len(node.players)} player(s) mantidos.")
+
+    async def replay_resumed_player(self, player: LavalinkPlayer):
+
+        try:
+            position = player.position if player.current else 0
+
+            if player.current:
+                player.queue.appendleft(player.current)
+                player.current = None
+                player.current_encoded = None
+
+            player.locked = False
+
+            if player.guild.me.voice and player._voice_state:
+                await player._dispatch_voice_update()
+
+            await player.process_next(start_position=position)
+        except Exception:
+            print(f"{self.bot.user} - Falha ao retomar player após reconexão: {player.guild_id}\n{traceback.format_exc()}")
+
     @commands.Cog.listener("on_wavelink_node_ready")
     async def node_ready(self, node: wavelink.Node):
         print(f'🌋 - {self.bot.user} - Servidor de música: [{node.identifier} / v{node.version}] está pronto para uso!')
@@ -7155,7 +7214,8 @@ class Music(commands.Cog):
         except (TypeError, KeyError):
             max_retries = 1
 
-        node = await self.bot.music.initiate_node(auto_reconnect=False, region=region, heartbeat=heartbeat, max_retries=max_retries, **data)
+        node = await self.bot.music.initiate_node(auto_reconnect=False, region=region, heartbeat=heartbeat, max_retries=max_retries,
+                                                  resume_timeout=self.bot.config["LAVALINK_RESUME_TIMEOUT"], **data)
         node.info = info
         node.search = search
         node.website = node_website
@@ -7222,13 +7282,14 @@ class Music(commands.Cog):
         if not bot:
             bot = self.bot
 
-        if not node:
-            nodes = sorted([n for n in bot.music.nodes.values() if n.is_available and n.available],
-                           key=lambda n: len(n.players))
-        else:
-            nodes = sorted([n for n in bot.music.nodes.values() if n != node and n.is_available and n.available],
-                           key=lambda n: len(n.players))
-            nodes.insert(0, node)
+        nodes = bot.music.sort_nodes([n for n in bot.music.nodes.values() if n != node and n.is_available and n.available],
+                                     guild_id=ctx.guild.id if ctx.guild else None)
+
+        if node:
+            if node.breaker.is_open:
+                nodes.append(node)
+            else:
+                nodes.insert(0, node)
 
         if not nodes:
             raise GenericError("**Não há servidores de música disponível!**")
@@ -7307,6 +7368,8 @@ class Music(commands.Cog):
                     if not isinstance(e, wavelink.TrackNotFound):
                         print(f"Falha ao processar busca...\n{query}\n{traceback.format_exc()}")
                         node_retry = True
+                        if n.breaker.is_open:
+                            break
                     elif not isinstance(e, GenericError):
                         self.bot.dispatch("custom_error", ctx=ctx, error=e)
 
@@ -7319,6 +7382,121 @@ class Music(commands.Cog):
 
         return tracks, node, exceptions
 
+    def update_search_stats(self, provider: str, latency: float, won: bool = False, failed: bool = False):
+
+        try:
+            stats = self.search_stats[provider]
+        except KeyError:
+            stats = self.search_stats[provider] = {"requests": 0, "wins": 0, "errors": 0, "latency": 0.0}
+
+        stats["requests"] += 1
+        if won:
+            stats["wins"] += 1
+        if failed:
+            stats["errors"] += 1
+        # média móvel da latência das buscas concluídas do provedor.
+        stats["latency"] = latency if stats["requests"] == 1 else stats["latency"] + (latency - stats["latency"]) * 0.2
+
+    async def get_hedged_tracks(self, query: str, ctx: Union[disnake.ApplicationCommandInteraction, CustomContext, disnake.MessageInteraction, disnake.Message],
+            user: disnake.Member, node: wavelink.Node = None, bot: BotCore = None):
+
+        if not bot:
+            bot = self.bot
+
+        nodes = bot.music.sort_nodes([n for n in bot.music.nodes.values() if n != node and n.is_available and n.available],
+                                     guild_id=ctx.guild.id if ctx.guild else None)
+
+        if node and not node.breaker.is_open:
+            nodes.insert(0, node)
+
+        searches = []
+
+        # buscas na ordem de prioridade: os provedores de cada servidor (pelo servidor mais indicado primeiro) e
+        # depois os clients internos de deezer/spotify (usados no get_partial_tracks).
+        for n in nodes:
+            for search_provider in n.search_providers:
+                searches.append((search_provider, n))
+
+        if (bot.pool.config["FORCE_USE_DEEZER_CLIENT"] or [n for n in bot.music.nodes.values() if
+                                                           "deezer" not in n.info.get("sourceManagers", [])]):
+            searches.append(("deezer", None))
+
+        if bot.spotify and not [n for n in bot.music.nodes.values() if "spotify" in n.info.get("sourceManagers", [])]:
+            searches.append(("spotify", None))
+
+        if not searches:
+            raise GenericError("**Não há servidores de música disponível!**")
+
+        exceptions = set()
+
+        async def search(search_provider: str, n: Optional[wavelink.Node]):
+            if search_provider == "deezer":
+                return await self.bot.pool.deezer.get_tracks(url=query, requester=user.id, search=True, check_title=80)
+            if search_provider == "spotify":
+                return await self.bot.pool.spotify.get_tracks(self.bot, user.id, query, search=True, check_title=80)
+            return await n.get_tracks(f"{search_provider}:{query}", track_cls=LavalinkTrack, playlist_cls=LavalinkPlaylist,
+                                      requester=user.id)
+
+        hedge_delay = bot.config["SEARCH_HEDGE_DELAY"] / 1000
+        # limite de buscas em andamento ao mesmo tempo (as demais buscas da lista continuam sendo usadas em seguida).
+        fanout = max(bot.config["SEARCH_HEDGE_FANOUT"], 1)
+        pending = {}
+        started = {}
+        searches = deque(searches)
+
+        def start_next():
+            if not searches or len(pending) >= fanout:
+                return False
+            search_provider, n = searches.popleft()
+            task = bot.loop.create_task(search(search_provider, n))
+            pending[task] = (search_provider, n)
+            started[task] = bot.loop.time()
+            return True
+
+        start_next()
+
+        try:
+            while pending:
+
+                done, _ = await asyncio.wait(pending, timeout=hedge_delay if searches and len(pending) < fanout else None,
+                                             return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # nenhuma busca concluída dentro do tempo de espera: iniciar a próxima em paralelo.
+                    start_next()
+                    continue
+
+                for task in done:
+
+                    search_provider, n = pending.pop(task)
+                    latency = bot.loop.time() - started.pop(task)
+
+                    try:
+                        tracks = task.result()
+                    except Exception as e:
+                        exceptions.add(repr(e))
+                        self.update_search_stats(search_provider, latency, failed=True)
+                        if not isinstance(e, (wavelink.TrackNotFound, GenericError)):
+                            print(f"Falha ao processar busca ({search_provider})...\n{query}\n{traceback.format_exc()}")
+                        continue
+
+                    if tracks:
+                        self.update_search_stats(search_provider, latency, won=True)
+                        return tracks, n or node, exceptions
+
+                    self.update_search_stats(search_provider, latency)
+
+                # as buscas concluídas não retornaram resultados: iniciar as próximas imediatamente.
+                for _ in done:
+                    if not start_next():
+                        break
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return [], node, exceptions
+
     async def get_tracks(
             self, query: str, ctx: Union[disnake.ApplicationCommandInteraction, CustomContext, disnake.MessageInteraction, disnake.Message],
             user: disnake.Member, node: wavelink.Node = None, source=None, bot: BotCore = None, mix=False):
@@ -7410,7 +7588,10 @@ class Music(commands.Cog):
 
             return playlist, node
 
-        tracks, node, exceptions = await self.get_lavalink_tracks(query=query, user=user, ctx=ctx, node=node, bot=bot, source=source)
+        if source is None and (bot or self.bot).config["SEARCH_HEDGE"] and not URL_REG.match(query):
+            tracks, node, exceptions = await self.get_hedged_tracks(query=query, user=user, ctx=ctx, node=node, bot=bot)
+        else:
+            tracks, node, exceptions = await self.get_lavalink_tracks(query=query, user=user, ctx=ctx, node=node, bot=bot, source=source)
 
         if not tracks:
 
@@ -7801,15 +7982,15 @@ class Music(commands.Cog):
             except AttributeError:
                 player.text_channel = inter.channel
 
-    async def get_best_node(self, bot: BotCore = None):
+    async def get_best_node(self, bot: BotCore = None, guild_id: int = None):
 
         if not bot:
             bot = self.bot
 
         try:
-            return sorted(
+            return bot.music.sort_nodes(
                 [n for n in bot.music.nodes.values() if n.stats and n.is_available and n.available],
-                key=lambda n: n.stats.players
+                guild_id=guild_id
             )[0]
 
         except IndexError:
@@ -7830,7 +8011,7 @@ class Music(commands.Cog):
 
             data = await self.error_report_queue.get()
 
-            async with aiohttp.ClientSession() as session:
+            async with self.bot.pool.http.borrow("discord_webhook") as session:
                 webhook = disnake.Webhook.from_url(self.bot.config["AUTO_ERROR_REPORT_WEBHOOK"], session=session)
                 await webhook.send(username=self.bot.user.display_name, avatar_url=self.bot.user.display_avatar.url, **data)
 
@@ -1155,8 +1155,12 @@ class MusicSettings(commands.Cog):
         if not bot:
             return
 
-        skin_list = [s for s in bot.player_skins if s not in bot.config["IGNORE_SKINS"].split()]
-        static_skin_list = [s for s in bot.player_static_skins if s not in bot.config["IGNORE_STATIC_SKINS"].split()]
+        # links de preview das skins (as skins que falharem ao carregar são ignoradas).
+        skin_previews = bot.player_skins.previews()
+        static_skin_previews = bot.player_static_skins.previews()
+
+        skin_list = [s for s in skin_previews if s not in bot.config["IGNORE_SKINS"].split()]
+        static_skin_list = [s for s in static_skin_previews if s not in bot.config["IGNORE_STATIC_SKINS"].split()]
 
         await inter.response.defer(ephemeral=True)
 
@@ -1183,8 +1187,8 @@ class MusicSettings(commands.Cog):
         global_static_skins_opts = [disnake.SelectOption(emoji="💠" if s.startswith("> custom_skin: ") else "🎨", label=f"Song-Request: {s.replace('> custom_skin: ', '')}", value=s, **{"default": True, "description": "skin atual"} if global_static_selected == s else {}) for s in static_skin_list + add_skin_prefix(global_data["custom_skins_static"])]
 
         embed = disnake.Embed(
-            description="```ansi\n[31;1mModo Normal:[0m``` " + ", ".join(f"[`[{s}]`]({bot.player_skins[s].preview})" for s in skin_list) + "\n\n" 
-                        "```ansi\n[33;1mModo Fixo (Song-Request):[0m``` " + ", ".join(f"[`[{s}]`]({bot.player_static_skins[s].preview})" for s in static_skin_list) +
+            description="```ansi\n[31;1mModo Normal:[0m``` " + ", ".join(f"[`[{s}]`]({skin_previews[s]})" for s in skin_list) + "\n\n" 
+                        "```ansi\n[33;1mModo Fixo (Song-Request):[0m``` " + ", ".join(f"[`[{s}]`]({static_skin_previews[s]})" for s in static_skin_list) +
                         "\n\n`Nota: No modo global a skin será aplicada globalmente em todos os bots.`",
             colour=bot.get_color(guild.me)
         ).set_image("https://cdn.discordapp.com/attachments/554468640942981147/1082887587770937455/rainbow_bar2.gif")
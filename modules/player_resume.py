@@ -38,6 +38,9 @@ class PlayerSession(commands.Cog):
         if not hasattr(bot, 'players_resumed'):
             bot.players_resumed ={}
 
+        self.voice_slots = {}
+        self.resume_progress = {"total": 0, "done": 0, "started": 0.0}
+
         self.resume_task = bot.loop.create_task(self.resume_players())
 
     @commands.Cog.listener()
@@ -123,26 +126,30 @@ class PlayerSession(commands.Cog):
             tracks.append(player.current.info)
 
         for t in player.queue:
-            t.info["id"] = t.id
+            info = t.to_info()
+            info["id"] = t.id
             if t.playlist:
-                t.info["playlist"] = {"name": t.playlist_name, "url": t.playlist_url}
-            tracks.append(t.info)
+                info["playlist"] = {"name": t.playlist_name, "url": t.playlist_url}
+            tracks.append(info)
 
         for t in player.played:
-            t.info["id"] = t.id
+            info = t.to_info()
+            info["id"] = t.id
             if t.playlist:
-                t.info["playlist"] = {"name": t.playlist_name, "url": t.playlist_url}
-            played.append(t.info)
+                info["playlist"] = {"name": t.playlist_name, "url": t.playlist_url}
+            played.append(info)
 
         for t in player.queue_autoplay:
-            t.info["id"] = t.id
-            autoqueue.append(t.info)
+            info = t.to_info()
+            info["id"] = t.id
+            autoqueue.append(info)
 
         for t in player.failed_tracks:
-            t.info["id"] = t.id
+            info = t.to_info()
+            info["id"] = t.id
             if t.playlist:
-                t.info["playlist"] = {"name": t.playlist_name, "url": t.playlist_url}
-            failed_tracks.append(t.info)
+                info["playlist"] = {"name": t.playlist_name, "url": t.playlist_url}
+            failed_tracks.append(info)
 
         try:
             vc_id = player.guild.me.voice.channel.id
@@ -264,19 +271,80 @@ class PlayerSession(commands.Cog):
 
             hints = self.bot.config["EXTRA_HINTS"].split("||")
 
-            for data in data_list.values():
+            # carregar os dados dos servidores de uma só vez (no cache) ao invés de uma consulta por player.
+            try:
+                await self.bot.get_many_data(list(data_list), db_name=DBModel.guilds)
+            except Exception:
+                traceback.print_exc()
 
-                try:
-                    self.bot.players_resumed[data['_id']]
-                except KeyError:
-                    self.bot.players_resumed[data['_id']] = self.bot.loop.create_task(self.resume_player(data, hints=hints))
-                    await asyncio.sleep(1)
+            entries = [d for d in data_list.values() if d['_id'] not in self.bot.players_resumed]
+
+            # retomar primeiro os players com membros ouvindo no canal de voz.
+            entries.sort(key=lambda d: not self.has_listeners(d))
+
+            await self.resume_scheduler(entries, hints)
 
         except Exception:
-            print(f"{self.bot.user} - Falha ao retomar player {data['_id']}:\n{traceback.format_exc()}")
+            print(f"{self.bot.user} - Falha ao retomar players:\n{traceback.format_exc()}")
 
         self.bot.player_resumed = True
 
+    def has_listeners(self, data: dict):
+        voice_channel = self.bot.get_channel(data.get("voice_channel"))
+        try:
+            return any(m for m in voice_channel.members if not m.bot and not (m.voice.deaf or m.voice.self_deaf))
+        except AttributeError:
+            return False
+
+    async def resume_scheduler(self, entries: list, hints: list):
+
+        if not entries:
+            return
+
+        semaphore = asyncio.Semaphore(max(self.bot.config["PLAYER_RESUME_CONCURRENCY"], 1))
+
+        self.resume_progress = {"total": len(entries), "done": 0, "started": self.bot.loop.time()}
+
+        print(f"🔄 - {self.bot.user} - Retomando {len(entries)} player(s)...")
+
+        async def resume(data: dict):
+            async with semaphore:
+                try:
+                    await self.resume_player(data, hints=hints)
+                finally:
+                    self.update_resume_progress()
+
+        # os players aguardam na ordem de prioridade (o semaphore libera as vagas na ordem de espera).
+        tasks = []
+
+        for data in entries:
+            self.bot.players_resumed[data['_id']] = task = self.bot.loop.create_task(resume(data))
+            tasks.append(task)
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def update_resume_progress(self):
+
+        progress = self.resume_progress
+        progress["done"] += 1
+
+        if progress["done"] % 25 and progress["done"] != progress["total"]:
+            return
+
+        elapsed = self.bot.loop.time() - progress["started"]
+
+        print(f"🔄 - {self.bot.user} - Players retomados: {progress['done']}/{progress['total']} "
+              f"({progress['done'] / max(elapsed, 0.001):.1f} players/s)")
+
+    async def wait_voice_slot(self, guild: disnake.Guild):
+        # espaçar as atualizações de estado de voz enviadas em cada shard (evitando o ratelimit do gateway).
+        interval = self.bot.config["PLAYER_RESUME_VOICE_INTERVAL"] / 1000
+        now = self.bot.loop.time()
+        slot = max(now, self.voice_slots.get(guild.shard_id, 0))
+        self.voice_slots[guild.shard_id] = slot + interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
     async def update_player(
             self,
             player: LavalinkPlayer,
@@ -304,6 +372,7 @@ class PlayerSession(commands.Cog):
             "filters": player.filters,
         }
 
+        await self.wait_voice_slot(voice_channel.guild)
         await player.connect(voice_channel.id)
         await self.voice_check(voice_channel, position)
 
@@ -533,7 +602,7 @@ class PlayerSession(commands.Cog):
 
                 while True:
 
-                    node = self.bot.music.get_best_node()
+                    node = self.bot.music.get_best_node(guild_id=guild.id)
 
                     if not node:
                         try:
@@ -604,6 +673,7 @@ class PlayerSession(commands.Cog):
                     if player.filters:
                         await player.update_filters()
 
+                    await self.wait_voice_slot(guild)
                     await player.connect(voice_channel.id)
 
                     await self.voice_check(voice_channel)
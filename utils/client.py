@@ -12,15 +12,12 @@ import subprocess
 import traceback
 from configparser import ConfigParser
 from copy import deepcopy
-from importlib import import_module
 from subprocess import check_output
 from typing import Optional, Union, List, Dict
 
-import aiofiles
 import aiohttp
 import disnake
 import requests
-from aiohttp import ClientSession
 from async_timeout import timeout
 from cachetools import TTLCache
 from disnake.ext import commands
@@ -29,16 +26,22 @@ from user_agent import generate_user_agent
 
 import wavelink
 from config_loader import load_config
-from utils.db import MongoDatabase, LocalDatabase, get_prefix, DBModel, global_db_models
+from utils.db import MongoDatabase, SQLiteDatabase, get_prefix, DBModel, global_db_models, \
+    UDPCacheInvalidator, MongoChangeStreamInvalidator
+from utils.http_pool import HTTPClientRegistry
 from utils.music.audio_sources.deezer import DeezerClient
 from utils.music.audio_sources.spotify import SpotifyClient
 from utils.music.checks import check_pool_bots
+from utils.music.controller_edits import ControllerEditScheduler, ControllerUpdateScheduler
 from utils.music.errors import GenericError
 from utils.music.lastfm_tools import LastFM
 from utils.music.local_lavalink import run_lavalink
 from utils.music.models import music_mode, LavalinkPlayer, LavalinkPlaylist, LavalinkTrack, PartialTrack, \
     native_sources, CustomYTDL
 from utils.music.remote_lavalink_serverlist import get_lavalink_servers
+from utils.music.skin_loader import SkinLoader
+from utils.music.track_cache import PersistentTrackCache, SnapshotTTLCache
+from utils.music.track_encoder import decode_track
 from utils.others import CustomContext, token_regex, sort_dict_recursively
 from utils.owner_panel import PanelView
 from web_app import WSClient, start
@@ -75,15 +78,29 @@ class BotPool:
         self.user_prefix_cache = {}
         self.guild_prefix_cache = {}
         self.mongo_database: Optional[MongoDatabase] = None
-        self.local_database: Optional[LocalDatabase] = None
+        self.local_database: Optional[SQLiteDatabase] = None
         self.ws_client: Optional[WSClient] = None
         self.emoji_data = {}
         self.config = self.load_cfg()
-        self.playlist_cache = TTLCache(maxsize=self.config["PLAYLIST_CACHE_SIZE"], ttl=self.config["PLAYLIST_CACHE_TTL"])
-        self.partial_track_cache =  TTLCache(maxsize=1000, ttl=80400)
+        self.playlist_cache = SnapshotTTLCache(maxsize=self.config["PLAYLIST_CACHE_SIZE"], ttl=self.config["PLAYLIST_CACHE_TTL"],
+                                               path="./local_database/playlist_cache.snapshot")
+        self.partial_track_cache = PersistentTrackCache(
+            maxsize=self.config["PARTIAL_TRACK_CACHE_SIZE"],
+            max_entries=self.config["PARTIAL_TRACK_CACHE_MAX_ENTRIES"],
+            ttl=self.config["PARTIAL_TRACK_CACHE_TTL"]
+        )
         self.integration_cache = TTLCache(maxsize=500, ttl=7200)
+        self.loadtracks_cache = TTLCache(maxsize=self.config["LOADTRACKS_CACHE_SIZE"], ttl=self.config["LOADTRACKS_CACHE_TTL"])
+        self.loadtracks_inflight = {}
+        self.http = HTTPClientRegistry(
+            limit=self.config["HTTP_POOL_LIMIT"],
+            limit_per_host=self.config["HTTP_POOL_LIMIT_PER_HOST"],
+            dns_ttl=self.config["HTTP_POOL_DNS_TTL"],
+            keepalive_timeout=self.config["HTTP_POOL_KEEPALIVE_TIMEOUT"],
+            timeout=self.config["HTTP_POOL_TIMEOUT"],
+        )
         self.spotify: Optional[SpotifyClient] = None
-        self.deezer = DeezerClient(self.playlist_cache)
+        self.deezer = DeezerClient(self.playlist_cache, http=self.http)
         self.lavalink_instance: Optional[subprocess.Popen] = None
         self.commit = ""
         self.remote_git_url = ""
@@ -98,14 +115,14 @@ class BotPool:
         self.lavalink_connect_queue = {}
         self.last_fm: Optional[LastFM] = None
         self.lastfm_sessions = {}
-        self.player_skins = {}
-        self.player_static_skins = {}
+        self.player_skins: Union[SkinLoader, dict] = {}
+        self.player_static_skins: Union[SkinLoader, dict] = {}
         self.default_skin = self.config.get("DEFAULT_SKIN", "default")
         self.default_static_skin = self.config.get("DEFAULT_STATIC_SKIN", "default")
         self.default_controllerless_skin = self.config.get("DEFAULT_CONTROLLERLESS_SKIN", "default")
         self.default_idling_skin = self.config.get("DEFAULT_IDLING_SKIN", "default")
         self.cache_updater_task: Optional[asyncio.Task] = None
-        self.lyric_data_cache = TTLCache(maxsize=30000, ttl=600*10)
+        self.lyric_data_cache = SnapshotTTLCache(maxsize=30000, ttl=600*10, path="./local_database/lyric_cache.snapshot")
         self.ytdl = CustomYTDL(
             {
                 'format': 'webm[abr>0]/bestaudio/best',
@@ -145,32 +162,111 @@ class BotPool:
 
     def load_cache(self):
 
-        if os.path.exists("./local_database/playlist_cache.pkl"):
-            with open("./local_database/playlist_cache.pkl", 'rb') as f:
+        if not os.path.isdir("./local_database"):
+            os.makedirs("./local_database")
+
+        for cache, old_file in (
+            (self.playlist_cache, "./local_database/playlist_cache.pkl"),
+            (self.lyric_data_cache, "./local_database/.lyric_cache_data"),
+        ):
+            try:
+                cache.load_snapshot()
+            except Exception:
+                traceback.print_exc()
+
+            if os.path.exists(old_file):
+                # migrar o arquivo antigo (pickle completo) e gravar no novo formato antes de removê-lo.
+                with open(old_file, 'rb') as f:
+                    try:
+                        cache.update(pickle.load(f))
+                    except EOFError:
+                        pass
                 try:
-                    self.playlist_cache.update(pickle.load(f))
-                except EOFError:
-                    pass
+                    cache.rewrite_snapshot()
+                except Exception:
+                    traceback.print_exc()
+                else:
+                    os.remove(old_file)
+
+        self.partial_track_cache.load()
 
         if os.path.exists("./local_database/partial_track_cache.pkl"):
+            # migrar o cache antigo (pickle) para o cache persistente.
             with open("./local_database/partial_track_cache.pkl", 'rb') as f:
                 try:
                     self.partial_track_cache.update(pickle.load(f))
                 except EOFError:
                     pass
+            try:
+                self.partial_track_cache.flush_now()
+            except Exception:
+                traceback.print_exc()
+            else:
+                os.remove("./local_database/partial_track_cache.pkl")
 
-        if os.path.exists("./local_database/.lyric_cache_data"):
-            with open("./local_database/.lyric_cache_data", 'rb') as f:
-                try:
-                    self.lyric_data_cache.update(pickle.load(f))
-                except EOFError:
-                    pass
+    async def save_cache(self):
+
+        for cache in (self.playlist_cache, self.lyric_data_cache):
+            try:
+                await cache.save_snapshot()
+            except Exception:
+                traceback.print_exc()
+
+        await self.partial_track_cache.flush()
 
     async def cache_updater(self):
         while True:
             await asyncio.sleep(300)
-            async with aiofiles.open("./local_database/playlist_cache.pkl", 'wb') as f:
-                await f.write(pickle.dumps(self.playlist_cache))
+            await self.save_cache()
+
+    async def start_cache_invalidation(self):
+
+        mode = self.config["DBCACHE_INVALIDATION"].lower()
+
+        if not mode:
+            return
+
+        self.database.invalidation_listeners.append(self.invalidate_prefix_cache)
+
+        try:
+            if mode == "mongo":
+                if not self.mongo_database:
+                    print("⚠️ - DBCACHE_INVALIDATION=mongo requer o MONGO configurado.")
+                    return
+                invalidator = MongoChangeStreamInvalidator(self.mongo_database._connect)
+            elif mode == "udp":
+                invalidator = UDPCacheInvalidator(
+                    bind=self.config["DBCACHE_INVALIDATION_BIND"],
+                    peers=self.config["DBCACHE_INVALIDATION_PEERS"].split()
+                )
+            else:
+                print(f"⚠️ - DBCACHE_INVALIDATION inválido: {mode} (use: mongo ou udp)")
+                return
+
+            await self.database.start_cache_invalidation(invalidator)
+        except Exception:
+            traceback.print_exc()
+        else:
+            print(f"🔄 - Invalidação de cache da database entre processos ativada: {mode}")
+
+    def invalidate_prefix_cache(self, keys: list):
+
+        for key in keys:
+
+            collection, db_name, id_ = key.split(":", 2)
+
+            if collection != "global":
+                continue
+
+            try:
+                id_ = int(id_)
+            except ValueError:
+                continue
+
+            if db_name == DBModel.users:
+                self.user_prefix_cache.pop(id_, None)
+            elif db_name == DBModel.guilds:
+                self.guild_prefix_cache.pop(id_, None)
 
     async def connect_lavalink_queue_task(self, identifier: str):
 
@@ -201,7 +297,7 @@ class BotPool:
         return list(allbots)
 
     @property
-    def database(self) -> Union[LocalDatabase, MongoDatabase]:
+    def database(self) -> Union[SQLiteDatabase, MongoDatabase]:
 
         if self.config["MONGO"]:
             return self.mongo_database
@@ -345,7 +441,7 @@ class BotPool:
             else:
                 await asyncio.sleep(backoff)
                 try:
-                    async with aiohttp.ClientSession() as session:
+                    async with self.http.borrow("lavalink") as session:
                         async with session.get(f"{data['rest_uri']}/v4/info", timeout=45,
                                                         headers=headers) as r:
                             if r.status == 200:
@@ -380,13 +476,13 @@ class BotPool:
                 if tokens:=mongo_data.get("refresh_tokens"):
                     for v in tokens.values():
                         try:
-                            async with ClientSession() as session:
-                                resp = await session.post(
+                            async with self.http.borrow("lavalink") as session:
+                                async with session.post(
                                     f"{data['rest_uri']}/youtube", headers=headers,
                                     json={"refreshToken": v}
-                                )
-                                if resp.status != 204:
-                                    resp.raise_for_status()
+                                ) as resp:
+                                    if resp.status != 204:
+                                        resp.raise_for_status()
                         except Exception as e:
                             print(f"🌋 - Falha ao aplicar o Youtube refreshToken no servidor lavalink: {data['identifier']} - {repr(e)}")
                             break
@@ -444,6 +540,14 @@ class BotPool:
                     playlists[playlist["url"]] = playlist_cls
                     playlist = playlist_cls
 
+            if "sourceName" not in info and info.get("id"):
+                # entrada salva apenas com a track codificada: obter as informações sem consultar o servidor.
+                try:
+                    info = {**decode_track(info["id"]), **info}
+                except Exception:
+                    traceback.print_exc()
+                    continue
+
             if info["sourceName"] not in native_sources:
                 try:
                     del info["id"]
@@ -483,51 +587,25 @@ class BotPool:
 
         return config
 
-    def load_skins(self):
+    def load_skins(self) -> List[str]:
 
-        for skin in os.listdir("./utils/music/skins/normal_player"):
-            if not skin.endswith(".py"):
-                continue
-
-            skin = skin[:-3]
-
-            if skin in self.config["IGNORE_SKINS"].split() and skin != "default":
-                print(f"Skin {skin}.py ignorada")
-                continue
-
-            try:
-                skin_file = import_module(f"utils.music.skins.normal_player.{skin}")
-                if not hasattr(skin_file, "load"):
-                    print(f"Skin ignorada: {skin}.py | Função load() não configurada/encontrada...")
-                    continue
-                self.player_skins[skin] = skin_file.load()
-            except Exception:
-                print(f"Falha ao carregar skin [normal_player]: {traceback.format_exc()}")
+        if not isinstance(self.player_skins, SkinLoader):
+            # as skins são apenas listadas aqui e importadas no primeiro uso.
+            self.player_skins = SkinLoader("normal_player", self.config["IGNORE_SKINS"].split())
+            self.player_static_skins = SkinLoader("static_player", self.config["IGNORE_STATIC_SKINS"].split())
+            changed = []
+        else:
+            changed = [f"normal_player/{s}" for s in self.player_skins.reload()] + \
+                      [f"static_player/{s}" for s in self.player_static_skins.reload()]
 
         if self.default_skin not in self.player_skins:
             self.default_skin = "default"
 
-        for skin in os.listdir("./utils/music/skins/static_player"):
-            if not skin.endswith(".py"):
-                continue
-
-            skin = skin[:-3]
-
-            if skin in self.config["IGNORE_STATIC_SKINS"].split() and skin != "default":
-                print(f"Skin {skin}.py ignorada")
-                continue
-
-            try:
-                skin_file = import_module(f"utils.music.skins.static_player.{skin}")
-                if not hasattr(skin_file, "load"):
-                    print(f"Skin ignorada: {skin}.py | Função load() não configurada/encontrada...")
-                    continue
-                self.player_static_skins[skin] = skin_file.load()
-            except Exception:
-                print(f"Falha ao carregar skin [static_player]: {traceback.format_exc()}")
         if self.default_static_skin not in self.player_static_skins:
             self.default_static_skin = "default"
 
+        return changed
+
     def check_skin(self, skin: str):
 
         if skin is None:
@@ -641,13 +719,18 @@ class BotPool:
         if mongo_key:
             self.mongo_database = MongoDatabase(mongo_key, timeout=self.config["MONGO_TIMEOUT"],
                                                 cache_maxsize=self.config["DBCACHE_SIZE"],
-                                                cache_ttl=self.config["DBCACHE_TTL"])
+                                                cache_ttl=self.config["DBCACHE_TTL"],
+                                                write_behind=self.config["MONGO_WRITE_BEHIND"],
+                                                write_behind_interval=self.config["MONGO_WRITE_BEHIND_INTERVAL"],
+                                                write_behind_batch_size=self.config["MONGO_WRITE_BEHIND_BATCH_SIZE"],
+                                                write_behind_max_pending=self.config["MONGO_WRITE_BEHIND_MAX_PENDING"],
+                                                write_behind_max_retries=self.config["MONGO_WRITE_BEHIND_MAX_RETRIES"])
             print("🍃 - Database em uso: MongoDB")
         else:
-            print("🎲 - Database em uso: TinyMongo | Nota: Os arquivos da database serão salvos localmente na pasta: local_database")
+            print("🎲 - Database em uso: SQLite | Nota: Os arquivos da database serão salvos localmente na pasta: local_database")
 
-        self.local_database = LocalDatabase(cache_maxsize=self.config["DBCACHE_SIZE"],
-                                            cache_ttl=self.config["DBCACHE_TTL"])
+        self.local_database = SQLiteDatabase(cache_maxsize=self.config["DBCACHE_SIZE"],
+                                             cache_ttl=self.config["DBCACHE_TTL"])
 
         os.environ.update(
             {
@@ -681,7 +764,8 @@ class BotPool:
             spotify_client = SpotifyClient(
                 client_id=self.config['SPOTIFY_CLIENT_ID'],
                 client_secret=self.config['SPOTIFY_CLIENT_SECRET'],
-                playlist_extra_page_limit=self.config['SPOTIFY_PLAYLIST_EXTRA_PAGE_LIMIT']
+                playlist_extra_page_limit=self.config['SPOTIFY_PLAYLIST_EXTRA_PAGE_LIMIT'],
+                http=self.http
             )
         except Exception as e:
             print(f"⚠️ - Suporte interno ao spotify desativado: {repr(e)}")
@@ -690,7 +774,7 @@ class BotPool:
         self.spotify = spotify_client
 
         if self.config["LASTFM_KEY"] and self.config["LASTFM_SECRET"]:
-            self.last_fm = LastFM(api_key=self.config["LASTFM_KEY"], api_secret=self.config["LASTFM_SECRET"])
+            self.last_fm = LastFM(api_key=self.config["LASTFM_KEY"], api_secret=self.config["LASTFM_SECRET"], http=self.http)
 
         all_tokens = {}
 
@@ -909,6 +993,8 @@ class BotPool:
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
 
+        self.loop.create_task(self.start_cache_invalidation())
+
         for k, v in all_tokens.items():
             load_bot(k, v, load_modules_log=load_modules_log)
             load_modules_log = False
@@ -1006,6 +1092,11 @@ class BotCore(commands.AutoShardedBot):
         self.number = kwargs.pop("number", 0)
         super().__init__(*args, **kwargs)
         self.music: wavelink.Client = music_mode(self)
+        self.controller_edits = ControllerEditScheduler(
+            window=self.config["CONTROLLER_EDIT_WINDOW"] / 1000,
+            rate=self.config["CONTROLLER_EDIT_RATE"]
+        )
+        self.controller_updater = ControllerUpdateScheduler(self)
         self.interaction_id: Optional[int] = None
         self.wavelink_node_reconnect_tasks = {}
 
@@ -1019,6 +1110,35 @@ class BotCore(commands.AutoShardedBot):
             except ValueError:
                 print(f"Owner_ID inválido: {i}")
 
+    async def close(self):
+
+        # databases (e invalidação de cache), cache e sessões http são compartilhados entre os bots: finalizar apenas
+        # quando o último bot for desligado.
+        if all(b.is_closed() for b in self.pool.get_all_bots() if b is not self):
+
+            for database in {self.pool.database, self.pool.local_database}:
+                try:
+                    await database.close()
+                except Exception:
+                    traceback.print_exc()
+
+            try:
+                await self.pool.save_cache()
+            except Exception:
+                traceback.print_exc()
+
+            try:
+                self.pool.partial_track_cache.close()
+            except Exception:
+                traceback.print_exc()
+
+            try:
+                await self.pool.http.close()
+            except Exception:
+                traceback.print_exc()
+
+        await super().close()
+
     async def edit_voice_channel_status(
             self, status: Optional[str], *, channel_id: int, reason: Optional[str] = None
     ):
@@ -1064,6 +1184,11 @@ class BotCore(commands.AutoShardedBot):
             id_=id_, db_name=db_name, collection=str(self.user.id)
         )
 
+    async def get_many_data(self, ids: list, *, db_name: Union[DBModel.guilds, DBModel.users]):
+        return await self.pool.database.get_many(
+            ids=ids, db_name=db_name, collection=str(self.user.id)
+        )
+
     async def update_data(self, id_, data: dict, *, db_name: Union[DBModel.guilds, DBModel.users]):
         return await self.pool.database.update_data(
             id_=id_, data=data, db_name=db_name, collection=str(self.user.id)
@@ -1077,6 +1202,12 @@ class BotCore(commands.AutoShardedBot):
 
         return data
 
+    async def get_many_global_data(self, ids: list, *, db_name: Union[DBModel.guilds, DBModel.users]):
+
+        return await self.pool.database.get_many(
+            ids=ids, db_name=db_name, collection="global", default_model=global_db_models
+        )
+
     async def update_global_data(self, id_, data: dict, *, db_name: Union[DBModel.guilds, DBModel.users]):
 
         return await self.pool.database.update_data(
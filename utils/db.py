@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 import json
 import os
@@ -8,16 +9,16 @@ import shutil
 import traceback
 from copy import deepcopy
 from datetime import datetime
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, Optional
 from urllib.parse import urlparse, parse_qs, urlunparse, urlencode
 
+import aiosqlite
 import disnake
 from cachetools import TTLCache
 from disnake.ext import commands
 from motor.motor_asyncio import AsyncIOMotorClient
-from tinydb_serialization import Serializer, SerializationMiddleware
-from tinymongo import TinyMongoClient
-from tinymongo.serializers import DateTimeSerializer
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
 if TYPE_CHECKING:
     from utils.client import BotCore
@@ -120,40 +121,333 @@ async def get_prefix(bot: BotCore, message: disnake.Message):
     return guild_prefix
 
 
+class DefaultDocument(dict):
+    """Cópia rasa de um modelo padrão da database.
+
+    Os valores mutáveis (dict/list) continuam compartilhados com o modelo e só são
+    copiados (deepcopy) no primeiro acesso a cada chave, evitando o deepcopy completo
+    do modelo para ids que nunca foram salvos na database.
+    """
+
+    __slots__ = ("_shared",)
+
+    def __init__(self, model: dict):
+        super().__init__(model)
+        self._shared = {k for k, v in model.items() if isinstance(v, (dict, list))}
+
+    def _materialize(self, key):
+        if key in self._shared:
+            self._shared.discard(key)
+            dict.__setitem__(self, key, deepcopy(dict.__getitem__(self, key)))
+
+    def _materialize_all(self):
+        for key in list(self._shared):
+            self._materialize(key)
+
+    def __getitem__(self, key):
+        self._materialize(key)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        self._shared.discard(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._shared.discard(key)
+        dict.__delitem__(self, key)
+
+    def __iter__(self):
+        # evita que dict(doc) / {**doc} copie as referências compartilhadas sem passar pelo __getitem__.
+        return iter(dict.keys(self))
+
+    def _raw(self):
+        return {k: dict.__getitem__(self, k) for k in dict.keys(self)}
+
+    def __deepcopy__(self, memo):
+        return deepcopy(self._raw(), memo)
+
+    def __copy__(self):
+        # sem isso o copy.copy usaria o __reduce_ex__, mantendo os valores compartilhados com o modelo.
+        self._materialize_all()
+        return dict.copy(self)
+
+    def __reduce_ex__(self, protocol):
+        return dict, (self._raw(),)
+
+    def get(self, key, default=None):
+        self._materialize(key)
+        return dict.get(self, key, default)
+
+    def setdefault(self, key, default=None):
+        self._materialize(key)
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *args):
+        self._materialize(key)
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self._materialize_all()
+        return dict.popitem(self)
+
+    def values(self):
+        self._materialize_all()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize_all()
+        return dict.items(self)
+
+    def copy(self):
+        self._materialize_all()
+        return dict.copy(self)
+
+
 class BaseDB:
 
     def __init__(self, cache_maxsize: int = 1000, cache_ttl=300):
         self.cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        # ids consultados que não existem na database (evita novas consultas até serem salvos).
+        self.missing_cache = TTLCache(maxsize=cache_maxsize * 5, ttl=cache_ttl)
+        self.inflight_loads = {}
+        self.suppressed_loads = 0
+        # geração dos documentos sendo carregados: [geração, consultas em andamento] (alterada ao salvar/invalidar/
+        # excluir o documento enquanto a consulta aguarda a database).
+        self.load_generations = {}
+        self.invalidator: Optional[CacheInvalidator] = None
+        self.invalidation_listeners = []
+
+    async def start_cache_invalidation(self, invalidator: CacheInvalidator):
+        self.invalidator = invalidator
+        await invalidator.start(self)
+
+    def invalidate(self, keys: list):
+
+        for key in keys:
+            self.bump_generation(key)
+            self.cache.pop(key, None)
+            self.missing_cache.pop(key, None)
+
+        for listener in self.invalidation_listeners:
+            try:
+                listener(keys)
+            except Exception:
+                traceback.print_exc()
+
+    def start_load(self, key: str) -> int:
+        state = self.load_generations.setdefault(key, [0, 0])
+        state[1] += 1
+        return state[0]
+
+    def finish_load(self, key: str, generation: int) -> bool:
+        """Retorna True caso o documento tenha sido alterado durante a consulta (o resultado não deve ir pro cache)."""
+
+        state = self.load_generations[key]
+        state[1] -= 1
+
+        if not state[1]:
+            del self.load_generations[key]
+
+        return state[0] != generation or key in self.cache
+
+    def bump_generation(self, key: str):
+        try:
+            self.load_generations[key][0] += 1
+        except KeyError:
+            pass
+
+    def current_value(self, key: str, fallback: dict):
+        # versão mais recente do documento (salva durante a consulta) ou o resultado da consulta sem salvar no cache.
+        if (data := self.cache.get(key)) is not None:
+            return data
+        return fallback
+
+    def notify_peers(self, key: str):
+        if self.invalidator:
+            self.invalidator.publish([key])
+
+    async def single_flight(self, key: str, load):
+        # consultas simultâneas do mesmo documento aguardam a mesma consulta em andamento.
+
+        try:
+            future = self.inflight_loads[key]
+        except KeyError:
+            pass
+        else:
+            self.suppressed_loads += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self.inflight_loads[key] = future
+
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self.inflight_loads.get(key) is future:
+                del self.inflight_loads[key]
 
     def get_default(self, collection: str, db_name: Union[DBModel.guilds, DBModel.users]):
         if collection == "global":
-            return deepcopy(global_db_models[db_name])
-        return deepcopy(db_models[db_name])
+            return DefaultDocument(global_db_models[db_name])
+        return DefaultDocument(db_models[db_name])
+
+    async def flush_pending_writes(self):
+        pass
+
+    async def close(self):
+        if self.invalidator:
+            await self.invalidator.close()
+
+
+class CacheInvalidator:
+    """Canal usado para remover do cache de outros processos os documentos alterados."""
+
+    def __init__(self):
+        self.db: Optional[BaseDB] = None
+
+    async def start(self, db: BaseDB):
+        self.db = db
+
+    def publish(self, keys: list):
+        pass
+
+    async def close(self):
+        pass
+
+
+class _InvalidationProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, invalidator: UDPCacheInvalidator):
+        self.invalidator = invalidator
+
+    def datagram_received(self, data: bytes, addr):
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            return
+
+        if payload.get("origin") == self.invalidator.origin:
+            return
+
+        self.invalidator.db.invalidate(payload.get("keys") or [])
+
+
+class UDPCacheInvalidator(CacheInvalidator):
+    """Envia as chaves alteradas via udp para os outros processos (ex: 127.0.0.1:9701)."""
+
+    def __init__(self, bind: str, peers: list):
+        super().__init__()
+        self.bind = self.parse_address(bind)
+        self.peers = [self.parse_address(p) for p in peers]
+        self.origin = f"{os.getpid()}:{id(self)}"
+        self.transport: Optional[asyncio.DatagramTransport] = None
+
+    @staticmethod
+    def parse_address(address: str):
+        host, port = address.strip().rsplit(":", 1)
+        return host, int(port)
+
+    async def start(self, db: BaseDB):
+        await super().start(db)
+        self.transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: _InvalidationProtocol(self), local_addr=self.bind
+        )
+
+    def publish(self, keys: list):
+
+        if not self.transport:
+            return
+
+        payload = json.dumps({"origin": self.origin, "keys": keys}).encode()
+
+        for peer in self.peers:
+            self.transport.sendto(payload, peer)
+
+    async def close(self):
+        if self.transport:
+            self.transport.close()
+            self.transport = None
 
 
-class DatetimeSerializer(Serializer):
-    OBJ_CLASS = datetime
+class MongoChangeStreamInvalidator(CacheInvalidator):
+    """Usa o change stream do mongodb (requer replica set/atlas) para detectar alterações de outros processos.
 
-    def __init__(self, format='%Y-%m-%dT%H:%M:%S', *args, **kwargs):
-        super(DatetimeSerializer, self).__init__(*args, **kwargs)
-        self._format = format
+    Nota: as alterações feitas pelo próprio processo também são recebidas (o documento será consultado novamente).
+    """
 
-    def encode(self, obj):
-        return obj.strftime(self._format)
+    def __init__(self, client: AsyncIOMotorClient):
+        super().__init__()
+        self.client = client
+        self.task: Optional[asyncio.Task] = None
 
-    def decode(self, s):
-        return datetime.strptime(s, self._format)
+    async def start(self, db: BaseDB):
+        await super().start(db)
+        self.task = asyncio.create_task(self.watch())
 
-class CustomTinyMongoClient(TinyMongoClient):
+    async def watch(self):
 
-    @property
-    def _storage(self):
-        serialization = SerializationMiddleware()
-        serialization.register_serializer(DateTimeSerializer(), 'TinyDate')
-        return serialization
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}]
 
+        while True:
+            try:
+                async with self.client.watch(pipeline) as stream:
+                    async for change in stream:
+                        ns = change["ns"]
+                        self.db.invalidate([f"{ns['db']}:{ns['coll']}:{change['documentKey']['_id']}"])
+            except asyncio.CancelledError:
+                return
+            except Exception as e:
+                print(f"⚠️ - Falha no change stream do mongodb (invalidação de cache): {repr(e)}")
+                await asyncio.sleep(60)
+
+    async def close(self):
+        try:
+            self.task.cancel()
+        except AttributeError:
+            pass
+
+
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return {"$date": obj.isoformat()}
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _json_object_hook(obj: dict):
+    if len(obj) == 1 and "$date" in obj:
+        return datetime.fromisoformat(obj["$date"])
+    return obj
+
+
+def _decode_tinydate(value):
+    # datas salvas pelo antigo TinyMongo (tinydb_serialization): "{TinyDate}:2024-01-01T00:00:00"
+    if isinstance(value, str) and value.startswith("{TinyDate}:"):
+        try:
+            return datetime.strptime(value[11:], '%Y-%m-%dT%H:%M:%S')
+        except ValueError:
+            return value
+    if isinstance(value, dict):
+        return {k: _decode_tinydate(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode_tinydate(v) for v in value]
+    return value
 
-class LocalDatabase(BaseDB):
+
+class SQLiteDatabase(BaseDB):
 
     def __init__(self, dir_="./local_database", cache_maxsize=1000, cache_ttl=300):
         super().__init__(cache_maxsize=cache_maxsize, cache_ttl=cache_ttl)
@@ -161,7 +455,99 @@ class LocalDatabase(BaseDB):
         if not os.path.isdir(dir_):
             os.makedirs(dir_)
 
-        self._connect = CustomTinyMongoClient(dir_)
+        self.dir = dir_
+        self.path = os.path.join(dir_, "database.sqlite")
+        self._connect: Optional[aiosqlite.Connection] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def connection(self) -> aiosqlite.Connection:
+
+        if self._connect:
+            return self._connect
+
+        if not self._connect_lock:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+
+            if self._connect:
+                return self._connect
+
+            connect = await aiosqlite.connect(self.path)
+            await connect.execute("PRAGMA journal_mode=WAL")
+            await connect.execute("PRAGMA synchronous=NORMAL")
+            await connect.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "collection TEXT NOT NULL, db_name TEXT NOT NULL, id TEXT NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (collection, db_name, id)) WITHOUT ROWID"
+            )
+            await connect.commit()
+
+            try:
+                await self.migrate_tinymongo(connect)
+            except Exception:
+                traceback.print_exc()
+
+            self._connect = connect
+
+        return self._connect
+
+    async def migrate_tinymongo(self, connect: aiosqlite.Connection):
+
+        files = [f for f in os.listdir(self.dir) if f.endswith(".json") and os.path.isfile(os.path.join(self.dir, f))]
+
+        if not files:
+            return
+
+        loop = asyncio.get_running_loop()
+
+        backup_dir = os.path.join(self.dir, "tinymongo_backup")
+
+        for f in files:
+
+            path = os.path.join(self.dir, f)
+
+            def load_file():
+                with open(path, encoding="utf-8") as fp:
+                    return json.load(fp)
+
+            try:
+                file_data = await loop.run_in_executor(None, load_file)
+            except Exception:
+                traceback.print_exc()
+                continue
+
+            if not isinstance(file_data, dict) or \
+                    not all(isinstance(t, dict) and all(isinstance(d, dict) for d in t.values()) for t in file_data.values()):
+                continue
+
+            rows = []
+
+            for db_name, table in file_data.items():
+                for doc in table.values():
+                    if not (id_ := doc.get("_id")):
+                        continue
+                    doc = _decode_tinydate(doc)
+                    rows.append((f[:-5], db_name, str(id_), json.dumps(doc, default=_json_default)))
+
+            await connect.executemany("INSERT OR IGNORE INTO documents VALUES (?, ?, ?, ?)", rows)
+            await connect.commit()
+
+            if not os.path.isdir(backup_dir):
+                os.makedirs(backup_dir)
+
+            shutil.move(path, os.path.join(backup_dir, f))
+
+            print(f"🎲 - Database local: {len(rows)} registro(s) migrado(s) do arquivo {f} (TinyMongo -> SQLite).")
+
+    def _check_version(self, data: dict, db_name: str, default_model: dict):
+
+        if data["ver"] == default_model[db_name]["ver"]:
+            return data, False
+
+        data = update_values(DefaultDocument(default_model[db_name]), data)
+        data["ver"] = default_model[db_name]["ver"]
+        return data, True
 
     async def get_data(self, id_: int, *, db_name: Union[DBModel.guilds, DBModel.users],
                        collection: str, default_model: dict = None):
@@ -171,60 +557,225 @@ class LocalDatabase(BaseDB):
 
         id_ = str(id_)
 
-        if (cached_result := self.cache.get(f"{collection}:{db_name}:{id_}")) is not None:
+        key = f"{collection}:{db_name}:{id_}"
+
+        if (cached_result := self.cache.get(key)) is not None:
             return cached_result
 
-        data = self._connect[collection][db_name].find_one({"_id": id_})
+        if key in self.missing_cache:
+            data = DefaultDocument(default_model[db_name])
+            data["_id"] = id_
+            return data
 
-        if not data:
-            data = deepcopy(default_model[db_name])
-            data["_id"] = str(id_)
-            self._connect[collection][db_name].insert_one(data)
+        return await self.single_flight(
+            key, lambda: self.load_data(id_, db_name=db_name, collection=collection, default_model=default_model)
+        )
 
-        elif data["ver"] != default_model[db_name]["ver"]:
-            data = update_values(deepcopy(default_model[db_name]), data)
-            data["ver"] = default_model[db_name]["ver"]
+    async def load_data(self, id_: str, *, db_name: str, collection: str, default_model: dict):
+
+        key = f"{collection}:{db_name}:{id_}"
 
+        generation = self.start_load(key)
+
+        try:
+            connect = await self.connection()
+
+            async with connect.execute(
+                    "SELECT data FROM documents WHERE collection = ? AND db_name = ? AND id = ?", (collection, db_name, id_)
+            ) as cursor:
+                row = await cursor.fetchone()
+        finally:
+            changed = self.finish_load(key, generation)
+
+        if not row:
+            data = DefaultDocument(default_model[db_name])
+            data["_id"] = id_
+            if changed:
+                return self.current_value(key, data)
+            self.missing_cache[key] = True
+            return data
+
+        data, outdated = self._check_version(json.loads(row[0], object_hook=_json_object_hook), db_name, default_model)
+
+        if changed:
+            return self.current_value(key, data)
+
+        if outdated:
             await self.update_data(id_, data, db_name=db_name, collection=collection)
+        else:
+            self.cache[key] = data
 
         return data
 
+    async def get_many(self, ids: list, *, db_name: Union[DBModel.guilds, DBModel.users],
+                       collection: str, default_model: dict = None) -> dict:
+
+        if not default_model:
+            default_model = db_models
+
+        results = {}
+        missing = []
+
+        for id_ in ids:
+
+            id_ = str(id_)
+
+            key = f"{collection}:{db_name}:{id_}"
+
+            if (cached_result := self.cache.get(key)) is not None:
+                results[id_] = cached_result
+            elif key in self.missing_cache:
+                results[id_] = DefaultDocument(default_model[db_name])
+                results[id_]["_id"] = id_
+            elif id_ not in missing:
+                missing.append(id_)
+
+        if not missing:
+            return results
+
+        connect = await self.connection()
+
+        changed = set()
+
+        # limite de parâmetros por consulta do sqlite.
+        for i in range(0, len(missing), 500):
+
+            chunk = missing[i:i + 500]
+
+            generations = {id_: self.start_load(f"{collection}:{db_name}:{id_}") for id_ in chunk}
+
+            try:
+                async with connect.execute(
+                    f"SELECT id, data FROM documents WHERE collection = ? AND db_name = ? AND id IN ({','.join('?' * len(chunk))})",
+                    (collection, db_name, *chunk)
+                ) as cursor:
+                    rows = await cursor.fetchall()
+            finally:
+                changed.update(id_ for id_, g in generations.items() if self.finish_load(f"{collection}:{db_name}:{id_}", g))
+
+            for id_, data in rows:
+
+                data, outdated = self._check_version(json.loads(data, object_hook=_json_object_hook), db_name, default_model)
+
+                if id_ in changed:
+                    results[id_] = self.current_value(f"{collection}:{db_name}:{id_}", data)
+                    continue
+
+                if outdated:
+                    await self.update_data(id_, data, db_name=db_name, collection=collection)
+                else:
+                    self.cache[f"{collection}:{db_name}:{id_}"] = data
+
+                results[id_] = data
+
+        for id_ in missing:
+            if id_ not in results:
+                key = f"{collection}:{db_name}:{id_}"
+                data = DefaultDocument(default_model[db_name])
+                data["_id"] = id_
+                if id_ in changed:
+                    results[id_] = self.current_value(key, data)
+                    continue
+                self.missing_cache[key] = True
+                results[id_] = data
+
+        return results
+
     async def update_data(self, id_, data: dict, *, db_name: Union[DBModel.guilds, DBModel.users],
                           collection: str, default_model: dict = None):
 
         id_ = str(id_)
         data["_id"] = id_
 
+        self.bump_generation(f"{collection}:{db_name}:{id_}")
+
+        connect = await self.connection()
+
         try:
-            if not self._connect[collection][db_name].update_one({'_id': id_}, {'$set': data}).raw_result:
-                self._connect[collection][db_name].insert_one(data)
+            await connect.execute(
+                "INSERT INTO documents VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (collection, db_name, id) DO UPDATE SET data = excluded.data",
+                (collection, db_name, id_, json.dumps(data, default=_json_default))
+            )
+            await connect.commit()
         except:
             traceback.print_exc()
 
-        self.cache[f"{collection}:{db_name}:{id_}"] = data
+        key = f"{collection}:{db_name}:{id_}"
+        self.cache[key] = data
+        self.missing_cache.pop(key, None)
+        self.notify_peers(key)
 
         return data
 
     async def query_data(self, db_name: str, collection: str, filter: dict = None, limit=500) -> list:
-        return self._connect[collection][db_name].find(filter or {})
+
+        connect = await self.connection()
+
+        async with connect.execute(
+                "SELECT data FROM documents WHERE collection = ? AND db_name = ?", (collection, db_name)
+        ) as cursor:
+            rows = await cursor.fetchall()
+
+        results = [json.loads(r[0], object_hook=_json_object_hook) for r in rows]
+
+        if filter:
+            results = [d for d in results if all(d.get(k) == v for k, v in filter.items())]
+
+        return results
 
     async def delete_data(self, id_, db_name: str, collection: str):
-        try:
-            self._connect[collection][db_name].delete_one({'_id': str(id_)})
-        except TypeError:
-            return
+
+        self.bump_generation(f"{collection}:{db_name}:{id_}")
+
+        connect = await self.connection()
+
+        await connect.execute(
+            "DELETE FROM documents WHERE collection = ? AND db_name = ? AND id = ?", (collection, db_name, str(id_))
+        )
+        await connect.commit()
 
         try:
             self.cache.pop(f"{collection}:{db_name}:{id_}")
         except KeyError:
             pass
 
+        self.missing_cache[f"{collection}:{db_name}:{id_}"] = True
+        self.notify_peers(f"{collection}:{db_name}:{id_}")
+
+    async def close(self):
+
+        await super().close()
+
+        if self._connect:
+            await self._connect.close()
+            self._connect = None
+
 
 class MongoDatabase(BaseDB):
 
-    def __init__(self, token: str, timeout=30, cache_maxsize=1000, cache_ttl=300):
+    def __init__(self, token: str, timeout=30, cache_maxsize=1000, cache_ttl=300, write_behind=False,
+                 write_behind_interval=5, write_behind_batch_size=500, write_behind_max_pending=5000,
+                 write_behind_max_retries=5):
         super().__init__(cache_maxsize=cache_maxsize, cache_ttl=cache_ttl)
 
+        # write-behind: as alterações ficam pendentes na memória (agrupadas por collection/db_name/_id)
+        # e são enviadas em lote via bulk_write no intervalo configurado ou ao atingir o limite do lote.
+        self.write_behind = write_behind
+        self.write_behind_interval = write_behind_interval
+        self.write_behind_batch_size = write_behind_batch_size
+        self.write_behind_max_pending = max(write_behind_max_pending, write_behind_batch_size)
+        # documentos recusados pelo mongodb (ex: tamanho excedido ou chaves inválidas) são descartados após essa
+        # quantidade de tentativas (falhas de conexão não contam).
+        self.write_behind_max_retries = max(write_behind_max_retries, 1)
+        self.pending_writes = {}
+        self.inflight_writes = {}
+        self.write_attempts = {}
+        self.write_stats = {"coalesced": 0, "flushed": 0, "failed": 0, "discarded": 0}
+        self.write_behind_task: Optional[asyncio.Task] = None
+        self.write_behind_event: Optional[asyncio.Event] = None
+        self.flush_lock: Optional[asyncio.Lock] = None
+
         fix_ssl = os.environ.get("MONGO_SSL_FIX") or os.environ.get("REPL_SLUG")
 
         if fix_ssl:
@@ -279,43 +830,309 @@ class MongoDatabase(BaseDB):
 
         id_ = str(id_)
 
-        if (cached_result := self.cache.get(f"{collection}:{db_name}:{id_}")) is not None:
+        key = f"{collection}:{db_name}:{id_}"
+
+        if (cached_result := self.cache.get(key)) is not None:
             return cached_result
 
-        data = await self._connect[collection][db_name].find_one({"_id": id_})
+        if key in self.missing_cache:
+            return DefaultDocument(default_model[db_name])
+
+        try:
+            return (self.pending_writes.get(key) or self.inflight_writes[key])[3]
+        except KeyError:
+            pass
+
+        return await self.single_flight(
+            key, lambda: self.load_data(id_, db_name=db_name, collection=collection, default_model=default_model)
+        )
+
+    def current_value(self, key: str, fallback: dict):
+
+        if (data := self.cache.get(key)) is not None:
+            return data
+
+        try:
+            return (self.pending_writes.get(key) or self.inflight_writes[key])[3]
+        except KeyError:
+            return fallback
+
+    async def load_data(self, id_: str, *, db_name: str, collection: str, default_model: dict):
+
+        key = f"{collection}:{db_name}:{id_}"
+
+        generation = self.start_load(key)
+
+        try:
+            data = await self._connect[collection][db_name].find_one({"_id": id_})
+        finally:
+            changed = self.finish_load(key, generation)
 
         if not data:
-            return deepcopy(default_model[db_name])
+            if changed:
+                return self.current_value(key, DefaultDocument(default_model[db_name]))
+            self.missing_cache[key] = True
+            return DefaultDocument(default_model[db_name])
 
         elif data["ver"] != default_model[db_name]["ver"]:
-            data = update_values(deepcopy(default_model[db_name]), data)
+            data = update_values(DefaultDocument(default_model[db_name]), data)
             data["ver"] = default_model[db_name]["ver"]
+            if changed:
+                return self.current_value(key, data)
             await self.update_data(id_, data, db_name=db_name, collection=collection)
 
+        elif changed:
+            return self.current_value(key, data)
+
+        else:
+            self.cache[key] = data
+
         return data
 
+    async def get_many(self, ids: list, *, db_name: Union[DBModel.guilds, DBModel.users],
+                       collection: str, default_model: dict = None) -> dict:
+
+        if not default_model:
+            default_model = db_models
+
+        results = {}
+        missing = []
+
+        for id_ in ids:
+
+            id_ = str(id_)
+
+            if id_ in results:
+                continue
+
+            key = f"{collection}:{db_name}:{id_}"
+
+            if (cached_result := self.cache.get(key)) is not None:
+                results[id_] = cached_result
+                continue
+
+            if key in self.missing_cache:
+                results[id_] = DefaultDocument(default_model[db_name])
+                continue
+
+            try:
+                results[id_] = (self.pending_writes.get(key) or self.inflight_writes[key])[3]
+            except KeyError:
+                missing.append(id_)
+
+        if not missing:
+            return results
+
+        generations = {id_: self.start_load(f"{collection}:{db_name}:{id_}") for id_ in missing}
+
+        try:
+            documents = [d async for d in self._connect[collection][db_name].find({"_id": {"$in": missing}})]
+        finally:
+            changed = {id_ for id_, g in generations.items() if self.finish_load(f"{collection}:{db_name}:{id_}", g)}
+
+        for data in documents:
+
+            id_ = data["_id"]
+            key = f"{collection}:{db_name}:{id_}"
+
+            if data["ver"] != default_model[db_name]["ver"]:
+                data = update_values(DefaultDocument(default_model[db_name]), data)
+                data["ver"] = default_model[db_name]["ver"]
+                if id_ in changed:
+                    data = self.current_value(key, data)
+                else:
+                    await self.update_data(id_, data, db_name=db_name, collection=collection)
+            elif id_ in changed:
+                data = self.current_value(key, data)
+            else:
+                self.cache[key] = data
+
+            results[id_] = data
+
+        for id_ in missing:
+            if id_ not in results:
+                key = f"{collection}:{db_name}:{id_}"
+                if id_ in changed:
+                    results[id_] = self.current_value(key, DefaultDocument(default_model[db_name]))
+                    continue
+                self.missing_cache[key] = True
+                results[id_] = DefaultDocument(default_model[db_name])
+
+        return results
+
     async def update_data(self, id_, data: dict, *, db_name: Union[DBModel.guilds, DBModel.users, str],
                           collection: str, default_model: dict = None):
 
+        self.bump_generation(f"{collection}:{db_name}:{id_}")
         self.cache[f"{collection}:{db_name}:{id_}"] = data
+        self.missing_cache.pop(f"{collection}:{db_name}:{id_}", None)
 
         try:
             del data["_id"]
         except KeyError:
             pass
 
-        await self._connect[collection][db_name].update_one({'_id': str(id_)}, {'$set': data}, upsert=True)
+        if not self.write_behind:
+            await self._connect[collection][db_name].update_one({'_id': str(id_)}, {'$set': data}, upsert=True)
+            self.notify_peers(f"{collection}:{db_name}:{id_}")
+            return data
+
+        await self.queue_write(str(id_), data, db_name=db_name, collection=collection)
         return data
 
+    async def queue_write(self, id_: str, data: dict, *, db_name: str, collection: str):
+
+        if not self.write_behind_task or self.write_behind_task.done():
+            self.write_behind_event = asyncio.Event()
+            self.flush_lock = self.flush_lock or asyncio.Lock()
+            self.write_behind_task = asyncio.create_task(self.write_behind_loop())
+
+        key = f"{collection}:{db_name}:{id_}"
+
+        if key in self.pending_writes:
+            self.write_stats["coalesced"] += 1
+
+        self.pending_writes[key] = (collection, db_name, id_, data)
+
+        if len(self.pending_writes) >= self.write_behind_max_pending:
+            await self.flush_pending_writes()
+
+        elif len(self.pending_writes) >= self.write_behind_batch_size:
+            self.write_behind_event.set()
+
+    async def write_behind_loop(self):
+
+        while True:
+            try:
+                await asyncio.wait_for(self.write_behind_event.wait(), timeout=self.write_behind_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.write_behind_event.clear()
+            try:
+                await self.flush_pending_writes()
+            except Exception:
+                traceback.print_exc()
+
+    async def flush_pending_writes(self):
+
+        if not self.flush_lock:
+            return
+
+        async with self.flush_lock:
+
+            if not self.pending_writes and not self.inflight_writes:
+                return
+
+            # o que ficou de um envio interrompido (ex: task cancelada) é reenviado junto.
+            self.inflight_writes, self.pending_writes = {**self.inflight_writes, **self.pending_writes}, {}
+
+            batches = {}
+
+            for key, (collection, db_name, id_, data) in self.inflight_writes.items():
+                batches.setdefault((collection, db_name), []).append((key, UpdateOne({'_id': id_}, {'$set': data}, upsert=True)))
+
+            for (collection, db_name), operations in batches.items():
+
+                for i in range(0, len(operations), self.write_behind_batch_size):
+
+                    chunk = operations[i:i + self.write_behind_batch_size]
+
+                    try:
+                        await self._connect[collection][db_name].bulk_write([op for _, op in chunk], ordered=False)
+                    except BulkWriteError as e:
+                        if e.details.get("writeConcernErrors"):
+                            # não há como saber quais foram gravados: reenviar o lote (as alterações usam $set).
+                            print(f"⚠️ - Falha ao confirmar gravação no mongodb ({collection}.{db_name}): "
+                                  f"{e.details['writeConcernErrors'][0].get('errmsg')}")
+                            self.requeue_writes([key for key, _ in chunk])
+                            continue
+                        errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+                        self.requeue_writes([chunk[i][0] for i in errors], errors=[errors[i] for i in errors])
+                        self.writes_flushed([key for n, (key, _) in enumerate(chunk) if n not in errors])
+                    except Exception:
+                        traceback.print_exc()
+                        self.requeue_writes([key for key, _ in chunk])
+                    else:
+                        self.writes_flushed([key for key, _ in chunk])
+
+            self.inflight_writes = {}
+
+    def writes_flushed(self, keys: list):
+
+        self.write_stats["flushed"] += len(keys)
+
+        for key in keys:
+            self.write_attempts.pop(key, None)
+
+        if keys and self.invalidator:
+            self.invalidator.publish(keys)
+
+    def requeue_writes(self, keys: list, errors: list = None):
+
+        self.write_stats["failed"] += len(keys)
+
+        for n, key in enumerate(keys):
+
+            if key in self.pending_writes:
+                # alterado novamente enquanto o lote era enviado: a versão nova é enviada no próximo lote.
+                self.write_attempts.pop(key, None)
+                continue
+
+            if errors:
+                attempts = self.write_attempts[key] = self.write_attempts.get(key, 0) + 1
+                if attempts >= self.write_behind_max_retries:
+                    del self.write_attempts[key]
+                    self.write_stats["discarded"] += 1
+                    # o cache teria dados que não estão na database.
+                    self.bump_generation(key)
+                    self.cache.pop(key, None)
+                    print(f"⚠️ - Gravação descartada no mongodb após {attempts} tentativas: {key} | "
+                          f"Erro: {errors[n].get('errmsg')}")
+                    continue
+
+            self.pending_writes[key] = self.inflight_writes[key]
+
+    async def close(self):
+
+        await self.flush_pending_writes()
+
+        try:
+            self.write_behind_task.cancel()
+        except AttributeError:
+            pass
+
+        await super().close()
+
     async def query_data(self, db_name: str, collection: str, filter: dict = None, limit=100) -> list:
         return [d async for d in self._connect[collection][db_name].find(filter or {})]
 
     async def delete_data(self, id_, db_name: str, collection: str):
-        try:
-            self.cache.pop(f"{collection}:{db_name}:{id_}")
-        except KeyError:
-            pass
-        return await self._connect[collection][db_name].delete_one({'_id': str(id_)})
+
+        key = f"{collection}:{db_name}:{id_}"
+
+        self.bump_generation(key)
+        self.cache.pop(key, None)
+        self.pending_writes.pop(key, None)
+        self.missing_cache[key] = True
+        self.write_attempts.pop(key, None)
+
+        if not self.flush_lock:
+            result = await self._connect[collection][db_name].delete_one({'_id': str(id_)})
+            self.notify_peers(key)
+            return result
+
+        inflight = self.inflight_writes.get(key)
+
+        # aguardar o envio em andamento (que poderia recriar o documento após a exclusão) e remover o documento caso
+        # tenha voltado pra fila por falha no lote (alterações feitas após a exclusão são mantidas).
+        async with self.flush_lock:
+            if inflight is not None and self.pending_writes.get(key) is inflight:
+                del self.pending_writes[key]
+            self.inflight_writes.pop(key, None)
+            result = await self._connect[collection][db_name].delete_one({'_id': str(id_)})
+
+        self.notify_peers(key)
+        return result
 
 
 def update_values(d, u):
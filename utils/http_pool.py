@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+import aiohttp
+
+
+class HTTPClientRegistry:
+    """Sessões aiohttp compartilhadas entre todos os bots (uma por classe de host).
+
+    Cada sessão mantém seu próprio pool de conexões (keep-alive, cache de DNS, limite de conexões simultâneas por
+    host e timeout), evitando refazer DNS/TCP/TLS a cada requisição. As sessões nunca devem ser fechadas por quem as
+    usa, apenas pelo próprio registro (no desligamento do bot).
+    """
+
+    # limite de conexões simultâneas por host e timeout total (em segundos) de cada classe de host.
+    profiles = {
+        "default": {"limit_per_host": 10, "timeout": 30},
+        "spotify": {"limit_per_host": 20, "timeout": 20},
+        "deezer": {"limit_per_host": 20, "timeout": 20},
+        "lastfm": {"limit_per_host": 10, "timeout": 20},
+        "lavalink": {"limit_per_host": 30, "timeout": 45},
+        "youtube": {"limit_per_host": 5, "timeout": 30},
+        "discord_webhook": {"limit_per_host": 5, "timeout": 30},
+    }
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 0, dns_ttl: int = 300,
+                 keepalive_timeout: float = 30, timeout: float = 0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.sessions: Dict[str, aiohttp.ClientSession] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+        self.closed = False
+
+    def _trace_config(self, name: str) -> aiohttp.TraceConfig:
+
+        counters = self.counters.setdefault(name, {"requests": 0, "new_connections": 0, "reused_connections": 0})
+
+        async def on_request_start(session, ctx, params):
+            counters["requests"] += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            counters["new_connections"] += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            counters["reused_connections"] += 1
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(on_request_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace
+
+    def get(self, name: str = "default") -> aiohttp.ClientSession:
+
+        if self.closed:
+            raise RuntimeError("O registro de sessões http já foi fechado.")
+
+        try:
+            session = self.sessions[name]
+        except KeyError:
+            pass
+        else:
+            if not session.closed:
+                return session
+
+        profile = self.profiles.get(name, self.profiles["default"])
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host or profile["limit_per_host"],
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout or profile["timeout"]),
+            trace_configs=[self._trace_config(name)],
+        )
+
+        self.sessions[name] = session
+        return session
+
+    @asynccontextmanager
+    async def borrow(self, name: str = "default"):
+        yield self.get(name)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        data = {}
+        for name, counters in self.counters.items():
+            connections = counters["new_connections"] + counters["reused_connections"]
+            data[name] = dict(counters, reuse_ratio=round(counters["reused_connections"] / connections, 3) if connections else 0.0)
+        return data
+
+    async def close(self):
+        self.closed = True
+        sessions, self.sessions = list(self.sessions.values()), {}
+        await asyncio.gather(*[s.close() for s in sessions if not s.closed], return_exceptions=True)
+
+
+@asynccontextmanager
+async def http_session(registry: Optional[HTTPClientRegistry] = None, name: str = "default"):
+    """Usa uma sessão do registro compartilhado (quando disponível) ou uma sessão temporária."""
+    if registry is None or registry.closed:
+        async with aiohttp.ClientSession() as session:
+            yield session
+    else:
+        yield registry.get(name)
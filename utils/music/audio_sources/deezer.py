@@ -5,13 +5,13 @@ import re
 from typing import Optional
 from urllib.parse import quote
 
-from aiohttp import ClientSession
 from cachetools import TTLCache
 from rapidfuzz import fuzz
 
 from utils.music.converters import fix_characters, URL_REG
 from utils.music.errors import GenericError
 from utils.music.models import LavalinkTrack, LavalinkPlaylist
+from utils.http_pool import HTTPClientRegistry, http_session
 from utils.music.track_encoder import encode_track
 
 deezer_regex = re.compile(r"(https?://)?(www\.)?deezer\.com/(?P<countrycode>[a-zA-Z]{2}/)?(?P<type>track|album|playlist|artist|profile)/(?P<identifier>[0-9]+)")
@@ -21,12 +21,13 @@ class DeezerClient:
 
     base_url = "https://api.deezer.com"
     
-    def __init__(self, cache: Optional[TTLCache] = None):
+    def __init__(self, cache: Optional[TTLCache] = None, http: Optional[HTTPClientRegistry] = None):
         self.cache = cache or TTLCache(maxsize=700, ttl=86400)
+        self.http = http
 
     async def request(self, path: str, params: dict = None):
 
-        async with ClientSession() as session:
+        async with http_session(self.http, "deezer") as session:
             async with session.get(f"{self.base_url}/{path}", params=params) as response:
                 if response.status == 200:
                     return await response.json()
@@ -113,7 +114,7 @@ class DeezerClient:
                 return tracks
 
         if url.startswith("https://deezer.page.link/"):
-            async with ClientSession() as session:
+            async with http_session(self.http, "deezer") as session:
                 async with session.get(url, allow_redirects=False) as r:
                     if 'location' not in r.headers:
                         raise GenericError("**Falha ao obter resultado para o link informado...**")
@@ -13,9 +13,9 @@ from typing import Optional, TYPE_CHECKING, Union
 from urllib.parse import quote
 
 import aiofiles
-from aiohttp import ClientSession
 from rapidfuzz import fuzz
 
+from utils.http_pool import HTTPClientRegistry, http_session
 from utils.music.converters import fix_characters, URL_REG
 from utils.music.errors import GenericError
 from utils.music.models import LavalinkTrack, LavalinkPlaylist
@@ -33,7 +33,8 @@ spotify_cache_file = os.path.join(gettempdir(), ".spotify_cache.json")
 
 class SpotifyClient:
 
-    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None, playlist_extra_page_limit: int = 0):
+    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None, playlist_extra_page_limit: int = 0,
+                 http: Optional[HTTPClientRegistry] = None):
 
         if not client_id:
             raise Exception(
@@ -53,6 +54,7 @@ class SpotifyClient:
         self.type = "api"
         self.token_refresh = False
         self.playlist_extra_page_limit = playlist_extra_page_limit
+        self.http = http
 
         try:
             with open(spotify_cache_file) as f:
@@ -67,7 +69,7 @@ class SpotifyClient:
 
         headers = {'Authorization': f'Bearer {await self.get_valid_access_token()}'}
 
-        async with ClientSession() as session:
+        async with http_session(self.http, "spotify") as session:
             async with session.get(f"{self.base_url}/{path}", headers=headers, params=params) as response:
                 if response.status == 200:
                     return await response.json()
@@ -159,7 +161,7 @@ class SpotifyClient:
                 'grant_type': 'client_credentials'
             }
 
-            async with ClientSession() as session:
+            async with http_session(self.http, "spotify") as session:
                 async with session.post(token_url, headers=headers, data=data) as response:
                     data = await response.json()
 
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import json
+import logging
+import time
+import traceback
+import weakref
+from typing import Optional
+
+from cachetools import TTLCache
+
+
+def _normalize_payload(value):
+
+    if isinstance(value, dict):
+        return {k: _normalize_payload(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_normalize_payload(v) for v in value]
+
+    if hasattr(value, "to_component_dict"):
+        return _normalize_payload(value.to_component_dict())
+
+    if hasattr(value, "to_dict"):
+        return _normalize_payload(value.to_dict())
+
+    return value
+
+
+def payload_hash(data: dict) -> bytes:
+    """Hash estável da mensagem renderizada do player (embeds e components são comparados pelo conteúdo).
+
+    Objetos sem representação (ex: arquivos) usam o repr, fazendo a comparação falhar ao invés de ignorar uma
+    edição necessária."""
+    return hashlib.blake2b(
+        json.dumps(_normalize_payload(data), sort_keys=True, default=repr, ensure_ascii=False).encode(),
+        digest_size=16
+    ).digest()
+
+
+class _RatelimitLogHandler(logging.Handler):
+    """Avisos de ratelimit (429) do disnake, que aguarda e repete as requisições internamente sem gerar erro.
+
+    Depende da mensagem de log do disnake.http (HTTPClient.request) da versão usada no requirements.txt (commit
+    96ed4459): ``RATELIMIT_LOG_FORMAT % (retry_after, bucket)``, sendo o bucket da rota no formato
+    ``channel_id:guild_id:rota`` (ex: ``123:456:/channels/{channel_id}/messages/{message_id}``). O aviso é repassado
+    apenas para os agendadores que editam mensagens no canal. Caso o disnake altere o formato, um aviso é exibido (uma
+    única vez) informando que os ratelimits deixaram de ser detectados.
+    """
+
+    RATELIMIT_LOG_FORMAT = 'We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"'
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.schedulers = weakref.WeakSet()
+        self.format_warned = False
+
+    def unknown_format(self, record: logging.LogRecord):
+        if not self.format_warned:
+            self.format_warned = True
+            print(f"⚠️ - Aviso de ratelimit do disnake em formato não reconhecido (versão do disnake diferente da usada "
+                  f"no requirements.txt?): {record.msg!r} {record.args!r}\n"
+                  f"Os ratelimits ao editar as mensagens de controle dos players não serão detectados.")
+
+    def emit(self, record: logging.LogRecord):
+
+        if record.msg != self.RATELIMIT_LOG_FORMAT:
+            if "rate limited" in str(record.msg).lower():
+                self.unknown_format(record)
+            return
+
+        try:
+            retry_after, bucket = record.args
+            retry_after = float(retry_after)
+            channel_id, _, route = bucket.partition(":")
+        except (TypeError, ValueError, AttributeError):
+            self.unknown_format(record)
+            return
+
+        if "/messages/{message_id}" not in route or not channel_id.isdigit():
+            return
+
+        channel_id = int(channel_id)
+
+        for scheduler in list(self.schedulers):
+            if channel_id in scheduler.channels:
+                scheduler.rate_limited(channel_id, retry_after)
+
+
+ratelimit_log_handler: Optional[_RatelimitLogHandler] = None
+
+
+class _ChannelEditState:
+
+    __slots__ = ("next_edit", "generation")
+
+    def __init__(self):
+        self.next_edit = 0.0
+        self.generation = 0
+
+
+class ControllerEditScheduler:
+    """Controla as edições das mensagens de controle dos players de um bot.
+
+    * No máximo uma edição por canal a cada ``window`` segundos: atualizações em sequência do mesmo canal aguardam a
+      janela e apenas a mais recente é enviada (as anteriores são descartadas/agrupadas).
+    * Limite de edições por segundo compartilhado entre todos os players do bot (token bucket), reduzido
+      temporariamente ao receber ratelimit (429, obtido dos avisos de ratelimit do disnake).
+    """
+
+    def __init__(self, window: float = 2.0, rate: float = 20):
+        self.window = window
+        self.rate = max(rate, 1)
+        self.tokens = self.rate
+        self.tokens_updated = time.monotonic()
+        self.paused_until = 0.0
+        self.channels = TTLCache(maxsize=20000, ttl=600)
+        self.metrics = {"sent": 0, "coalesced": 0, "skipped": 0, "rate_limited": 0}
+
+        global ratelimit_log_handler
+
+        if ratelimit_log_handler is None:
+            ratelimit_log_handler = _RatelimitLogHandler()
+            logging.getLogger("disnake.http").addHandler(ratelimit_log_handler)
+
+        ratelimit_log_handler.schedulers.add(self)
+
+    async def acquire_budget(self):
+
+        while True:
+
+            now = time.monotonic()
+
+            if self.paused_until > now:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+
+            self.tokens = min(self.rate, self.tokens + (now - self.tokens_updated) * self.rate)
+            self.tokens_updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def wait(self, channel_id: int, coalesce: bool = True) -> bool:
+        """Aguarda a vez de editar a mensagem do canal.
+
+        Retorna False caso uma atualização mais recente do mesmo canal tenha substituído esta (com coalesce ativo)."""
+
+        try:
+            state = self.channels[channel_id]
+        except KeyError:
+            state = self.channels[channel_id] = _ChannelEditState()
+
+        state.generation += 1
+        generation = state.generation
+
+        while True:
+
+            while (delay := state.next_edit - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+                if coalesce and state.generation != generation:
+                    self.metrics["coalesced"] += 1
+                    return False
+
+            await self.acquire_budget()
+
+            if coalesce and state.generation != generation:
+                self.tokens = min(self.rate, self.tokens + 1)
+                self.metrics["coalesced"] += 1
+                return False
+
+            # outra edição do canal (ex: force) ocupou a janela enquanto aguardava o limite: aguardar novamente.
+            if state.next_edit <= time.monotonic():
+                break
+
+            self.tokens = min(self.rate, self.tokens + 1)
+
+        state.next_edit = time.monotonic() + self.window
+        self.metrics["sent"] += 1
+        return True
+
+    def skipped(self, channel_id: int):
+        """A mensagem renderizada não mudou: devolve a vez/limite reservado pelo :meth:`wait`."""
+
+        self.metrics["sent"] -= 1
+        self.metrics["skipped"] += 1
+        self.tokens = min(self.rate, self.tokens + 1)
+
+        try:
+            self.channels[channel_id].next_edit = 0.0
+        except KeyError:
+            pass
+
+    def rate_limited(self, channel_id: int, retry_after: float = 0):
+
+        self.metrics["rate_limited"] += 1
+
+        retry_after = retry_after or self.window * 2
+
+        try:
+            state = self.channels[channel_id]
+        except KeyError:
+            pass
+        else:
+            state.next_edit = max(state.next_edit, time.monotonic() + retry_after)
+
+        # reduzir temporariamente o limite global do bot.
+        self.tokens = 0
+        self.paused_until = max(self.paused_until, time.monotonic() + min(retry_after, 5))
+
+    def stats(self) -> dict:
+        return dict(self.metrics, channels=len(self.channels), tokens=round(self.tokens, 2))
+
+
+class ControllerUpdateScheduler:
+    """Agendador central das atualizações automáticas das mensagens de controle dos players de um bot.
+
+    Substitui o loop individual de cada player: os players só são "acordados" quando há uma atualização pendente
+    (``player.update = True``) ou quando a skin usa atualização periódica (``player.auto_update``, ex: barra de
+    progresso). Players sem alterações não geram nenhuma atividade.
+    """
+
+    def __init__(self, bot, dirty_delay: float = 5.0):
+        self.bot = bot
+        self.dirty_delay = dirty_delay
+        self.players = {}
+        self.deadlines = {}
+        self.heap = []
+        self.running = set()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.metrics = {"wakeups": 0, "renders": 0}
+
+    def start(self, player):
+        self.players[player.guild_id] = player
+        self.reschedule(player)
+
+    def stop(self, player):
+        if self.players.get(player.guild_id) is player:
+            del self.players[player.guild_id]
+        self.deadlines.pop(player.guild_id, None)
+
+    def mark_dirty(self, player):
+        if self.players.get(player.guild_id) is player:
+            self.schedule(player, time.monotonic() + self.dirty_delay)
+
+    def reschedule(self, player):
+
+        if player.update:
+            self.schedule(player, time.monotonic() + self.dirty_delay)
+
+        elif player.auto_update and player.current and not player.current.is_stream:
+            self.schedule(player, time.monotonic() + player.auto_update)
+
+    def schedule(self, player, deadline: float):
+
+        guild_id = player.guild_id
+
+        if (current := self.deadlines.get(guild_id)) is not None and current <= deadline:
+            return
+
+        self.deadlines[guild_id] = deadline
+        heapq.heappush(self.heap, (deadline, guild_id))
+
+        if self.task is None or self.task.done():
+            self.task = self.bot.loop.create_task(self.run())
+        elif self.heap[0][0] == deadline:
+            self.wakeup.set()
+
+    async def run(self):
+
+        while True:
+
+            self.wakeup.clear()
+
+            now = time.monotonic()
+
+            while self.heap and self.heap[0][0] <= now:
+
+                deadline, guild_id = heapq.heappop(self.heap)
+
+                # entrada antiga (o player foi reagendado/parado).
+                if self.deadlines.get(guild_id) != deadline:
+                    continue
+
+                del self.deadlines[guild_id]
+
+                try:
+                    player = self.players[guild_id]
+                except KeyError:
+                    continue
+
+                self.metrics["wakeups"] += 1
+
+                if guild_id in self.running:
+                    self.schedule(player, now + self.dirty_delay)
+                    continue
+
+                self.running.add(guild_id)
+                self.bot.loop.create_task(self.update_player(player))
+
+            timeout = self.heap[0][0] - now if self.heap else None
+
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def update_player(self, player):
+
+        try:
+            if player.is_closing:
+                self.stop(player)
+                return
+
+            player._update = False
+
+            # sem mensagem de controle pra atualizar: o player só volta a ser agendado pelo start().
+            if not player.text_channel or not player.controller_mode or not player.current:
+                self.stop(player)
+                return
+
+            self.metrics["renders"] += 1
+
+            try:
+                await player.invoke_np()
+            except:
+                traceback.print_exc()
+
+        finally:
+            self.running.discard(player.guild_id)
+            if self.players.get(player.guild_id) is player:
+                self.reschedule(player)
+
+    def stats(self) -> dict:
+        return dict(self.metrics, players=len(self.players), scheduled=len(self.deadlines))
@@ -22,7 +22,7 @@ from utils.music.checks import check_pool_bots
 from utils.music.converters import time_format, fix_characters, URL_REG
 from utils.music.errors import GenericError
 from utils.music.models import LavalinkPlayer, LavalinkTrack
-from utils.music.skin_utils import skin_converter
+from utils.music.skin_utils import skin_converter, invalidate_compiled_skins
 from utils.others import check_cmd, CustomContext, send_idle_embed, music_source_emoji_url, \
     PlayerControls, get_source_emoji_cfg, paginator
 
@@ -2927,6 +2927,8 @@ class SkinEditorMenu(disnake.ui.View):
 
         await self.bot.update_global_data(id_=inter.guild_id, data=self.global_data, db_name=DBModel.guilds)
 
+        invalidate_compiled_skins(inter.guild_id)
+
         self.mode = "select"
         self.skin_selected = ""
         self.update_components()
@@ -3123,6 +3125,8 @@ class SkinEditorMenu(disnake.ui.View):
 
             await self.bot.update_global_data(id_=inter.guild_id, data=self.global_data, db_name=DBModel.guilds)
 
+            invalidate_compiled_skins(inter.guild_id)
+
             for bot in self.bot.pool.get_guild_bots(inter.guild_id):
 
                 try:
@@ -2,10 +2,12 @@ import hashlib
 import os
 import pickle
 import time
+from typing import Optional
 
-from aiohttp import ClientSession
 from cachetools import TTLCache
 
+from utils.http_pool import HTTPClientRegistry, http_session
+
 cache_file = "./.lastfm_cache"
 
 class LastFmException(Exception):
@@ -15,9 +17,10 @@ class LastFmException(Exception):
         
 class LastFM:
     
-    def __init__(self, api_key: str, api_secret: str):
+    def __init__(self, api_key: str, api_secret: str, http: Optional[HTTPClientRegistry] = None):
         self.api_key = api_key
         self.api_secret = api_secret
+        self.http = http
         self.cache: TTLCache = self.scrobble_load_cache()
 
     def scrobble_load_cache(self):
@@ -44,7 +47,7 @@ class LastFM:
     
     async def request_lastfm(self, params: dict):
         params["format"] = "json"
-        async with ClientSession() as session:
+        async with http_session(self.http, "lastfm") as session:
             async with session.get("http://ws.audioscrobbler.com/2.0/", params=params) as response:
                 if (data:=await response.json()).get('error'):
                     raise LastFmException(data)
@@ -52,7 +55,7 @@ class LastFM:
     
     async def post_lastfm(self, params: dict):
         params["format"] = "json"
-        async with ClientSession() as session:
+        async with http_session(self.http, "lastfm") as session:
             async with session.post("http://ws.audioscrobbler.com/2.0/", params=params) as response:
                 if (data:=await response.json()).get('error'):
                     raise LastFmException(data)
@@ -6,10 +6,12 @@ import datetime
 import itertools
 import pprint
 import random
+import os
 import re
+import sys
 import traceback
-import uuid
 from collections import deque
+from copy import deepcopy
 from itertools import cycle
 from time import time
 from typing import Optional, Union, TYPE_CHECKING, List
@@ -23,12 +25,15 @@ from yt_dlp import YoutubeDL
 import wavelink
 from utils.db import DBModel
 from utils.music.checks import can_connect
-from utils.music.converters import fix_characters, time_format, get_button_style
+from utils.music.controller_edits import payload_hash
+from utils.music.converters import fix_characters, time_format
 from utils.music.errors import GenericError, PoolException
 from utils.music.filters import AudioFilter
 from utils.music.lastfm_tools import LastFmException
+from utils.music.player_components import player_controls, queue_dropdown
 from utils.music.skin_utils import skin_converter
 from utils.music.track_encoder import encode_track, DataWriter
+from utils.music.track_record import CompactTrack, TrackQueue
 from utils.others import music_source_emoji, send_idle_embed, PlayerControls, string_to_file
 from wavelink import TrackStart, TrackEnd
 
@@ -57,6 +62,14 @@ providers_dict = {
 
 native_sources = {"http", "youtube", "soundcloud", "tts", "reddit", "ocremix", "tiktok", "mixcloud", "soundgasm", "flowerytts", "vimeo", "twitch", "bandcamp", "local"}
 
+# prefixo aleatório por processo para que os ids não se repitam com os das músicas restauradas de sessões anteriores.
+_unique_id_prefix = os.urandom(3).hex()
+_unique_id_counter = itertools.count(1)
+
+
+def new_unique_id() -> str:
+    return f"{_unique_id_prefix}{next(_unique_id_counter):x}"
+
 
 def get_start_pos(player, track, extra_milliseconds=0):
     if not track.is_stream:
@@ -98,14 +111,15 @@ class PartialPlaylist:
             return ""
 
 
-class PartialTrack:
-    __slots__ = ('id', 'info', 'playlist', 'unique_id', 'ytid')
+class PartialTrack(CompactTrack):
+    __slots__ = ('id', '_info', '_record', 'playlist', 'unique_id', 'ytid')
 
     def __init__(self, *, uri: str = "", title: str = "", author="", thumb: str = "", duration: int = 0,
                  requester: int = 0, track_loops: int = 0, source_name: str = "", autoplay: bool = False,
                  identifier: str = "", info: dict = None, playlist: PartialPlaylist = None, ytid = ''):
 
-        self.info = info or {
+        self._record = None
+        self._info = info or {
             "author": fix_characters(author)[:97],
             "identifier": identifier,
             "title": title[:97],
@@ -125,28 +139,28 @@ class PartialTrack:
 
         self.id = None
         self.ytid = ytid
-        self.unique_id = str(uuid.uuid4().hex)[:10]
+        self.unique_id = new_unique_id()
         self.playlist: Optional[PartialPlaylist] = playlist
 
     def __repr__(self):
-        return f"{self.info['sourceName']} - {self.duration} - {self.authors_string} - {self.title}"
+        return f"{self.info_item('sourceName')} - {self.duration} - {self.authors_string} - {self.title}"
 
     def __str__(self):
-        return f"{self.info['sourceName']} - {self.duration} - {self.authors_string} - {self.title}"
+        return f"{self.info_item('sourceName')} - {self.duration} - {self.authors_string} - {self.title}"
 
     @property
     def thumb(self) -> str:
         try:
-            return self.info["extra"]["thumb"] or self.info["artworkUrl"]
+            return self.extra_item("thumb") or self.info_item("artworkUrl")
         except KeyError:
             try:
-                return self.info["artworkUrl"]
+                return self.info_item("artworkUrl")
             except KeyError:
                 return ""
 
     @property
     def uri(self) -> str:
-        return self.info["uri"] or self.search_uri
+        return self.info_item("uri") or self.search_uri
 
     @property
     def url(self) -> str:
@@ -154,7 +168,7 @@ class PartialTrack:
 
     @property
     def search_uri(self):
-        return f"https://www.youtube.com/results?search_query={quote_plus((self.author + '-' + self.single_title) if self.info['sourceName'] not in ('youtube', 'soundcloud') else self.title)}"
+        return f"https://www.youtube.com/results?search_query={quote_plus((self.author + '-' + self.single_title) if self.info_item('sourceName') not in ('youtube', 'soundcloud') else self.title)}"
 
     @property
     def title(self) -> str:
@@ -167,43 +181,43 @@ class PartialTrack:
     @property
     def identifier(self) -> str:
         try:
-            return self.info["identifier"]
+            return self.info_item("identifier")
         except KeyError:
             try:
-                return self.info["extra"]["original_id"]
+                return self.extra_item("original_id")
             except KeyError:
                 return ""
 
     @property
     def source_name(self):
-        return self.info["sourceName"] or "unkown"
+        return self.info_item("sourceName") or "unkown"
 
     @property
     def single_title(self) -> str:
-        return self.info["title"]
+        return self.info_item("title")
 
     @property
     def author(self) -> str:
-        return self.info["author"] or "Artista Desconhecido"
+        return self.info_item("author") or "Artista Desconhecido"
 
     @property
     def authors_string(self) -> str:
         try:
-            return ", ".join(self.info["extra"]["authors"])
+            return ", ".join(self.extra_item("authors"))
         except KeyError:
             return self.author
 
     @property
     def authors_md(self) -> str:
         try:
-            return self.info["extra"]["authors_md"]
+            return self.extra_item("authors_md")
         except KeyError:
             return f"`{self.author}`"
 
     @property
     def authors(self) -> List[str]:
         try:
-            return self.info["extra"]["authors"]
+            return self.extra_item("authors")
         except KeyError:
             return [self.author]
 
@@ -211,50 +225,50 @@ class PartialTrack:
     def lyrics(self) -> str:
 
         try:
-            return self.info["extra"]["lyrics"]
+            return self.extra_item("lyrics")
         except KeyError:
             return ""
 
     @property
     def requester(self) -> int:
-        return self.info["extra"]["requester"]
+        return self.extra_item("requester")
 
     @property
     def autoplay(self) -> bool:
         try:
-            return self.info["extra"]["autoplay"]
+            return self.extra_item("autoplay")
         except KeyError:
             return False
 
     @property
     def track_loops(self) -> int:
-        return self.info["extra"]["track_loops"]
+        return self.extra_item("track_loops")
 
     @property
     def is_stream(self) -> bool:
-        return self.info["isStream"]
+        return self.info_item("isStream")
 
     @property
     def duration(self) -> int:
-        return self.info["length"]
+        return self.info_item("length")
 
     @property
     def album_name(self) -> str:
         try:
-            return self.info["extra"]["album"]["name"]
+            return self.extra_item("album")["name"]
         except KeyError:
             try:
-                self.info["pluginInfo"]["albumName"]
+                self.info_item("pluginInfo")["albumName"]
             except KeyError:
                 return ""
 
     @property
     def album_url(self) -> str:
         try:
-            return self.info["extra"]["album"]["url"]
+            return self.extra_item("album")["url"]
         except KeyError:
             try:
-                self.info["pluginInfo"]["albumUrl"]
+                self.info_item("pluginInfo")["albumUrl"]
             except KeyError:
                 return ""
 
@@ -332,8 +346,8 @@ class LavalinkPlaylist:
             return ""
 
 
-class LavalinkTrack(wavelink.Track):
-    __slots__ = ('extra', 'playlist', 'unique_id')
+class LavalinkTrack(CompactTrack, wavelink.Track):
+    __slots__ = ('_info', '_record', 'playlist', 'unique_id')
 
     def __init__(self, *args, **kwargs):
         try:
@@ -343,7 +357,7 @@ class LavalinkTrack(wavelink.Track):
         super().__init__(*args, **kwargs)
         self.title = fix_characters(self.title)
         self.info["title"] = self.title
-        self.unique_id = str(uuid.uuid4().hex)[:10]
+        self.unique_id = new_unique_id()
 
         try:
             self.info['sourceName']
@@ -372,6 +386,8 @@ class LavalinkTrack(wavelink.Track):
             }
         )
 
+        self.author = sys.intern(self.author)
+
         self.playlist: Optional[LavalinkPlaylist] = kwargs.pop(
             "playlist", None)
 
@@ -397,15 +413,19 @@ class LavalinkTrack(wavelink.Track):
             self.info["artworkUrl"] = thumb
 
     def __repr__(self):
-        return f"{self.info['sourceName']} - {self.duration if not self.is_stream else 'stream'} - {self.authors_string} - {self.title}"
+        return f"{self.info_item('sourceName')} - {self.duration if not self.is_stream else 'stream'} - {self.authors_string} - {self.title}"
 
     @property
     def thumb(self) -> str:
-        return self.info["artworkUrl"] or ""
+        return self.info_item("artworkUrl") or ""
+
+    @property
+    def uri(self) -> str:
+        return self.info_get("uri", "")
 
     @property
     def source_name(self):
-        return self.info["sourceName"] or "unkown"
+        return self.info_item("sourceName") or "unkown"
 
     @property
     def name(self) -> str:
@@ -417,7 +437,7 @@ class LavalinkTrack(wavelink.Track):
 
     @property
     def url(self) -> str:
-        return self.info["uri"]
+        return self.info_item("uri")
 
     @property
     def search_uri(self):
@@ -426,8 +446,8 @@ class LavalinkTrack(wavelink.Track):
     @property
     def authors_md(self) -> str:
         try:
-            if self.info['pluginInfo']['artistUrl']:
-                return f"[`{self.author}`](<{self.info['pluginInfo']['artistUrl']}>)"
+            if self.info_item("pluginInfo")["artistUrl"]:
+                return f"[`{self.author}`](<{self.info_item('pluginInfo')['artistUrl']}>)"
         except KeyError:
             pass
         return f"`{self.author}`"
@@ -443,44 +463,44 @@ class LavalinkTrack(wavelink.Track):
     @property
     def album_name(self) -> str:
         try:
-            return self.info["extra"]["album"]["name"]
+            return self.extra_item("album")["name"]
         except KeyError:
             try:
-                return self.info["pluginInfo"]["albumName"]
+                return self.info_item("pluginInfo")["albumName"]
             except KeyError:
                 return ""
 
     @property
     def album_url(self) -> str:
         try:
-            return self.info["extra"]["album"]["url"]
+            return self.extra_item("album")["url"]
         except KeyError:
             try:
-                return self.info["pluginInfo"]["albumUrl"]
+                return self.info_item("pluginInfo")["albumUrl"]
             except KeyError:
                 return ""
 
     @property
     def lyrics(self) -> str:
         try:
-            return self.info["extra"]["lyrics"]
+            return self.extra_item("lyrics")
         except KeyError:
             return ""
 
     @property
     def requester(self) -> int:
-        return self.info["extra"]["requester"]
+        return self.extra_item("requester")
 
     @property
     def autoplay(self) -> bool:
         try:
-            return self.info["extra"]["autoplay"]
+            return self.extra_item("autoplay")
         except KeyError:
             return False
 
     @property
     def track_loops(self) -> int:
-        return self.info["extra"]["track_loops"]
+        return self.extra_item("track_loops")
 
     @property
     def playlist_name(self) -> str:
@@ -513,10 +533,11 @@ class LavalinkPlayer(wavelink.Player):
         self.skin_static: str = kwargs.pop("skin_static", None) or self.bot.pool.default_static_skin
         self.custom_skin_data = kwargs.pop("custom_skin_data", {})
         self.custom_skin_static_data = kwargs.pop("custom_skin_static_data", {})
-        self.queue: deque = deque()
-        self.played: deque = deque(maxlen=20)
-        self.queue_autoplay: deque = deque(maxlen=30)
-        self.failed_tracks: deque = deque(maxlen=30)
+        # as músicas nas filas ficam compactadas (o dict info é remontado apenas quando usado).
+        self.queue: deque = TrackQueue()
+        self.played: deque = TrackQueue(maxlen=20)
+        self.queue_autoplay: deque = TrackQueue(maxlen=30)
+        self.failed_tracks: deque = TrackQueue(maxlen=30)
         self.command_log_list = deque(maxlen=10)
         self.autoplay: bool = kwargs.pop("autoplay", False)
         self.nightcore: bool = False
@@ -540,7 +561,7 @@ class LavalinkPlayer(wavelink.Player):
         self.is_closing: bool = False
         self.last_message_id: Optional[int] = kwargs.pop("last_message_id", None)
         self.keep_connected: bool = kwargs.pop("keep_connected", False)
-        self.update: bool = False
+        self._update: bool = False
         self.updating: bool = False
         self.auto_update: int = 0
         self.live_lyrics_enabled = False
@@ -548,7 +569,6 @@ class LavalinkPlayer(wavelink.Player):
         self.np_original_data = None
         self.lyric_task: Optional[asyncio.Task] = None
         self.listen_along_invite = kwargs.pop("listen_along_invite", "")
-        self.message_updater_task: Optional[asyncio.Task] = None
         # limitar apenas para dj's e staff's
         self.restrict_mode = kwargs.pop('restrict_mode', False)
         self.ignore_np_once = False  # não invocar player controller em determinadas situações
@@ -636,7 +656,8 @@ class LavalinkPlayer(wavelink.Player):
 
         self.hints: cycle = []
         self.current_hint: str = ""
-        self.last_data: dict = {}
+        self.last_render_hash: Optional[bytes] = None
+        self.queue_dropdown_cache: tuple = (None, None)
         self.lyric_embed: Optional[disnake.Embed] = None
         self.event_queue_task = self.bot.loop.create_task(self.hook_events())
         self.check_skins()
@@ -952,10 +973,7 @@ class LavalinkPlayer(wavelink.Player):
                     else:
                         continue
 
-                    try:
-                        self.message_updater_task.cancel()
-                    except:
-                        pass
+                    self.bot.controller_updater.stop(self)
 
                     await self.track_end()
 
@@ -1181,10 +1199,7 @@ class LavalinkPlayer(wavelink.Player):
 
                 if isinstance(event, wavelink.TrackStuck):
 
-                    try:
-                        self.message_updater_task.cancel()
-                    except:
-                        pass
+                    self.bot.controller_updater.stop(self)
 
                     await self.track_end()
 
@@ -1962,7 +1977,7 @@ class LavalinkPlayer(wavelink.Player):
 
                     cache_key = f"{track.info['sourceName']}:id:{track.identifier or track.id or track.ytid}"
 
-                    partial_data = self.bot.pool.partial_track_cache.get(cache_key)
+                    partial_data = await self.bot.pool.partial_track_cache.fetch(cache_key)
 
                     if track.info["sourceName"] == "youtube" or (partial_data and partial_data[0].info["sourceName"] == "youtube"):
 
@@ -1996,7 +2011,7 @@ class LavalinkPlayer(wavelink.Player):
                                     else:
                                         query = f"{provider}:{track.title}"
 
-                                    tracks = self.bot.pool.partial_track_cache.get(query)
+                                    tracks = await self.bot.pool.partial_track_cache.fetch(query)
 
                                     if not tracks:
 
@@ -2488,12 +2503,18 @@ class LavalinkPlayer(wavelink.Player):
 
         self.last_stage_title = msg
 
+    @property
+    def update(self) -> bool:
+        return self._update
+
+    @update.setter
+    def update(self, value: bool):
+        self._update = value
+        if value:
+            self.bot.controller_updater.mark_dirty(self)
+
     def start_message_updater_task(self):
-        try:
-            self.message_updater_task.cancel()
-        except AttributeError:
-            pass
-        self.message_updater_task = self.bot.loop.create_task(self.message_updater())
+        self.bot.controller_updater.start(self)
 
     async def invoke_np(self, force=False, interaction=None, rpc_update=False):
 
@@ -2530,6 +2551,16 @@ class LavalinkPlayer(wavelink.Player):
         if self.has_lyrics:
             return
 
+        if not interaction:
+
+            # atualizações em sequência da mensagem do player no mesmo canal são agrupadas (apenas a mais recente é
+            # enviada) e limitadas por bot para evitar ratelimit.
+            if not await self.bot.controller_edits.wait(self.text_channel.id, coalesce=not force):
+                return
+
+            if self.is_closing or not self.text_channel or not self.current or (self.updating and not force):
+                return
+
         if rpc_update:
 
             try:
@@ -2544,36 +2575,58 @@ class LavalinkPlayer(wavelink.Player):
         try:
             if self.static:
                 if self.skin_static.startswith("> custom_skin: "):
-                    data = skin_converter(self.custom_skin_static_data[self.skin_static[15:]], player=self, guild=self.guild)
+                    data = skin_converter(self.custom_skin_static_data[self.skin_static[15:]], player=self, guild=self.guild,
+                                          skin_name=self.skin_static)
                 else:
                     data = self.bot.pool.player_static_skins[self.skin_static].load(self)
 
             else:
                 if self.skin.startswith("> custom_skin: "):
-                    data = skin_converter(self.custom_skin_data[self.skin[15:]], player=self, guild=self.guild)
+                    data = skin_converter(self.custom_skin_data[self.skin[15:]], player=self, guild=self.guild,
+                                          skin_name=self.skin)
                 else:
                     data = self.bot.pool.player_skins[self.skin].load(self)
         except OverflowError:
             await self.process_next()
             return
 
-        if data == self.last_data:
-
+        if not data.get("flags"):
             try:
-                if not interaction.response.is_done():
-                    await interaction.response.defer()
+                if self.static and isinstance(self.text_channel.parent, disnake.ForumChannel):
+                    data["content"] = f"`{'▶️' if not self.paused else '⏸️'} {fix_characters(self.current.title, 50)}` |\n\n" + (data.get("content") or "")
             except:
                 pass
-            return
 
-        self.last_data = data
+        # nenhum controle de botão foi definido na skin (será usado os botões padrões).
+        if self.controller_mode and data.get("components") is None:
+
+            # Aviso: Não modifique os components abaixo, prefira copiar uma das skins da pasta utils -> music -> skins
+            # e deixá-la com outro nome (sem acentos, espaços, caracteres especiais) e modifique-as a seu gosto.
+            # Caso queira deixar uma skin customizada por padrão adicione/modifique a config DEFAULT_SKIN="tuaskin"
+
+            data["components"] = player_controls(
+                self, song_request_thread=not self.static and not self.has_thread,
+                autoplay_description="Sistema de reprodução de música automática quando a fila tiver vazia."
+            )
+
+            if self.static and (dropdown := queue_dropdown(self)):
+                data["components"].append(dropdown)
+
+        render_hash = payload_hash(data)
+
+        if render_hash == self.last_render_hash and not force and self.message and not self.temp_embed:
+
+            if not interaction:
+                self.bot.controller_edits.skipped(self.text_channel.id)
 
-        if not data.get("flags"):
             try:
-                if self.static and isinstance(self.text_channel.parent, disnake.ForumChannel):
-                    data["content"] = f"`{'▶️' if not self.paused else '⏸️'} {fix_characters(self.current.title, 50)}` |\n\n" + (data.get("content") or "")
+                if not interaction.response.is_done():
+                    await interaction.response.defer()
             except:
                 pass
+            return
+
+        self.last_render_hash = render_hash
 
         if not self.controller_mode:
 
@@ -2600,154 +2653,13 @@ class LavalinkPlayer(wavelink.Player):
                             self.message = await self.text_channel.send(allowed_mentions=self.allowed_mentions, **data)
 
             else:
-                try:
-                    self.message_updater_task.cancel()
-                except:
-                    pass
+                self.bot.controller_updater.stop(self)
                 self.message = await self.text_channel.send(allowed_mentions=self.allowed_mentions, **data)
 
             self.updating = False
 
         else:
 
-            # nenhum controle de botão foi definido na skin (será usado os botões padrões).
-            if data.get("components") is None:
-
-                # Aviso: Não modifique os components abaixo, prefira copiar uma das skins da pasta utils -> music -> skins
-                # e deixá-la com outro nome (sem acentos, espaços, caracteres especiais) e modifique-as a seu gosto.
-                # Caso queira deixar uma skin customizada por padrão adicione/modifique a config DEFAULT_SKIN="tuaskin"
-
-                data["components"] = [
-                    disnake.ui.Button(
-                        emoji="⏯️", custom_id=PlayerControls.pause_resume, style=get_button_style(self.paused)),
-                    disnake.ui.Button(
-                        emoji="⏮️", custom_id=PlayerControls.back),
-                    disnake.ui.Button(
-                        emoji="⏹️", custom_id=PlayerControls.stop),
-                    disnake.ui.Button(
-                        emoji="⏭️", custom_id=PlayerControls.skip),
-                    disnake.ui.Button(
-                        emoji="<:music_queue:703761160679194734>", custom_id=PlayerControls.queue,
-                        disabled=not (self.queue or self.queue_autoplay)),
-                    disnake.ui.Select(
-                        placeholder="Mais opções:",
-                        custom_id="musicplayer_dropdown_inter",
-                        min_values=0, max_values=1, required = False,
-                        options=[
-                            disnake.SelectOption(
-                                label="Adicionar música", emoji="<:add_music:588172015760965654>",
-                                value=PlayerControls.add_song,
-                                description="Adicionar uma música/playlist na fila."
-                            ),
-                            disnake.SelectOption(
-                                label="Adicionar nos seus favoritos", emoji="💗",
-                                value=PlayerControls.add_favorite,
-                                description="Adicionar a música atual nos seus favoritos."
-                            ),
-                            disnake.SelectOption(
-                                label="Tocar do inicio", emoji="⏪",
-                                value=PlayerControls.seek_to_start,
-                                description="Voltar o tempo da música atual para o inicio."
-                            ),
-                            disnake.SelectOption(
-                                label=f"Volume: {self.volume}%", emoji="🔊",
-                                value=PlayerControls.volume,
-                                description="Ajustar volume."
-                            ),
-                            disnake.SelectOption(
-                                label="Misturar", emoji="🔀",
-                                value=PlayerControls.shuffle,
-                                description="Misturar as músicas da fila."
-                            ),
-                            disnake.SelectOption(
-                                label="Readicionar", emoji="🎶",
-                                value=PlayerControls.readd,
-                                description="Readicionar as músicas tocadas de volta na fila."
-                            ),
-                            disnake.SelectOption(
-                                label="Repetição", emoji="🔁",
-                                value=PlayerControls.loop_mode,
-                                description="Ativar/Desativar repetição da música/fila."
-                            ),
-                            disnake.SelectOption(
-                                label=("Desativar" if self.nightcore else "Ativar") + " o efeito nightcore", emoji="🇳",
-                                value=PlayerControls.nightcore,
-                                description="Efeito que aumenta velocidade e tom da música."
-                            ),
-                            disnake.SelectOption(
-                                label=("Desativar" if self.autoplay else "Ativar") + " a reprodução automática",
-                                emoji="🔄",
-                                value=PlayerControls.autoplay,
-                                description="Sistema de reprodução de música automática quando a fila tiver vazia."
-                            ),
-                            disnake.SelectOption(
-                                label="Last.fm scrobble", emoji="<:Lastfm:1278883704097341541>",
-                                value=PlayerControls.lastfm_scrobble,
-                                description="Ativar/desativar o scrobble/registro de músicas na sua conta do last.fm."
-                            ),
-                            disnake.SelectOption(
-                                label=("Desativar" if self.restrict_mode else "Ativar") + " o modo restrito",
-                                emoji="🔐",
-                                value=PlayerControls.restrict_mode,
-                                description="Apenas DJ's/Staff's podem usar comandos restritos."
-                            ),
-                        ]
-                    ),
-                ]
-
-                if self.static:
-                    if (queue := self.queue or self.queue_autoplay):
-                        data["components"].append(
-                            disnake.ui.Select(
-                                placeholder="Próximas músicas:",
-                                custom_id="musicplayer_queue_dropdown",
-                                min_values=0, max_values=1, required = False,
-                                options=[
-                                    disnake.SelectOption(
-                                        label=fix_characters(f"{n + 1}. {t.single_title}", 47),
-                                        description=fix_characters(f"[{time_format(t.duration) if not t.is_stream else '🔴 Live'}]. {t.authors_string}", 47),
-                                        value=f"{n:02d}.{t.title[:96]}"
-                                    ) for n, t in enumerate(itertools.islice(queue, 25))
-                                ]
-                            )
-                        )
-
-                if self.current.ytid and self.node.lyric_support:
-                    data["components"][5].options.append(
-                        disnake.SelectOption(
-                            label="Visualizar letras", emoji="📃",
-                            value=PlayerControls.lyrics,
-                            description="Obter letra da música atual."
-                        )
-                    )
-
-                if self.mini_queue_feature:
-                    data["components"][5].options.append(
-                        disnake.SelectOption(
-                            label="Mini-fila do player", emoji="<:music_queue:703761160679194734>",
-                            value=PlayerControls.miniqueue,
-                            description="Ativar/Desativar a mini-fila do player."
-                        )
-                    )
-
-                if isinstance(self.last_channel, disnake.VoiceChannel):
-                    data["components"][5].options.append(
-                        disnake.SelectOption(
-                            label="Status automático", emoji="📢",
-                            value=PlayerControls.set_voice_status,
-                            description="Configurar o status automático do canal de voz."
-                        )
-                    )
-
-                if not self.static and not self.has_thread:
-                    data["components"][5].options.append(
-                        disnake.SelectOption(
-                            label="Song-Request Thread", emoji="💬",
-                            value=PlayerControls.song_request_thread,
-                            description="Criar uma thread/conversa temporária para pedir músicas usando apenas o nome/link."
-                        )
-                    )
-
             self.updating = True
 
             if interaction:
@@ -2790,6 +2702,8 @@ class LavalinkPlayer(wavelink.Player):
                         except:
                             traceback.print_exc()
 
+                            self.last_render_hash = None
+
                             try:
                                 self.text_channel = self.bot.get_channel(self.text_channel.id) or await self.bot.fetch_channel(self.text_channel.id)
                             except (AttributeError, disnake.Forbidden, disnake.HTTPException):
@@ -2877,10 +2791,7 @@ class LavalinkPlayer(wavelink.Player):
 
     async def destroy_message(self):
 
-        try:
-            self.message_updater_task.cancel()
-        except:
-            pass
+        self.bot.controller_updater.stop(self)
 
         if self.static:
             return
@@ -2900,37 +2811,6 @@ class LavalinkPlayer(wavelink.Player):
         except AttributeError:
             return
 
-    async def message_updater(self):
-
-        while True:
-
-            if not self.text_channel or not self.controller_mode:
-                pass
-
-            elif self.auto_update and not self.current.is_stream:
-
-                await asyncio.sleep(self.auto_update)
-
-                try:
-                    await self.invoke_np()
-                except:
-                    traceback.print_exc()
-
-                continue
-
-            elif self.update:
-
-                try:
-                    await self.invoke_np()
-                except:
-                    traceback.print_exc()
-
-                self.update = False
-
-                await asyncio.sleep(5)
-
-            await asyncio.sleep(10)
-
     async def update_message(self, interaction: disnake.Interaction = None, force=False, rpc_update=False):
 
         if rpc_update:
@@ -2952,14 +2832,14 @@ class LavalinkPlayer(wavelink.Player):
 
             if self.skin_static.startswith("> custom_skin: "):
                 data = skin_converter(self.custom_skin_static_data[self.skin_static[15:]], player=self,
-                                      guild=self.guild)
+                                      guild=self.guild, skin_name=self.skin_static)
             else:
                 data = self.bot.pool.player_static_skins[self.skin_static].load(self)
 
         else:
             if self.skin.startswith("> custom_skin: "):
                 data = skin_converter(self.custom_skin_data[self.skin[15:]], player=self,
-                                      guild=self.guild)
+                                      guild=self.guild, skin_name=self.skin)
             else:
                 data = self.bot.pool.player_skins[self.skin].load(self)
 
@@ -2969,7 +2849,9 @@ class LavalinkPlayer(wavelink.Player):
 
             components = []
 
+            # os components das skins podem ser compartilhados entre players (ver player_components).
             for c in data.get("components", []):
+                c = deepcopy(c)
                 c.disabled = True
                 components.append(c)
 
@@ -3001,11 +2883,7 @@ class LavalinkPlayer(wavelink.Player):
         except:
             pass
 
-        try:
-            self.message_updater_task.cancel()
-        except:
-            pass
-        self.message_updater_task = None
+        self.bot.controller_updater.stop(self)
 
         try:
             self._new_node_task.cancel()
@@ -3250,9 +3128,21 @@ class LavalinkPlayer(wavelink.Player):
                             continue
                         search_queries.append(sp.replace("{title}", track.single_title).replace("{author}", ", ".join(track.authors)))
 
+            # músicas com isrc compartilham o mesmo resultado independente da plataforma de origem.
+            if isrc := track.info.get("isrc"):
+                cache_key = f"isrc:{isrc}"
+            else:
+                cache_key = f'{track.info["sourceName"]}:{track.author}-{track.single_title}'
+
+            cached_tracks = None if force else await self.bot.pool.partial_track_cache.fetch(cache_key)
+
+            if cached_tracks:
+                selected_track = cached_tracks[0]
+                search_queries = []
+
             for query in search_queries:
 
-                if not (result := self.bot.pool.partial_track_cache.get(f'{track.info["sourceName"]}:{track.author}-{track.single_title}')):
+                if not (result := await self.bot.pool.partial_track_cache.fetch(query)):
                     try:
                         result = (await self.node.get_tracks(query, track_cls=LavalinkTrack, playlist_cls=LavalinkPlaylist, check_title = 60 if query.startswith(("ytmsearch", "ytsearch", "scsearch")) else 75))
                     except Exception as e:
@@ -3281,7 +3171,7 @@ class LavalinkPlayer(wavelink.Player):
                     except AttributeError:
                         pass
 
-                    self.bot.pool.partial_track_cache[f'{track.info["sourceName"]}:{track.author}-{track.single_title}'] = tracks
+                    self.bot.pool.partial_track_cache[query] = result
 
                 try:
                     if result[0].info["sourceName"] == "bandcamp":
@@ -3318,6 +3208,9 @@ class LavalinkPlayer(wavelink.Player):
                         print("Falha ao resolver PartialTrack:\n" + "\n".join(repr(e) for e in exceptions))
                     return
 
+            if not cached_tracks:
+                self.bot.pool.partial_track_cache[cache_key] = [selected_track]
+
             track.id = selected_track.id
             track.info["id"] = selected_track.id
             track.info["length"] = selected_track.duration
@@ -3349,6 +3242,18 @@ class LavalinkPlayer(wavelink.Player):
         if self.node.is_available:
             return
 
+        if ignore_node != self.node and (remaining := self.node.resume_remaining):
+            # aguardar o resume da sessão (o player continua no servidor) antes de mover o player.
+            try:
+                await self.bot.wait_for("wavelink_node_resumed", check=lambda n: n == self.node, timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                return
+
+            if self.node.is_available:
+                return
+
         self.locked = True
 
         try:
@@ -3368,7 +3273,7 @@ class LavalinkPlayer(wavelink.Player):
 
             while True:
 
-                node = self.bot.music.get_best_node(ignore_node=ignore_node)
+                node = self.bot.music.get_best_node(ignore_node=ignore_node, guild_id=self.guild_id)
 
                 if not node:
                     await asyncio.sleep(5)
@@ -3429,11 +3334,13 @@ class LavalinkPlayer(wavelink.Player):
 
     async def _send_rpc_data(self, users: List[int], stats: dict):
 
+        users_data = await self.bot.get_many_global_data(users, db_name=DBModel.users)
+
         for u in users:
 
             stats["user"] = u
 
-            data = await self.bot.get_global_data(id_=u, db_name=DBModel.users)
+            data = users_data[str(u)]
 
             if self.bot.config["ENABLE_RPC_AUTH"] and not data["token"]:
                 continue
@@ -3829,4 +3736,10 @@ class CustomYTDL(YoutubeDL):
 
 
 def music_mode(bot: BotCore):
-    return wavelink.Client(bot=bot)
+    return wavelink.Client(
+        bot=bot, codec=bot.config["LAVALINK_JSON_CODEC"],
+        node_selector=wavelink.NodeSelector(
+            strategy=bot.config["LAVALINK_NODE_STRATEGY"], region=bot.config["LAVALINK_NODE_REGION"],
+            latency_weight=bot.config["LAVALINK_NODE_LATENCY_WEIGHT"]
+        )
+    )
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import itertools
+import operator
+from typing import Callable, Optional, TYPE_CHECKING
+
+import disnake
+from cachetools import LRUCache
+
+from utils.music.converters import fix_characters, time_format, get_button_style
+from utils.others import PlayerControls
+
+if TYPE_CHECKING:
+    from utils.music.models import LavalinkPlayer
+
+# components dos players que dependem apenas de poucos estados do player (pausado, volume, nightcore, etc) são
+# reaproveitados entre renderizações e players.
+# Aviso: os components retornados são compartilhados, não devem ser modificados (use uma cópia caso necessário).
+components_cache = LRUCache(maxsize=2048)
+
+
+def cached_components(key: tuple, builder: Callable[[], list]) -> list:
+
+    try:
+        components = components_cache[key]
+    except KeyError:
+        components = components_cache[key] = tuple(builder())
+
+    return list(components)
+
+
+def player_controls(
+        player: LavalinkPlayer, *, favorite: bool = True, mini_queue: bool = True, song_request_thread: bool = True,
+        autoplay_description: str = "Sistema de adição de música automática quando a fila estiver vazia."
+) -> list:
+    """Botões padrões + dropdown "Mais opções" do player."""
+
+    lyrics = bool(player.current.ytid and player.node.lyric_support)
+    mini_queue = mini_queue and player.mini_queue_feature
+    voice_status = isinstance(player.last_channel, disnake.VoiceChannel)
+
+    key = (
+        "player_controls", player.paused, player.volume, player.nightcore, player.autoplay, player.restrict_mode,
+        bool(player.queue or player.queue_autoplay), lyrics, mini_queue, voice_status, song_request_thread, favorite,
+        autoplay_description
+    )
+
+    def build():
+
+        options = [
+            disnake.SelectOption(
+                label="Adicionar música", emoji="<:add_music:588172015760965654>",
+                value=PlayerControls.add_song,
+                description="Adicionar uma música/playlist na fila."
+            ),
+        ]
+
+        if favorite:
+            options.append(
+                disnake.SelectOption(
+                    label="Adicionar nos seus favoritos", emoji="💗",
+                    value=PlayerControls.add_favorite,
+                    description="Adicionar a música atual nos seus favoritos."
+                )
+            )
+
+        options.extend([
+            disnake.SelectOption(
+                label="Tocar do inicio", emoji="⏪",
+                value=PlayerControls.seek_to_start,
+                description="Voltar o tempo da música atual para o inicio."
+            ),
+            disnake.SelectOption(
+                label=f"Volume: {player.volume}%", emoji="🔊",
+                value=PlayerControls.volume,
+                description="Ajustar volume."
+            ),
+            disnake.SelectOption(
+                label="Misturar", emoji="🔀",
+                value=PlayerControls.shuffle,
+                description="Misturar as músicas da fila."
+            ),
+            disnake.SelectOption(
+                label="Readicionar", emoji="🎶",
+                value=PlayerControls.readd,
+                description="Readicionar as músicas tocadas de volta na fila."
+            ),
+            disnake.SelectOption(
+                label="Repetição", emoji="🔁",
+                value=PlayerControls.loop_mode,
+                description="Ativar/Desativar repetição da música/fila."
+            ),
+            disnake.SelectOption(
+                label=("Desativar" if player.nightcore else "Ativar") + " o efeito nightcore", emoji="🇳",
+                value=PlayerControls.nightcore,
+                description="Efeito que aumenta velocidade e tom da música."
+            ),
+            disnake.SelectOption(
+                label=("Desativar" if player.autoplay else "Ativar") + " a reprodução automática", emoji="🔄",
+                value=PlayerControls.autoplay,
+                description=autoplay_description
+            ),
+            disnake.SelectOption(
+                label="Last.fm scrobble", emoji="<:Lastfm:1278883704097341541>",
+                value=PlayerControls.lastfm_scrobble,
+                description="Ativar/desativar o scrobble/registro de músicas na sua conta do last.fm."
+            ),
+            disnake.SelectOption(
+                label=("Desativar" if player.restrict_mode else "Ativar") + " o modo restrito", emoji="🔐",
+                value=PlayerControls.restrict_mode,
+                description="Apenas DJ's/Staff's podem usar comandos restritos."
+            ),
+        ])
+
+        if lyrics:
+            options.append(
+                disnake.SelectOption(
+                    label="Visualizar letras", emoji="📃",
+                    value=PlayerControls.lyrics,
+                    description="Obter letra da música atual."
+                )
+            )
+
+        if mini_queue:
+            options.append(
+                disnake.SelectOption(
+                    label="Mini-fila do player", emoji="<:music_queue:703761160679194734>",
+                    value=PlayerControls.miniqueue,
+                    description="Ativar/Desativar a mini-fila do player."
+                )
+            )
+
+        if voice_status:
+            options.append(
+                disnake.SelectOption(
+                    label="Status automático", emoji="📢",
+                    value=PlayerControls.set_voice_status,
+                    description="Configurar o status automático do canal de voz."
+                )
+            )
+
+        if song_request_thread:
+            options.append(
+                disnake.SelectOption(
+                    label="Song-Request Thread", emoji="💬",
+                    value=PlayerControls.song_request_thread,
+                    description="Criar uma thread/conversa temporária para pedir músicas usando apenas o nome/link."
+                )
+            )
+
+        return [
+            disnake.ui.Button(emoji="⏯️", custom_id=PlayerControls.pause_resume, style=get_button_style(player.paused)),
+            disnake.ui.Button(emoji="⏮️", custom_id=PlayerControls.back),
+            disnake.ui.Button(emoji="⏹️", custom_id=PlayerControls.stop),
+            disnake.ui.Button(emoji="⏭️", custom_id=PlayerControls.skip),
+            disnake.ui.Button(emoji="<:music_queue:703761160679194734>", custom_id=PlayerControls.queue,
+                              disabled=not (player.queue or player.queue_autoplay)),
+            disnake.ui.Select(
+                placeholder="Mais opções:",
+                custom_id="musicplayer_dropdown_inter",
+                min_values=0, max_values=1, required=False,
+                options=options
+            ),
+        ]
+
+    return cached_components(key, build)
+
+
+def queue_dropdown(player: LavalinkPlayer) -> Optional[disnake.ui.Select]:
+    """Dropdown "Próximas músicas" (refeito apenas quando as primeiras músicas da fila mudarem)."""
+
+    if not (queue := player.queue or player.queue_autoplay):
+        return
+
+    head = tuple(itertools.islice(queue, 25))
+
+    cached_head, select = player.queue_dropdown_cache
+
+    if cached_head is not None and len(cached_head) == len(head) and all(map(operator.is_, cached_head, head)):
+        return select
+
+    select = disnake.ui.Select(
+        placeholder="Próximas músicas:",
+        custom_id="musicplayer_queue_dropdown",
+        min_values=0, max_values=1, required=False,
+        options=[
+            disnake.SelectOption(
+                label=fix_characters(f"{n + 1}. {t.single_title}", 47),
+                description=fix_characters(f"[{time_format(t.duration) if not t.is_stream else '🔴 Live'}]. {t.authors_string}", 47),
+                value=f"{n:02d}.{t.title[:96]}"
+            ) for n, t in enumerate(head)
+        ]
+    )
+
+    player.queue_dropdown_cache = (head, select)
+
+    return select
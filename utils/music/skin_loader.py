@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+import sys
+import traceback
+from collections.abc import Mapping
+from importlib import import_module, invalidate_caches
+from typing import Dict, List, Optional, Tuple
+
+
+class SkinLoader(Mapping):
+    """Skins de uma pasta (normal_player/static_player) carregadas sob demanda.
+
+    Os arquivos são apenas listados ao iniciar e cada skin é importada no primeiro uso (``loader[nome]`` ou
+    ``nome in loader``). Ao percorrer o loader (keys/values/items) as skins ainda não carregadas são importadas e as
+    que falharem são ignoradas. Ao recarregar, apenas as skins com arquivos alterados (data de modificação/tamanho)
+    são importadas novamente.
+    """
+
+    def __init__(self, mode: str, ignore: Optional[List[str]] = None):
+        self.mode = mode
+        self.path = f"./utils/music/skins/{mode}"
+        self.ignore = set(ignore or [])
+        self.files: Dict[str, Tuple[int, int]] = {}
+        self.skins = {}
+        self.failed = set()
+        self.scan()
+
+    def scan(self) -> List[str]:
+        """Atualiza a lista de skins e retorna as skins novas/alteradas/removidas."""
+
+        files = {}
+
+        for entry in os.scandir(self.path):
+
+            if not entry.name.endswith(".py"):
+                continue
+
+            skin = entry.name[:-3]
+
+            if skin in self.ignore and skin != "default":
+                if skin not in self.files:
+                    print(f"Skin {skin}.py ignorada")
+                continue
+
+            stat = entry.stat()
+            files[skin] = (stat.st_mtime_ns, stat.st_size)
+
+        changed = [s for s in files if self.files.get(s) != files[s]] + [s for s in self.files if s not in files]
+
+        for skin in changed:
+            self.skins.pop(skin, None)
+            self.failed.discard(skin)
+            sys.modules.pop(f"utils.music.skins.{self.mode}.{skin}", None)
+
+        if changed:
+            # novos arquivos não seriam encontrados pelo import sem limpar o cache dos finders.
+            invalidate_caches()
+
+        self.files = files
+
+        return changed
+
+    def reload(self) -> List[str]:
+        return self.scan()
+
+    def __getitem__(self, skin: str):
+
+        try:
+            return self.skins[skin]
+        except KeyError:
+            pass
+
+        if skin not in self.files or skin in self.failed:
+            raise KeyError(skin)
+
+        try:
+            skin_file = import_module(f"utils.music.skins.{self.mode}.{skin}")
+            if not hasattr(skin_file, "load"):
+                print(f"Skin ignorada: {skin}.py | Função load() não configurada/encontrada...")
+                self.failed.add(skin)
+                raise KeyError(skin)
+            self.skins[skin] = skin_file.load()
+        except KeyError:
+            raise
+        except Exception:
+            print(f"Falha ao carregar skin [{self.mode}]: {traceback.format_exc()}")
+            self.failed.add(skin)
+            raise KeyError(skin)
+
+        return self.skins[skin]
+
+    def __iter__(self):
+        for skin in list(self.files):
+            try:
+                self[skin]
+            except KeyError:
+                continue
+            yield skin
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def previews(self) -> Dict[str, str]:
+        """Links de preview das skins carregadas com sucesso."""
+        return {name: skin.preview for name, skin in self.items()}
@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import hashlib
 import itertools
+import pickle
+import re
 from copy import deepcopy
 from typing import Optional, TYPE_CHECKING, Union
 
 import disnake
+from cachetools import LRUCache
 
 from utils.music.converters import fix_characters, time_format
 
@@ -13,225 +17,316 @@ if TYPE_CHECKING:
     from utils.others import CustomContext
     from utils.music.models import LavalinkPlayer
 
-def track_title_format(
-        track_title: str,
-        track_author: str,
-        track_url: str,
-        track_duration: Union[int, float],
-        data: str,
-        track_number: int = 0
-):
-
-    return data. \
-        replace('{track.title_25}', fix_characters(track_title, 25)). \
-        replace('{track.title_42}', fix_characters(track_title, 42)). \
-        replace('{track.title_58}', fix_characters(track_title, 58)). \
-        replace('{track.title}', track_title). \
-        replace('{track.url}', track_url). \
-        replace('{track.author}', track_author). \
-        replace('{track.duration}', time_format(track_duration) if track_duration else "🔴 Ao vivo"). \
-        replace('{track.number}', str(track_number))
-
-
-def replaces(
-    txt: str, info: dict, ctx: disnake.MessageInteraction, player: LavalinkPlayer, queue_text: str, track: dict,
-        guild: disnake.Guild
-):
-
-    if player:
+placeholder_regex = re.compile(r"(\{[a-z0-9_.]+\})")
 
-        try:
-            if not player.current.autoplay:
-                requester = guild.get_member(player.current.requester)
-                requester_global_name = requester.global_name
-                requester_display_name = requester.display_name
-                requester_mention = requester.mention
-                requester_avatar = requester.display_avatar.replace(static_format="png", size=512).url
-            else:
-                requester_global_name = "Recomendação"
-                requester_display_name = "Recomendação"
-                requester_mention = "Recomendação"
-                requester_avatar = guild.me.display_avatar.replace(static_format="png", size=512).url
-        except:
-            requester_global_name = "Desconhecido..."
-            requester_display_name = "Desconhecido..."
-            requester_mention = f"<@{player.current.requester}>"
-            requester_avatar = "https://i.ibb.co/LNpG5TM/unknown.png"
-
-        txt = track_title_format(
-            track_title=player.current.title,
-            track_author=player.current.author,
-            track_url=player.current.uri,
-            track_duration=player.current.duration if not player.current.is_stream else 0,
-            data=txt
-        ). \
-            replace('{track.thumb}', player.current.thumb). \
-            replace('{playlist.name}', player.current.playlist_name or "Sem playlist"). \
-            replace('{playlist.url}', player.current.playlist_url or player.controller_link). \
-            replace('{player.loop.mode}', 'Desativado' if not player.loop else 'Música atual' if player.loop == "current" else "Fila"). \
-            replace('{player.queue.size}', str(len(player.queue or player.queue_autoplay))). \
-            replace('{player.volume}', str(player.volume)). \
-            replace('{player.autoplay}', "Ativado" if player.autoplay else "Desativado"). \
-            replace('{player.nightcore}', "Ativado" if player.nightcore else "Desativado"). \
-            replace('{player.hint}', player.current_hint). \
-            replace('{player.log.text}', player.command_log or "Sem registro."). \
-            replace('{player.log.emoji}', player.command_log_emoji or ""). \
-            replace('{requester.global_name}', requester_global_name). \
-            replace('{requester.display_name}', requester_display_name). \
-            replace('{requester.mention}', requester_mention). \
-            replace('{requester.avatar}', requester_avatar). \
-            replace('{guild.color}', hex(guild.me.color.value)[2:]). \
-            replace('{guild.icon}', guild.icon.with_static_format("png").url if guild.icon else ""). \
-            replace('{guild.name}', guild.name). \
-            replace('{guild.id}', str(guild.id)). \
-            replace('{queue_format}', queue_text or "Fila vazia...")
-
-    else:
-
-        queue_max_entries = info.pop("queue_max_entries", 3) or 3
-
-        c = ctx.bot.get_color(guild.me)
+preview_track = {
+    'title': 'Sekai - Burn Me Down [NCS Release]',
+    'author': "NoCopyrightSounds",
+    'url': "https://www.youtube.com/watch?v=2vFA0HL9kTk",
+    'duration': 215000
+}
+
+# skins customizadas já compiladas: (id do servidor, nome da skin, hash da skin) -> CompiledSkin
+compiled_skins = LRUCache(maxsize=1000)
+
+
+class SkinTemplate:
+    """Texto da skin convertido para str.format (apenas com os placeholders usados no texto) para renderizar em uma
+    única passada."""
+
+    __slots__ = ("text", "fmt", "placeholders")
+
+    def __init__(self, text: str):
+        parts = placeholder_regex.split(text)
+        self.text = text
+        self.placeholders = tuple(parts[1::2])
+        self.fmt = "".join(
+            f"{{{n // 2}}}" if n % 2 else p.replace("{", "{{").replace("}", "}}") for n, p in enumerate(parts)
+        )
+
+    def render(self, values: dict) -> str:
+        if not self.placeholders:
+            return self.text
+        return self.fmt.format(*map(values.__getitem__, self.placeholders))
 
+
+class TrackValues(dict):
+    """Valores dos placeholders calculados apenas quando usados pela skin (e apenas uma vez por renderização).
+
+    Placeholders desconhecidos permanecem no texto."""
+
+    resolvers = {
+        '{track.title_25}': lambda v: fix_characters(v.title, 25),
+        '{track.title_42}': lambda v: fix_characters(v.title, 42),
+        '{track.title_58}': lambda v: fix_characters(v.title, 58),
+        '{track.title}': lambda v: v.title,
+        '{track.url}': lambda v: v.url,
+        '{track.author}': lambda v: v.author,
+        '{track.duration}': lambda v: time_format(v.duration) if v.duration else "🔴 Ao vivo",
+        '{track.number}': lambda v: str(v.number),
+    }
+
+    def __init__(self, title: str, author: str, url: str, duration: Union[int, float], number: int = 0):
+        super().__init__()
+        self.title = title
+        self.author = author
+        self.url = url
+        self.duration = duration
+        self.number = number
+
+    def __missing__(self, key: str) -> str:
         try:
-            color = c.value
-        except AttributeError:
-            color = c
-
-        txt = track_title_format(
-            track_title=track['title'],
-            track_author=track['author'],
-            track_url=track['url'],
-            track_duration=track['duration'],
-            data=txt
-        ). \
-            replace('{track.thumb}', "https://img.youtube.com/vi/2vFA0HL9kTk/mqdefault.jpg"). \
-            replace('{playlist.name}', "🎵 DV 🎶"). \
-            replace('{playlist.url}', "https://www.youtube.com/playlist?list=PLKlXSJdWVVAD3iztmL2vFVrwA81sRkV7n"). \
-            replace('{player.loop.mode}', "Música Atual"). \
-            replace('{player.queue.size}', f"{queue_max_entries}"). \
-            replace('{player.volume}', "100"). \
-            replace('{player.autoplay}', "Ativado"). \
-            replace('{player.nightcore}', "Ativado"). \
-            replace('{player.log.emoji}', "⏭️"). \
-            replace('{player.log.text}', f"{ctx.author} pulou a música."). \
-            replace('{requester.global_name}', ctx.author.global_name). \
-            replace('{requester.display_name}', ctx.author.display_name). \
-            replace('{requester.mention}', ctx.author.mention). \
-            replace('{requester.avatar}', ctx.author.display_avatar.with_static_format("png").url). \
-            replace('{guild.color}', hex(color)[2:]). \
-            replace('{guild.icon}', guild.icon.with_static_format("png").url if guild.icon else ""). \
-            replace('{guild.name}', guild.name). \
-            replace('{guild.id}', str(guild.id)). \
-            replace('{queue_format}', queue_text or "(Sem músicas).")
-
-    return txt
-
-
-def skin_converter(info: dict, guild: disnake.Guild, ctx: Union[CustomContext, disnake.ModalInteraction] = None, player: Optional[LavalinkPlayer] = None) -> dict:
-
-    info = deepcopy(info)
+            resolver = self.resolvers[key]
+        except KeyError:
+            value = key
+        else:
+            value = resolver(self)
+        self[key] = value
+        return value
+
+
+def _requester_data(player: LavalinkPlayer, guild: disnake.Guild):
 
     try:
-        if len(str(info["queue_max_entries"])) > 2:
-            info["queue_max_entries"] = 7
+        if not player.current.autoplay:
+            requester = guild.get_member(player.current.requester)
+            return requester.global_name, requester.display_name, requester.mention, \
+                requester.display_avatar.replace(static_format="png", size=512).url
+        return "Recomendação", "Recomendação", "Recomendação", \
+            guild.me.display_avatar.replace(static_format="png", size=512).url
     except:
-        pass
-
-    queue_max_entries = info.pop("queue_max_entries", 7)
-    if len(str(queue_max_entries)) > 2:
-        queue_max_entries = 7
-
-    track = {}
-    queue_format = info.pop("queue_format", "")
-
-    controller_enabled = info.pop("controller_enabled", True)
-
-    if not isinstance(queue_format, str):
-        queue_text = ""
-    elif player:
-        player.controller_mode = controller_enabled
-        queue_text = "\n".join(track_title_format(
-            track_title=t.title,
-            track_author=t.author,
-            track_url=t.uri,
-            track_duration=t.duration,
-            data=queue_format,
-            track_number=n + 1
-        ) for n, t in enumerate(itertools.islice(player.queue or player.queue_autoplay, queue_max_entries)))
-    else:
-        track = {
-            'title': 'Sekai - Burn Me Down [NCS Release]',
-            'author': "NoCopyrightSounds",
-            'url': "https://www.youtube.com/watch?v=2vFA0HL9kTk",
-            'duration': 215000
-        }
-        queue_text = "\n".join(track_title_format(
-            track_title=t['title'],
-            track_author=t['author'],
-            track_url=t['url'],
-            track_duration=t['duration'],
-            data=queue_format,
-            track_number=n + 1
-        ) for n, t in enumerate([track] * queue_max_entries))
+        return "Desconhecido...", "Desconhecido...", f"<@{player.current.requester}>", \
+            "https://i.ibb.co/LNpG5TM/unknown.png"
+
+
+class PlayerSkinValues(TrackValues):
+
+    resolvers = dict(TrackValues.resolvers, **{
+        '{track.thumb}': lambda v: v.player.current.thumb,
+        '{playlist.name}': lambda v: v.player.current.playlist_name or "Sem playlist",
+        '{playlist.url}': lambda v: v.player.current.playlist_url or v.player.controller_link,
+        '{player.loop.mode}': lambda v: 'Desativado' if not v.player.loop else 'Música atual' if v.player.loop == "current" else "Fila",
+        '{player.queue.size}': lambda v: str(len(v.player.queue or v.player.queue_autoplay)),
+        '{player.volume}': lambda v: str(v.player.volume),
+        '{player.autoplay}': lambda v: "Ativado" if v.player.autoplay else "Desativado",
+        '{player.nightcore}': lambda v: "Ativado" if v.player.nightcore else "Desativado",
+        '{player.hint}': lambda v: v.player.current_hint,
+        '{player.log.text}': lambda v: v.player.command_log or "Sem registro.",
+        '{player.log.emoji}': lambda v: v.player.command_log_emoji or "",
+        '{requester.global_name}': lambda v: v.requester[0],
+        '{requester.display_name}': lambda v: v.requester[1],
+        '{requester.mention}': lambda v: v.requester[2],
+        '{requester.avatar}': lambda v: v.requester[3],
+        '{guild.color}': lambda v: hex(v.guild.me.color.value)[2:],
+        '{guild.icon}': lambda v: v.guild.icon.with_static_format("png").url if v.guild.icon else "",
+        '{guild.name}': lambda v: v.guild.name,
+        '{guild.id}': lambda v: str(v.guild.id),
+        '{queue_format}': lambda v: v.skin.queue_text(v.player) or "Fila vazia...",
+    })
+
+    def __init__(self, skin: CompiledSkin, player: LavalinkPlayer, guild: disnake.Guild):
+        current = player.current
+        super().__init__(title=current.title, author=current.author, url=current.uri,
+                         duration=current.duration if not current.is_stream else 0)
+        self.skin = skin
+        self.player = player
+        self.guild = guild
+        self._requester = None
+
+    @property
+    def requester(self):
+        if self._requester is None:
+            self._requester = _requester_data(self.player, self.guild)
+        return self._requester
+
+
+def _preview_color(v: PreviewSkinValues):
+
+    c = v.ctx.bot.get_color(v.guild.me)
 
     try:
-        if info["content"]:
-            info["content"] = replaces(info["content"], info=info, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-    except KeyError:
-        pass
+        color = c.value
+    except AttributeError:
+        color = c
+
+    return hex(color)[2:]
+
+
+class PreviewSkinValues(TrackValues):
+
+    resolvers = dict(TrackValues.resolvers, **{
+        '{track.thumb}': lambda v: "https://img.youtube.com/vi/2vFA0HL9kTk/mqdefault.jpg",
+        '{playlist.name}': lambda v: "🎵 DV 🎶",
+        '{playlist.url}': lambda v: "https://www.youtube.com/playlist?list=PLKlXSJdWVVAD3iztmL2vFVrwA81sRkV7n",
+        '{player.loop.mode}': lambda v: "Música Atual",
+        '{player.queue.size}': lambda v: "3",
+        '{player.volume}': lambda v: "100",
+        '{player.autoplay}': lambda v: "Ativado",
+        '{player.nightcore}': lambda v: "Ativado",
+        '{player.log.emoji}': lambda v: "⏭️",
+        '{player.log.text}': lambda v: f"{v.ctx.author} pulou a música.",
+        '{requester.global_name}': lambda v: v.ctx.author.global_name,
+        '{requester.display_name}': lambda v: v.ctx.author.display_name,
+        '{requester.mention}': lambda v: v.ctx.author.mention,
+        '{requester.avatar}': lambda v: v.ctx.author.display_avatar.with_static_format("png").url,
+        '{guild.color}': _preview_color,
+        '{guild.icon}': lambda v: v.guild.icon.with_static_format("png").url if v.guild.icon else "",
+        '{guild.name}': lambda v: v.guild.name,
+        '{guild.id}': lambda v: str(v.guild.id),
+        '{queue_format}': lambda v: v.skin.queue_text() or "(Sem músicas).",
+    })
+
+    def __init__(self, skin: CompiledSkin, ctx: Union[CustomContext, disnake.ModalInteraction], guild: disnake.Guild):
+        super().__init__(title=preview_track['title'], author=preview_track['author'], url=preview_track['url'],
+                         duration=preview_track['duration'])
+        self.skin = skin
+        self.ctx = ctx
+        self.guild = guild
+
+
+class EmbedTemplate:
+
+    embed_paths = (
+        ("description",),
+        ("footer", "text"),
+        ("footer", "icon_url"),
+        ("author", "name"),
+        ("author", "url"),
+        ("author", "icon_url"),
+        ("image", "url"),
+        ("thumbnail", "url"),
+    )
+
+    def __init__(self, data: dict):
+
+        self.data = data
+        self.templates = []
+        self.color = None
+
+        for path in self.embed_paths:
+            try:
+                value = data[path[0]] if len(path) == 1 else data[path[0]][path[1]]
+            except (KeyError, TypeError):
+                continue
+            if isinstance(value, str):
+                self.templates.append((path, SkinTemplate(value)))
 
-    if embeds := info.get("embeds"):
+        for n, f in enumerate(data.get("fields", [])):
+            self.templates.append((("fields", n, "name"), SkinTemplate(f["name"])))
+            self.templates.append((("fields", n, "value"), SkinTemplate(f["value"])))
 
-        for d in embeds:
-            try:
-                d["description"] = replaces(d["description"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-            except KeyError:
-                pass
+        if isinstance(data.get("color"), str):
+            self.color = SkinTemplate(data["color"])
 
-            try:
-                d["footer"]["text"] = replaces(d["footer"]["text"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-            except KeyError:
-                pass
+    def render(self, values: dict) -> disnake.Embed:
 
-            try:
-                d["footer"]["icon_url"] = replaces(d["footer"]["icon_url"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-            except KeyError:
-                pass
+        # cópia apenas dos níveis editados (o Embed mantém referência dos dicts recebidos).
+        embed = {
+            k: dict(v) if isinstance(v, dict) else [dict(f) for f in v] if k == "fields" else v
+            for k, v in self.data.items()
+        }
 
-            try:
-                d["author"]["name"] = replaces(d["author"]["name"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-            except KeyError:
-                pass
+        for path, template in self.templates:
+            target = embed
+            for k in path[:-1]:
+                target = target[k]
+            target[path[-1]] = template.render(values)
 
-            try:
-                d["author"]["url"] = replaces(d["author"]["url"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-            except KeyError:
-                pass
+        if self.color:
+            embed["color"] = int(self.color.render(values), 16)
 
-            try:
-                d["author"]["icon_url"] = replaces(d["author"]["icon_url"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-            except KeyError:
-                pass
+        return disnake.Embed.from_dict(embed)
 
-            try:
-                d["image"]["url"] = replaces(d["image"]["url"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-            except KeyError:
-                pass
 
-            try:
-                d["thumbnail"]["url"] = replaces(d["thumbnail"]["url"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-            except KeyError:
-                pass
+class CompiledSkin:
+    """Skin customizada processada uma única vez (apenas os placeholders usados em cada texto são avaliados ao renderizar)."""
 
-            for n, f in enumerate(d.get("fields", [])):
-                f["name"] = replaces(f["name"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
-                f["value"] = replaces(f["value"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild)
+    def __init__(self, info: dict):
 
-            try:
-                d["color"] = int(replaces(d["color"], info=d, ctx=ctx, player=player, queue_text=queue_text, track=track, guild=guild), 16)
-            except (KeyError, AttributeError):
-                pass
+        info = deepcopy(info)
+
+        try:
+            if len(str(info["queue_max_entries"])) > 2:
+                info["queue_max_entries"] = 7
+        except:
+            pass
+
+        self.queue_max_entries = info.pop("queue_max_entries", 7)
+        if len(str(self.queue_max_entries)) > 2:
+            self.queue_max_entries = 7
+
+        queue_format = info.pop("queue_format", "")
+        self.queue_format = SkinTemplate(queue_format) if isinstance(queue_format, str) else None
+
+        self.controller_enabled = info.pop("controller_enabled", True)
+
+        self.has_content = "content" in info
+        self.content = info.pop("content", None)
+        self.content_template = SkinTemplate(self.content) if self.content else None
+
+        self.embeds = [EmbedTemplate(e) for e in info.pop("embeds")] if info.get("embeds") else None
+
+        self.extra = info
+
+    def queue_text(self, player: Optional[LavalinkPlayer] = None) -> str:
+
+        if not self.queue_format:
+            return ""
+
+        if player:
+            return "\n".join(self.queue_format.render(TrackValues(
+                title=t.title, author=t.author, url=t.uri, duration=t.duration, number=n + 1
+            )) for n, t in enumerate(itertools.islice(player.queue or player.queue_autoplay, self.queue_max_entries)))
+
+        return "\n".join(self.queue_format.render(TrackValues(
+            title=preview_track['title'], author=preview_track['author'], url=preview_track['url'],
+            duration=preview_track['duration'], number=n + 1
+        )) for n in range(self.queue_max_entries))
+
+    def render(self, guild: disnake.Guild, ctx: Union[CustomContext, disnake.ModalInteraction] = None,
+               player: Optional[LavalinkPlayer] = None) -> dict:
+
+        if player:
+            if self.queue_format:
+                player.controller_mode = self.controller_enabled
+            values = PlayerSkinValues(self, player=player, guild=guild)
+        else:
+            values = PreviewSkinValues(self, ctx=ctx, guild=guild)
+
+        data = deepcopy(self.extra) if self.extra else {}
+
+        if self.has_content:
+            data["content"] = self.content_template.render(values) if self.content_template else self.content
+
+        if self.embeds is not None:
+            data["embeds"] = [e.render(values) for e in self.embeds]
+
+        return data
+
+
+def skin_hash(info: dict) -> str:
+    return hashlib.blake2b(pickle.dumps(info), digest_size=16).hexdigest()
+
+
+def compile_skin(info: dict, guild_id: Optional[int] = None, skin_name: Optional[str] = None) -> CompiledSkin:
+
+    if skin_name is None:
+        return CompiledSkin(info)
+
+    key = (guild_id, skin_name, skin_hash(info))
+
+    try:
+        return compiled_skins[key]
+    except KeyError:
+        compiled = compiled_skins[key] = CompiledSkin(info)
+        return compiled
+
+
+def invalidate_compiled_skins(guild_id: int, skin_name: Optional[str] = None):
+    for key in [k for k in compiled_skins if k[0] == guild_id and (skin_name is None or k[1] == skin_name)]:
+        compiled_skins.pop(key, None)
 
-        info["embeds"] = [disnake.Embed.from_dict(e) for e in embeds]
 
-    return info
+def skin_converter(info: dict, guild: disnake.Guild, ctx: Union[CustomContext, disnake.ModalInteraction] = None,
+                   player: Optional[LavalinkPlayer] = None, skin_name: Optional[str] = None) -> dict:
+    return compile_skin(info, guild_id=guild.id, skin_name=skin_name).render(guild=guild, ctx=ctx, player=player)
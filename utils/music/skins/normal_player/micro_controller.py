@@ -5,6 +5,7 @@ import disnake
 
 from utils.music.converters import fix_characters, get_button_style, music_source_image
 from utils.music.models import LavalinkPlayer
+from utils.music.player_components import cached_components
 from utils.others import PlayerControls
 
 
@@ -61,14 +62,16 @@ class MicroController:
 
         data["embeds"].append(embed)
 
-        data["components"] = [
+        has_queue = bool(player.queue or player.queue_autoplay)
+
+        data["components"] = cached_components((self, player.paused, has_queue), lambda: [
             disnake.ui.Button(emoji="⏯️", label="Retomar" if player.paused else "Pausar", custom_id=PlayerControls.pause_resume, style=get_button_style(player.paused)),
             disnake.ui.Button(emoji="⏮️", label="Voltar", custom_id=PlayerControls.back),
             disnake.ui.Button(emoji="⏹️", label="Parar", custom_id=PlayerControls.stop, style=disnake.ButtonStyle.red),
             disnake.ui.Button(emoji="⏭️", label="Pular", custom_id=PlayerControls.skip),
-            disnake.ui.Button(emoji="<:music_queue:703761160679194734>", label="Fila", custom_id=PlayerControls.queue,disabled=not (player.queue or player.queue_autoplay)),
+            disnake.ui.Button(emoji="<:music_queue:703761160679194734>", label="Fila", custom_id=PlayerControls.queue,disabled=not has_queue),
             disnake.ui.Button(emoji="💗", label="Adicionar nos seus favoritos", custom_id=PlayerControls.add_favorite),
-        ]
+        ])
 
         return data
 
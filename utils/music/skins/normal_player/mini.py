@@ -4,9 +4,9 @@ from os.path import basename
 
 import disnake
 
-from utils.music.converters import time_format, fix_characters, get_button_style, music_source_image
+from utils.music.converters import time_format, fix_characters, music_source_image
 from utils.music.models import LavalinkPlayer
-from utils.others import PlayerControls
+from utils.music.player_components import player_controls
 
 
 class MiniSkin:
@@ -102,112 +102,7 @@ class MiniSkin:
 
         data["embeds"] = [embed_queue, embed] if embed_queue else [embed]
 
-        data["components"] = [
-            disnake.ui.Button(emoji="⏯️", custom_id=PlayerControls.pause_resume, style=get_button_style(player.paused)),
-            disnake.ui.Button(emoji="⏮️", custom_id=PlayerControls.back),
-            disnake.ui.Button(emoji="⏹️", custom_id=PlayerControls.stop),
-            disnake.ui.Button(emoji="⏭️", custom_id=PlayerControls.skip),
-            disnake.ui.Button(emoji="<:music_queue:703761160679194734>", custom_id=PlayerControls.queue, disabled=not (player.queue or player.queue_autoplay)),
-            disnake.ui.Select(
-                placeholder="Mais opções:",
-                custom_id="musicplayer_dropdown_inter",
-                min_values=0, max_values=1, required = False,
-                options=[
-                    disnake.SelectOption(
-                        label="Adicionar música", emoji="<:add_music:588172015760965654>",
-                        value=PlayerControls.add_song,
-                        description="Adicionar uma música/playlist na fila."
-                    ),
-                    disnake.SelectOption(
-                        label="Adicionar nos seus favoritos", emoji="💗",
-                        value=PlayerControls.add_favorite,
-                        description="Adicionar a música atual nos seus favoritos."
-                    ),
-                    disnake.SelectOption(
-                        label="Tocar do inicio", emoji="⏪",
-                        value=PlayerControls.seek_to_start,
-                        description="Voltar o tempo da música atual para o inicio."
-                    ),
-                    disnake.SelectOption(
-                        label=f"Volume: {player.volume}%", emoji="🔊",
-                        value=PlayerControls.volume,
-                        description="Ajustar volume."
-                    ),
-                    disnake.SelectOption(
-                        label="Misturar", emoji="🔀",
-                        value=PlayerControls.shuffle,
-                        description="Misturar as músicas da fila."
-                    ),
-                    disnake.SelectOption(
-                        label="Readicionar", emoji="🎶",
-                        value=PlayerControls.readd,
-                        description="Readicionar as músicas tocadas de volta na fila."
-                    ),
-                    disnake.SelectOption(
-                        label="Repetição", emoji="🔁",
-                        value=PlayerControls.loop_mode,
-                        description="Ativar/Desativar repetição da música/fila."
-                    ),
-                    disnake.SelectOption(
-                        label=("Desativar" if player.nightcore else "Ativar") + " o efeito nightcore", emoji="🇳",
-                        value=PlayerControls.nightcore,
-                        description="Efeito que aumenta velocidade e tom da música."
-                    ),
-                    disnake.SelectOption(
-                        label=("Desativar" if player.autoplay else "Ativar") + " a reprodução automática", emoji="🔄",
-                        value=PlayerControls.autoplay,
-                        description="Sistema de adição de música automática quando a fila estiver vazia."
-                    ),
-                    disnake.SelectOption(
-                        label="Last.fm scrobble", emoji="<:Lastfm:1278883704097341541>",
-                        value=PlayerControls.lastfm_scrobble,
-                        description="Ativar/desativar o scrobble/registro de músicas na sua conta do last.fm."
-                    ),
-                    disnake.SelectOption(
-                        label= ("Desativar" if player.restrict_mode else "Ativar") + " o modo restrito", emoji="🔐",
-                        value=PlayerControls.restrict_mode,
-                        description="Apenas DJ's/Staff's podem usar comandos restritos."
-                    ),
-                ]
-            ),
-        ]
-
-        if player.current.ytid and player.node.lyric_support:
-            data["components"][5].options.append(
-                disnake.SelectOption(
-                    label= "Visualizar letras", emoji="📃",
-                    value=PlayerControls.lyrics,
-                    description="Obter letra da música atual."
-                )
-            )
-
-
-        if player.mini_queue_feature:
-            data["components"][5].options.append(
-                disnake.SelectOption(
-                    label="Mini-fila do player", emoji="<:music_queue:703761160679194734>",
-                    value=PlayerControls.miniqueue,
-                    description="Ativar/Desativar a mini-fila do player."
-                )
-            )
-
-        if isinstance(player.last_channel, disnake.VoiceChannel):
-            data["components"][5].options.append(
-                disnake.SelectOption(
-                    label="Status automático", emoji="📢",
-                    value=PlayerControls.set_voice_status,
-                    description="Configurar o status automático do canal de voz."
-                )
-            )
-
-        if not player.has_thread:
-            data["components"][5].options.append(
-                disnake.SelectOption(
-                    label="Song-Request Thread", emoji="💬",
-                    value=PlayerControls.song_request_thread,
-                    description="Criar uma thread/conversa temporária para pedir músicas usando apenas o nome/link."
-                )
-            )
+        data["components"] = player_controls(player, song_request_thread=not player.has_thread)
 
         return data
 
@@ -5,6 +5,7 @@ import disnake
 
 from utils.music.converters import fix_characters, get_button_style, music_source_image
 from utils.music.models import LavalinkPlayer
+from utils.music.player_components import cached_components
 from utils.others import PlayerControls
 
 
@@ -64,13 +65,13 @@ class MiniPlayer:
 
         data["embeds"].append(embed)
 
-        data["components"] = [
+        data["components"] = cached_components((self, player.paused), lambda: [
             disnake.ui.Button(emoji="<:playpause:1000648043529519144>", custom_id=PlayerControls.pause_resume, style=get_button_style(player.paused)),
             disnake.ui.Button(emoji="<:backward:938437126532517928>", custom_id=PlayerControls.back),
             disnake.ui.Button(emoji="<:stop:923282526322184212>", custom_id=PlayerControls.stop, style=disnake.ButtonStyle.red),
             disnake.ui.Button(emoji="<:skip:955164528595857488>", custom_id=PlayerControls.skip),
             disnake.ui.Button(emoji="🤍", custom_id=PlayerControls.add_favorite),
-        ]
+        ])
 
         return data
 
@@ -5,9 +5,9 @@ from os.path import basename
 
 import disnake
 
-from utils.music.converters import time_format, fix_characters, get_button_style
+from utils.music.converters import time_format, fix_characters
 from utils.music.models import LavalinkPlayer
-from utils.others import PlayerControls
+from utils.music.player_components import player_controls, queue_dropdown
 
 
 class EmbedLinkStaticSkin:
@@ -105,106 +105,11 @@ class EmbedLinkStaticSkin:
         data = {
             "content": txt,
             "embeds": [],
-            "components": [
-                disnake.ui.Button(emoji="⏯️", custom_id=PlayerControls.pause_resume, style=get_button_style(player.paused)),
-                disnake.ui.Button(emoji="⏮️", custom_id=PlayerControls.back),
-                disnake.ui.Button(emoji="⏹️", custom_id=PlayerControls.stop),
-                disnake.ui.Button(emoji="⏭️", custom_id=PlayerControls.skip),
-                disnake.ui.Button(emoji="<:music_queue:703761160679194734>", custom_id=PlayerControls.queue, disabled=not (player.queue or player.queue_autoplay)),
-                disnake.ui.Select(
-                    placeholder="Mais opções:",
-                    custom_id="musicplayer_dropdown_inter",
-                    min_values=0, max_values=1, required = False,
-                    options=[
-                        disnake.SelectOption(
-                            label="Adicionar música", emoji="<:add_music:588172015760965654>",
-                            value=PlayerControls.add_song,
-                            description="Adicionar uma música/playlist na fila."
-                        ),
-                        disnake.SelectOption(
-                            label="Tocar do inicio", emoji="⏪",
-                            value=PlayerControls.seek_to_start,
-                            description="Voltar o tempo da música atual para o inicio."
-                        ),
-                        disnake.SelectOption(
-                            label=f"Volume: {player.volume}%", emoji="🔊",
-                            value=PlayerControls.volume,
-                            description="Ajustar volume."
-                        ),
-                        disnake.SelectOption(
-                            label="Misturar", emoji="🔀",
-                            value=PlayerControls.shuffle,
-                            description="Misturar as músicas da fila."
-                        ),
-                        disnake.SelectOption(
-                            label="Readicionar", emoji="🎶",
-                            value=PlayerControls.readd,
-                            description="Readicionar as músicas tocadas de volta na fila."
-                        ),
-                        disnake.SelectOption(
-                            label="Repetição", emoji="🔁",
-                            value=PlayerControls.loop_mode,
-                            description="Ativar/Desativar repetição da música/fila."
-                        ),
-                        disnake.SelectOption(
-                            label=("Desativar" if player.nightcore else "Ativar") + " o efeito nightcore", emoji="🇳",
-                            value=PlayerControls.nightcore,
-                            description="Efeito que aumenta velocidade e tom da música."
-                        ),
-                        disnake.SelectOption(
-                            label=("Desativar" if player.autoplay else "Ativar") + " a reprodução automática", emoji="🔄",
-                            value=PlayerControls.autoplay,
-                            description="Sistema de adição de música automática quando a fila estiver vazia."
-                        ),
-                        disnake.SelectOption(
-                            label="Last.fm scrobble", emoji="<:Lastfm:1278883704097341541>",
-                            value=PlayerControls.lastfm_scrobble,
-                            description="Ativar/desativar o scrobble/registro de músicas na sua conta do last.fm."
-                        ),
-                        disnake.SelectOption(
-                            label=("Desativar" if player.restrict_mode else "Ativar") + " o modo restrito", emoji="🔐",
-                            value=PlayerControls.restrict_mode,
-                            description="Apenas DJ's/Staff's podem usar comandos restritos."
-                        ),
-                    ]
-                ),
-            ]
+            "components": player_controls(player, favorite=False, mini_queue=False, song_request_thread=False)
         }
 
-        if (queue:=player.queue or player.queue_autoplay):
-            data["components"].append(
-                disnake.ui.Select(
-                    placeholder="Próximas músicas:",
-                    custom_id="musicplayer_queue_dropdown",
-                    min_values=0, max_values=1, required = False,
-                    options=[
-                        disnake.SelectOption(
-                            label=fix_characters(f"{n+1}. {t.single_title}", 47),
-                            description=fix_characters(f"[{time_format(t.duration) if not t.is_stream else '🔴 Live'}]. {t.authors_string}", 47),
-                            value=f"{n:02d}.{t.title[:96]}"
-                        ) for n, t in enumerate(itertools.islice(queue, 25))
-                    ]
-                )
-            )
-
-        if player.current.ytid and player.node.lyric_support:
-            data["components"][5].options.append(
-                disnake.SelectOption(
-                    label= "Visualizar letras", emoji="📃",
-                    value=PlayerControls.lyrics,
-                    description="Obter letra da música atual."
-                )
-            )
-
-
-        if isinstance(player.last_channel, disnake.VoiceChannel):
-            data["components"][5].options.append(
-                disnake.SelectOption(
-                    label="Status automático", emoji="📢",
-                    value=PlayerControls.set_voice_status,
-                    description="Configurar o status automático do canal de voz."
-                )
-            )
+        if dropdown := queue_dropdown(player):
+            data["components"].append(dropdown)
 
         return data
 
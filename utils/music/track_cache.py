@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+import pickle
+import sqlite3
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from cachetools import TTLCache
+
+
+class PersistentTrackCache:
+    """Cache das músicas resolvidas (spotify/deezer/etc -> lavalink) salvo em disco (sqlite).
+
+    As consultas recentes ficam na memória (TTLCache) e apenas as entradas alteradas são gravadas
+    no arquivo (compartilhado entre todos os bots/processos que usam a mesma pasta), removendo as
+    entradas expiradas e as menos acessadas ao exceder o limite de entradas.
+    """
+
+    def __init__(self, path: str = "./local_database/track_cache.sqlite", maxsize: int = 1000,
+                 max_entries: int = 50000, ttl: int = 80400):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.dirty = {}
+        self.touched = set()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="track_cache")
+        self._connect: Optional[sqlite3.Connection] = None
+        self.flush_lock: Optional[asyncio.Lock] = None
+
+    def connection(self) -> sqlite3.Connection:
+
+        if self._connect:
+            return self._connect
+
+        directory = os.path.dirname(self.path)
+
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self._connect = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._connect.execute("PRAGMA journal_mode=WAL")
+        self._connect.execute("PRAGMA synchronous=NORMAL")
+        self._connect.execute(
+            "CREATE TABLE IF NOT EXISTS tracks ("
+            "key TEXT PRIMARY KEY, data BLOB NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connect.execute("CREATE INDEX IF NOT EXISTS tracks_accessed_at ON tracks (accessed_at)")
+        self._connect.commit()
+        return self._connect
+
+    def load(self):
+        # carregar na memória as entradas acessadas mais recentemente.
+        try:
+            rows = self.connection().execute(
+                "SELECT key, data FROM tracks WHERE expires_at > ? ORDER BY accessed_at DESC LIMIT ?",
+                (time.time(), self.memory.maxsize)
+            ).fetchall()
+        except Exception:
+            traceback.print_exc()
+            return
+
+        for key, data in rows:
+            try:
+                self.memory[key] = pickle.loads(data)
+            except Exception:
+                continue
+
+    def _read(self, key: str):
+        row = self.connection().execute(
+            "SELECT data FROM tracks WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def _write(self, dirty: dict, touched: set):
+
+        connect = self.connection()
+        now = time.time()
+        rows = []
+
+        # serializado aqui (fora do loop): as músicas salvas no cache não são alteradas depois de adicionadas.
+        for key, value in dirty.items():
+            try:
+                rows.append((key, pickle.dumps(value), now + self.ttl, now))
+            except Exception:
+                traceback.print_exc()
+
+        connect.executemany("INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?)", rows)
+        connect.executemany("UPDATE tracks SET accessed_at = ? WHERE key = ?", [(now, key) for key in touched])
+        connect.execute("DELETE FROM tracks WHERE expires_at <= ?", (now,))
+        connect.execute(
+            "DELETE FROM tracks WHERE key IN "
+            "(SELECT key FROM tracks ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)", (self.max_entries,)
+        )
+        connect.commit()
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    async def fetch(self, key: str, default=None):
+
+        try:
+            return self[key]
+        except KeyError:
+            pass
+
+        try:
+            data = await asyncio.get_running_loop().run_in_executor(self.executor, self._read, key)
+        except Exception:
+            traceback.print_exc()
+            return default
+
+        if data is None:
+            return default
+
+        self.memory[key] = data
+        self.touched.add(key)
+        return data
+
+    def __getitem__(self, key: str):
+        value = self.memory[key]
+        self.touched.add(key)
+        return value
+
+    def __setitem__(self, key: str, value):
+        self.memory[key] = value
+        # cópia da lista: o pickle é feito apenas ao gravar (em outra thread).
+        self.dirty[key] = list(value) if isinstance(value, list) else value
+
+    def __contains__(self, key: str):
+        return key in self.memory
+
+    def __len__(self):
+        return len(self.memory)
+
+    def pop(self, key: str, *args):
+        self.dirty.pop(key, None)
+        return self.memory.pop(key, *args)
+
+    def update(self, data: dict):
+        for k, v in data.items():
+            self[k] = v
+
+    def flush_now(self):
+        """Grava as entradas pendentes sem usar o executor (ex: antes do loop iniciar)."""
+        dirty, self.dirty = self.dirty, {}
+        touched, self.touched = self.touched - set(dirty), set()
+        try:
+            self._write(dirty, touched)
+        except Exception:
+            for k, v in dirty.items():
+                self.dirty.setdefault(k, v)
+            raise
+
+    async def flush(self):
+
+        if not self.dirty and not self.touched:
+            return
+
+        if not self.flush_lock:
+            self.flush_lock = asyncio.Lock()
+
+        async with self.flush_lock:
+
+            dirty, self.dirty = self.dirty, {}
+            touched, self.touched = self.touched - set(dirty), set()
+
+            try:
+                await asyncio.get_running_loop().run_in_executor(self.executor, self._write, dirty, touched)
+            except Exception:
+                traceback.print_exc()
+                for k, v in dirty.items():
+                    self.dirty.setdefault(k, v)
+
+    def close(self):
+        # aguarda as gravações em andamento antes de fechar a conexão.
+        self.executor.shutdown(wait=True)
+        if self._connect:
+            self._connect.close()
+            self._connect = None
+
+
+class SnapshotTTLCache(TTLCache):
+    """TTLCache salvo em disco de forma incremental.
+
+    Apenas as chaves alteradas desde o último salvamento são anexadas no arquivo (gravado em outra
+    thread) e o arquivo é reescrito por completo (de forma atômica) apenas quando a quantidade
+    de registros anexados fica muito maior que a quantidade de itens do cache.
+
+    Cada registro guarda o horário em que o item foi adicionado ao cache, de forma que o ttl não seja
+    renovado ao reescrever o arquivo ou ao restaurar os itens após reiniciar.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, path: str):
+        # horário atual (ou o horário de um registro sendo restaurado) usado para calcular a expiração.
+        self.restore_time: Optional[float] = None
+        super().__init__(maxsize=maxsize, ttl=ttl, timer=lambda: self.restore_time or time.time())
+        self.snapshot_path = path
+        self.inserted = {}
+        self.dirty = set()
+        self.log_records = 0
+        self.snapshot_lock: Optional[asyncio.Lock] = None
+
+    def __setitem__(self, key, value, *args, **kwargs):
+        super().__setitem__(key, value, *args, **kwargs)
+        self.inserted[key] = self.restore_time or time.time()
+        self.dirty.add(key)
+
+    def __delitem__(self, key, *args, **kwargs):
+        self.dirty.add(key)
+        self.inserted.pop(key, None)
+        super().__delitem__(key, *args, **kwargs)
+
+    def expire(self, *args, **kwargs):
+        expired = super().expire(*args, **kwargs)
+        for key, value in expired or ():
+            self.inserted.pop(key, None)
+        return expired
+
+    def load_snapshot(self):
+
+        if not os.path.exists(self.snapshot_path):
+            return
+
+        entries = {}
+        records = 0
+
+        with open(self.snapshot_path, 'rb') as f:
+            while True:
+                try:
+                    frame = pickle.load(f)
+                except EOFError:
+                    break
+                except Exception:
+                    # registro incompleto no final do arquivo (ex: processo finalizado durante a gravação).
+                    break
+                for key, deleted, value, timestamp in frame:
+                    records += 1
+                    if deleted:
+                        entries.pop(key, None)
+                    else:
+                        entries[key] = (value, timestamp)
+
+        now = time.time()
+
+        try:
+            # restaurar na ordem em que os itens foram adicionados e com o horário original (os itens expiram no
+            # mesmo horário que expirariam caso o bot não tivesse sido reiniciado).
+            for key, (value, timestamp) in sorted(entries.items(), key=lambda i: i[1][1]):
+                if now - timestamp < self.ttl:
+                    self.restore_time = timestamp
+                    super().__setitem__(key, value)
+                    self.inserted[key] = timestamp
+        finally:
+            self.restore_time = None
+
+        self.expire()
+
+        self.log_records = records
+
+    def _append(self, data: bytes):
+        with open(self.snapshot_path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite(self, data: bytes):
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+    def rewrite_snapshot(self):
+        """Reescreve o arquivo com todos os itens do cache sem aguardar o próximo salvamento (ex: ao migrar)."""
+        now = time.time()
+        frame = [(k, False, v, self.inserted.get(k, now)) for k, v in list(self.items())]
+        self._rewrite(pickle.dumps(frame))
+        self.dirty.clear()
+        self.log_records = len(frame)
+
+    async def save_snapshot(self):
+
+        if not self.snapshot_lock:
+            self.snapshot_lock = asyncio.Lock()
+
+        async with self.snapshot_lock:
+
+            now = time.time()
+
+            dirty, self.dirty = self.dirty, set()
+
+            compact = not os.path.exists(self.snapshot_path) or \
+                      self.log_records + len(dirty) > max(len(self) * 2, 500)
+
+            if compact:
+                frame = [(k, False, v, self.inserted.get(k, now)) for k, v in list(self.items())]
+            elif dirty:
+                frame = []
+                for key in dirty:
+                    try:
+                        frame.append((key, False, self[key], self.inserted.get(key, now)))
+                    except KeyError:
+                        frame.append((key, True, None, now))
+            else:
+                return
+
+            try:
+                # serializar aqui: os itens do cache podem ser alterados (no loop) enquanto o arquivo é gravado.
+                data = pickle.dumps(frame)
+                await asyncio.get_running_loop().run_in_executor(None, self._rewrite if compact else self._append, data)
+            except Exception:
+                self.dirty.update(dirty)
+                raise
+
+            self.log_records = len(frame) if compact else self.log_records + len(frame)
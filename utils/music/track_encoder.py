@@ -2,9 +2,9 @@
 # https://github.com/devoxin/Lavalink.py/blob/development/lavalink/utils.py
 
 import struct
-from base64 import b64encode
+from base64 import b64encode, b64decode
 from io import BytesIO
-from typing import Final, Dict, Any, Mapping, Callable, Optional, Tuple
+from typing import Final, Dict, Any, Mapping, Callable, Optional, Tuple, Iterable, List
 
 V2_KEYSET = {'title', 'author', 'length', 'identifier', 'isStream', 'uri', 'sourceName', 'position'}
 V3_KEYSET = V2_KEYSET | {'artworkUrl', 'isrc'}
@@ -18,11 +18,17 @@ class _MissingObj:
 
 MISSING: Any = _MissingObj()
 
+_INT: Final = struct.Struct('>i')
+_HEADER: Final = struct.Struct('>iB')
+_UNSIGNED_SHORT: Final = struct.Struct('>H')
+_LONG: Final = struct.Struct('>Q')
+
 class DataWriter:
     __slots__ = ('_buf',)
 
     def __init__(self):
-        self._buf: Final[BytesIO] = BytesIO()
+        self._buf: Final[BytesIO] = BytesIO(b'\x00\x00\x00\x00')
+        self._buf.seek(4)
 
     def _write(self, data):
         self._buf.write(data)
@@ -63,18 +69,66 @@ class DataWriter:
         self._write(utf)
 
     def finish(self) -> bytes:
-        with BytesIO() as track_buf:
-            byte_len = self._buf.getbuffer().nbytes
-            flags = byte_len | (1 << 30)
-            enc_flags = struct.pack('>i', flags)
-            track_buf.write(enc_flags)
+        # o header (tamanho + flags) é escrito no espaço reservado no início do buffer, evitando copiar os dados
+        # para um segundo buffer.
+        with self._buf.getbuffer() as view:
+            _INT.pack_into(view, 0, (view.nbytes - 4) | (1 << 30))
+
+        data = self._buf.getvalue()
+        self._buf.close()
+        return data
+
+class DataReader:
+    __slots__ = ('_buf', '_pos')
+
+    def __init__(self, data: bytes):
+        self._buf: Final[bytes] = data
+        self._pos = 0
+
+    @property
+    def remaining(self) -> int:
+        return len(self._buf) - self._pos
+
+    def _read(self, count: int) -> bytes:
+        if self._pos + count > len(self._buf):
+            raise EOFError('Unexpected end of track data')
+        data = self._buf[self._pos:self._pos + count]
+        self._pos += count
+        return data
+
+    def read_byte(self) -> bytes:
+        return self._read(1)
 
-            self._buf.seek(0)
-            track_buf.write(self._buf.read())
-            self._buf.close()
+    def read_boolean(self) -> bool:
+        return self._read(1) != b'\x00'
+
+    def read_unsigned_short(self) -> int:
+        return struct.unpack('>H', self._read(2))[0]
+
+    def read_int(self) -> int:
+        return struct.unpack('>i', self._read(4))[0]
+
+    def read_long(self) -> int:
+        return struct.unpack('>Q', self._read(8))[0]
+
+    def read_nullable_utf(self, utfm: bool = False) -> Optional[str]:
+        if not self.read_boolean():
+            return None
+        return self.read_utfm() if utfm else self.read_utf()
+
+    def read_utf(self) -> str:
+        return self._read(self.read_unsigned_short()).decode('utf8')
+
+    def read_utfm(self) -> str:
+        # "modified utf-8" do java (DataOutput.writeUTF): null como 0xC0 0x80 e caracteres
+        # fora do BMP como pares de surrogates codificados separadamente.
+        data = self._read(self.read_unsigned_short())
+        try:
+            return data.decode('utf8')
+        except UnicodeDecodeError:
+            return data.replace(b'\xc0\x80', b'\x00').decode('utf8', 'surrogatepass') \
+                .encode('utf16', 'surrogatepass').decode('utf16')
 
-            track_buf.seek(0)
-            return track_buf.read()
 
 def _write_track_common(track: Dict[str, Any], writer: DataWriter):
     writer.write_utf(track['title'].encode('ascii', 'ignore').decode('ascii'))
@@ -131,10 +185,59 @@ def encode_track(track: Dict[str, Any],
             f'Track object is missing keys required for serialization: {", ".join(missing_keys)}'
         )
 
-    if V3_KEYSET <= track_keys:
-        return (3, encode_track_v3(track, source_encoders))
+    v3 = V3_KEYSET <= track_keys
+
+    if source_encoders is not MISSING and track['sourceName'] in source_encoders:
+        if v3:
+            return (3, encode_track_v3(track, source_encoders))
+        return (2, encode_track_v2(track, source_encoders))
+
+    return (3 if v3 else 2, b64encode(_encode_track_fast(track, v3)).decode())
+
+
+def encode_tracks(tracks: Iterable[Dict[str, Any]],
+                  source_encoders: Mapping[str, Callable[[DataWriter, Dict[str, Any]], None]] = MISSING) -> List[str]:
+    """
+    Encodes many track dicts at once with :func:`encode_track`, returning only the encoded tracks
+    (in the same order).
+    """
+    return [encode_track(track, source_encoders)[1] for track in tracks]
+
+
+def _utf(value: str, errors: str = 'strict') -> bytes:
+    data = value.encode('utf8' if errors == 'strict' else 'ascii', errors)
+
+    if len(data) > 65535:
+        raise OverflowError('UTF string may not exceed 65535 bytes!')
+
+    return data
+
+
+def _encode_track_fast(track: Dict[str, Any], v3: bool) -> bytes:
+    # mesmo formato do encode_track_v2/v3 (sem source_encoders), porém montando as partes já codificadas
+    # e calculando o header antes para copiar os dados uma única vez (no join).
+    pack_short = _UNSIGNED_SHORT.pack
+    title = _utf(track['title'], 'ignore')
+    author = _utf(track['author'], 'ignore')
+    identifier = _utf(track['identifier'])
+
+    parts = [
+        b'', pack_short(len(title)), title, pack_short(len(author)), author, _LONG.pack(track['length']),
+        pack_short(len(identifier)), identifier, b'\x01' if track['isStream'] else b'\x00'
+    ]
+
+    for value in (track['uri'], track['artworkUrl'], track['isrc']) if v3 else (track['uri'],):
+        if value:
+            value = _utf(value)
+            parts += (b'\x01', pack_short(len(value)), value)
+        else:
+            parts.append(b'\x00')
 
-    return (2, encode_track_v2(track, source_encoders))
+    source = _utf(track['sourceName'])
+    parts += (pack_short(len(source)), source, _LONG.pack(track['position']))
+
+    parts[0] = _HEADER.pack((sum(map(len, parts)) + 1) | (1 << 30), 3 if v3 else 2)
+    return b''.join(parts)
 
 def encode_track_v2(track: Dict[str, Any],
                     source_encoders: Mapping[str, Callable[[DataWriter, Dict[str, Any]], None]] = MISSING) -> str:
@@ -174,3 +277,80 @@ def encode_track_v3(track: Dict[str, Any],
 
     enc = writer.finish()
     return b64encode(enc).decode()
+
+
+def decode_track(track: str,
+                 source_decoders: Mapping[str, Callable[[DataReader], Dict[str, Any]]] = MISSING) -> Dict[str, Any]:
+    """
+    Decodes a base64 track string (as returned by the Lavalink server or :func:`encode_track`) into a track info dict,
+    without requesting the ``/decodetrack`` endpoint.
+
+    Parameters
+    ----------
+    track: :class:`str`
+        The base64 encoded track.
+    source_decoders: Mapping[:class:`str`, Callable[[:class:`DataReader`], Dict[:class:`str`, Any]]]
+        A mapping of source-specific decoders, the counterpart of ``source_encoders`` in :func:`encode_track`.
+        Source-specific fields without a decoder are skipped.
+
+    Raises
+    ------
+    :class:`Exception`
+        If the track could not be decoded (unsupported version or truncated data).
+
+    Returns
+    -------
+    Dict[str, Any]
+        The track info dict, with the same keys accepted by :func:`encode_track`.
+    """
+    data = b64decode(track)
+    reader = DataReader(data)
+
+    message_size = reader.read_int()
+    flags = (message_size & 0xC0000000) >> 30
+    version = struct.unpack('B', reader.read_byte())[0] if flags & 1 else 1
+
+    if version not in (1, 2, 3):
+        raise Exception(f'Unsupported track version: {version}')
+
+    # o lavaplayer grava todos os textos com DataOutput.writeUTF (modified utf-8).
+    info = {
+        'title': reader.read_utfm(),
+        'author': reader.read_utfm(),
+        'length': reader.read_long(),
+        'identifier': reader.read_utfm(),
+        'isStream': reader.read_boolean(),
+        'uri': reader.read_nullable_utf(utfm=True) if version >= 2 else None,
+    }
+
+    if version == 3:
+        info['artworkUrl'] = reader.read_nullable_utf(utfm=True)
+        info['isrc'] = reader.read_nullable_utf(utfm=True)
+
+    info['sourceName'] = reader.read_utfm()
+
+    if source_decoders is not MISSING and info['sourceName'] in source_decoders:
+        info.update(source_decoders[info['sourceName']](reader))
+
+    # a posição é sempre o último campo (após os campos específicos de cada source).
+    info['position'] = struct.unpack('>Q', data[-8:])[0]
+    info['isSeekable'] = not info['isStream']
+
+    return info
+
+
+def decode_tracks(tracks: Iterable[str],
+                  source_decoders: Mapping[str, Callable[[DataReader], Dict[str, Any]]] = MISSING) -> List[Optional[Dict[str, Any]]]:
+    """
+    Decodes many base64 tracks at once with :func:`decode_track`.
+    Tracks that fail to decode are returned as ``None`` (in the same position).
+    """
+    results = []
+
+    for track in tracks:
+        try:
+            results.append(decode_track(track, source_decoders))
+        except Exception:
+            results.append(None)
+
+    return results
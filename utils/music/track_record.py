@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import sys
+from collections import deque
+
+
+class _Sentinel:
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+    def __reduce__(self):
+        # manter o mesmo objeto ao restaurar músicas salvas com pickle (ex: cache de músicas).
+        return self.name
+
+
+_MISSING = _Sentinel("_MISSING")
+_EMPTY_DICT = _Sentinel("_EMPTY_DICT")
+
+_requester_ids = {}
+
+
+class TrackRecord:
+    """Dados de uma música guardados sem os dicts do lavalink (info/extra/pluginInfo).
+
+    Os valores mais comuns ficam em slots (sourceName e author compartilham o mesmo objeto entre as músicas) e o dict
+    info é remontado apenas quando usado (ver :class:`CompactTrack`).
+    """
+
+    info_keys = ("title", "author", "uri", "identifier", "length", "isStream", "isSeekable", "sourceName",
+                 "artworkUrl", "isrc", "position", "id", "pluginInfo")
+    extra_keys = ("requester", "track_loops", "autoplay")
+
+    __slots__ = info_keys + extra_keys + ("extra", "other")
+
+    def __init__(self, info: dict):
+
+        info = dict(info)
+
+        for key in self.info_keys:
+            setattr(self, key, info.pop(key, _MISSING))
+
+        for key in ("sourceName", "author"):
+            if isinstance(value := getattr(self, key), str):
+                setattr(self, key, sys.intern(value))
+
+        if self.pluginInfo == {}:
+            self.pluginInfo = _EMPTY_DICT
+
+        extra = info.pop("extra", _MISSING)
+
+        if isinstance(extra, dict):
+
+            extra = dict(extra)
+
+            for key in self.extra_keys:
+                setattr(self, key, extra.pop(key, _MISSING))
+
+            if isinstance(self.requester, int):
+                if len(_requester_ids) > 50000:
+                    _requester_ids.clear()
+                self.requester = _requester_ids.setdefault(self.requester, self.requester)
+
+            self.extra = extra or None
+
+        else:
+
+            for key in self.extra_keys:
+                setattr(self, key, _MISSING)
+
+            if extra is not _MISSING:
+                info["extra"] = extra
+
+            self.extra = _MISSING
+
+        self.other = info or None
+
+    def __getitem__(self, key: str):
+
+        if key in self.info_keys:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return {} if value is _EMPTY_DICT else value
+
+        if key == "extra":
+            return self.to_info()["extra"]
+
+        if self.other:
+            return self.other[key]
+
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def extra_item(self, key: str):
+
+        if self.extra is _MISSING:
+            if self.other and "extra" in self.other:
+                return self.other["extra"][key]
+            raise KeyError("extra")
+
+        if key in self.extra_keys:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+
+        if self.extra:
+            return self.extra[key]
+
+        raise KeyError(key)
+
+    def to_info(self) -> dict:
+
+        info = {}
+
+        for key in self.info_keys:
+            if (value := getattr(self, key)) is not _MISSING:
+                info[key] = {} if value is _EMPTY_DICT else value
+
+        if self.extra is not _MISSING:
+            extra = {}
+            for key in self.extra_keys:
+                if (value := getattr(self, key)) is not _MISSING:
+                    extra[key] = value
+            if self.extra:
+                extra.update(self.extra)
+            info["extra"] = extra
+
+        if self.other:
+            info.update(self.other)
+
+        return info
+
+
+class CompactTrack:
+    """Mixin das músicas que podem ficar compactadas (:class:`TrackRecord`) enquanto estão nas filas do player.
+
+    O dict ``info`` é remontado no primeiro acesso e a partir daí passa a ser usado normalmente (alterações incluídas)
+    até a música ser compactada novamente. As propriedades das músicas usam :meth:`info_item`/:meth:`extra_item` para
+    ler os valores sem remontar o dict e :meth:`to_info` deve ser usado ao serializar (ex: salvar a sessão do player).
+
+    As classes devem declarar os slots ``_info`` e ``_record``.
+    """
+
+    __slots__ = ()
+
+    @property
+    def info(self) -> dict:
+        if self._info is None:
+            self._info = self._record.to_info()
+            self._record = None
+        return self._info
+
+    @info.setter
+    def info(self, value: dict):
+        self._info = value
+        self._record = None
+
+    def compact(self):
+        if self._info is not None:
+            self._record = TrackRecord(self._info)
+            self._info = None
+
+    @property
+    def is_compact(self) -> bool:
+        return self._info is None
+
+    def to_info(self) -> dict:
+        """Dict info da música (sem mantê-lo na memória caso a música esteja compactada)."""
+        return self._info if self._info is not None else self._record.to_info()
+
+    def info_item(self, key: str):
+        return (self._info if self._info is not None else self._record)[key]
+
+    def info_get(self, key: str, default=None):
+        return (self._info if self._info is not None else self._record).get(key, default)
+
+    def extra_item(self, key: str):
+        if self._info is not None:
+            return self._info["extra"][key]
+        return self._record.extra_item(key)
+
+
+def _compact(track):
+    try:
+        track.compact()
+    except AttributeError:
+        pass
+    return track
+
+
+class TrackQueue(deque):
+    """deque usado nas filas do player (fila, histórico, recomendações etc): as músicas adicionadas são compactadas."""
+
+    def append(self, track):
+        super().append(_compact(track))
+
+    def appendleft(self, track):
+        super().appendleft(_compact(track))
+
+    def extend(self, tracks):
+        super().extend([_compact(t) for t in tracks])
+
+    def extendleft(self, tracks):
+        super().extendleft([_compact(t) for t in tracks])
+
+    def insert(self, index: int, track):
+        super().insert(index, _compact(track))
+
+    def __setitem__(self, index: int, track):
+        super().__setitem__(index, _compact(track))
+
+    def __iadd__(self, tracks):
+        self.extend(tracks)
+        return self
@@ -10,4 +10,5 @@ from .errors import *
 from .events import *
 from .node import Node
 from .player import *
+from .selection import NodeSelector
 from .websocket import WebSocket
@@ -0,0 +1,123 @@
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+class CircuitBreaker:
+    """Tracks the REST health of a node (error rate and p95 latency of the last requests).
+
+    Requests recorded without a latency (ex: track searches, which can be slow on healthy nodes) only
+    count for the error rate, and the p95 latency only opens the breaker after ``latency_min_requests``
+    latency samples.
+
+    ``closed``: requests are allowed.
+    ``open``: the node is skipped by the node selection until a probe succeeds (checked by the node).
+    ``half-open``: the probe succeeded and the node is allowed again, but a single failure opens it
+    again (with a longer cooldown) and it is only closed after ``half_open_successes`` successful requests.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, *, window: int = 30, min_requests: int = 5, error_rate: float = 0.5,
+                 latency_threshold: float = 8.0, latency_min_requests: int = 20, cooldown: float = 15, max_cooldown: float = 300,
+                 half_open_successes: int = 3, on_open: Optional[Callable[['CircuitBreaker'], Any]] = None):
+        self.results = deque(maxlen=window)
+        self.min_requests = min_requests
+        self.error_rate_threshold = error_rate
+        self.latency_threshold = latency_threshold
+        self.latency_min_requests = latency_min_requests
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.half_open_successes = half_open_successes
+        self.on_open = on_open
+
+        self.state = self.CLOSED
+        self.cooldown = cooldown
+        self.opened_at: Optional[float] = None
+        self.successes = 0
+        self.times_opened = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+    @property
+    def error_rate(self) -> float:
+        if not self.results:
+            return 0.0
+        return sum(1 for ok, _ in self.results if not ok) / len(self.results)
+
+    @property
+    def p95_latency(self) -> float:
+        latencies = sorted(latency for _, latency in self.results if latency is not None)
+        if not latencies:
+            return 0.0
+        # nearest-rank p95 (a single slow request doesn't count as the p95 with 20+ samples).
+        return latencies[math.ceil(len(latencies) * 0.95) - 1]
+
+    @property
+    def latency_samples(self) -> int:
+        return sum(1 for _, latency in self.results if latency is not None)
+
+    def record(self, ok: bool, latency: Optional[float] = None):
+
+        if self.state == self.OPEN:
+            # response of a request sent before the breaker opened.
+            return
+
+        if self.state == self.HALF_OPEN:
+            if not ok or (latency is not None and latency >= self.latency_threshold):
+                self.open(min(self.cooldown * 2, self.max_cooldown))
+                return
+            self.successes += 1
+            if self.successes >= self.half_open_successes:
+                self.close()
+            return
+
+        self.results.append((ok, latency))
+
+        if len(self.results) < self.min_requests:
+            return
+
+        if self.error_rate >= self.error_rate_threshold:
+            self.open()
+
+        elif self.latency_samples >= self.latency_min_requests and self.p95_latency >= self.latency_threshold:
+            self.open()
+
+    def open(self, cooldown: Optional[float] = None):
+        self.state = self.OPEN
+        self.cooldown = cooldown or self.base_cooldown
+        self.opened_at = time.monotonic()
+        self.successes = 0
+        self.times_opened += 1
+        if self.on_open:
+            self.on_open(self)
+
+    def half_open(self):
+        self.state = self.HALF_OPEN
+        self.successes = 0
+
+    def close(self):
+        self.state = self.CLOSED
+        self.cooldown = self.base_cooldown
+        self.opened_at = None
+        self.successes = 0
+        self.results.clear()
+
+    def failed_probe(self):
+        self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'error_rate': self.error_rate,
+            'p95_latency': self.p95_latency,
+            'requests': len(self.results),
+            'latency_samples': self.latency_samples,
+            'cooldown': self.cooldown,
+            'times_opened': self.times_opened,
+        }
@@ -22,15 +22,16 @@ SOFTWARE.
 """
 import asyncio
 import logging
-from json import dumps
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Union
 
 import aiohttp
 from disnake.ext import commands
 
+from .codec import JSONCodec, get_codec
 from .errors import *
 from .node import Node
 from .player import Player
+from .selection import NodeSelector
 
 __log__ = logging.getLogger(__name__)
 
@@ -53,14 +54,20 @@ class Client:
 
         return super().__new__(cls)
 
-    def __init__(self, bot: Union[commands.Bot, commands.AutoShardedBot], *, session: aiohttp.ClientSession = None):
+    def __init__(self, bot: Union[commands.Bot, commands.AutoShardedBot], *, session: aiohttp.ClientSession = None,
+                 codec: Union[JSONCodec, str, None] = None, event_workers: int = 32,
+                 node_selector: Optional[NodeSelector] = None):
         self.bot = bot
         self.loop = bot.loop or asyncio.get_event_loop()
         self.session = session
 
         self.nodes = {}
 
-        self._dumps = dumps
+        self.codec = codec if isinstance(codec, JSONCodec) else get_codec(codec)
+        self._dumps = self.codec.dumps
+        self.event_workers = event_workers
+        self.node_selector = node_selector or NodeSelector()
+        self._event_semaphore: Optional[asyncio.Semaphore] = None
 
         if not hasattr(bot, "music"):
             bot.music = self
@@ -189,19 +196,29 @@ class Client:
         """
         return self.nodes.get(identifier, None)
 
-    def get_best_node(self, ignore_node: Node = None) -> Optional[Node]:
+    def sort_nodes(self, nodes: Iterable[Node], *, guild_id: Optional[int] = None, region: Optional[str] = None) -> List[Node]:
+        """Sort the given nodes (best first) using the :class:`.NodeSelector` of the :class:`.Client`."""
+        return self.node_selector.sort(nodes, guild_id=guild_id, region=region)
+
+    def get_best_node(self, ignore_node: Node = None, *, guild_id: Optional[int] = None, region: Optional[str] = None) -> Optional[Node]:
         """Return the best available :class:`wavelink.node.Node` across the :class:`.Client`.
 
+        Parameters
+        ------------
+        ignore_node: Optional[:class:`wavelink.node.Node`]
+            A node to ignore (ex: the node that is being replaced).
+        guild_id: Optional[int]
+            The guild that will use the node (used by the ``hash`` selection strategy).
+        region: Optional[str]
+            The preferred region (used by the ``region`` and ``weighted`` selection strategies).
+
         Returns
         ---------
         Optional[:class:`wavelink.node.Node`]
             The best available :class:`wavelink.node.Node` available to the :class:`.Client`.
         """
         nodes = [n for n in self.nodes.values() if n != ignore_node and n.available and n.is_available]
-        if not nodes:
-            return None
-
-        return sorted(nodes, key=lambda n: len(n.players))[0]
+        return self.node_selector.select(nodes, guild_id=guild_id, region=region)
 
     def get_node_by_region(self, region: str) -> Optional[Node]:
         """Retrieve the best available Node with the given region.
@@ -218,10 +235,7 @@ class Client:
             This could be None if no :class:`wavelink.node.Node` could be found.
         """
         nodes = [n for n in self.nodes.values() if n.region.lower() == region.lower() and n.is_available]
-        if not nodes:
-            return None
-
-        return sorted(nodes, key=lambda n: len(n.players))[0]
+        return self.node_selector.select(nodes, region=region)
 
     def get_node_by_shard(self, shard_id: int) -> Optional[Node]:
         """Retrieve the best available Node with the given shard ID.
@@ -238,10 +252,7 @@ class Client:
             This could be None if no :class:`wavelink.node.Node` could be found.
         """
         nodes = [n for n in self.nodes.values() if n.shard_id == shard_id and n.is_available]
-        if not nodes:
-            return None
-
-        return sorted(nodes, key=lambda n: len(n.players))[0]
+        return self.node_selector.select(nodes)
 
     def get_player(self, guild_id: int, *, cls=None, node_id=None, **kwargs) -> Player:
         """Retrieve a player for the given guild ID. If None, a player will be created and returned.
@@ -318,8 +329,7 @@ class Client:
                 region_options.append(node)
 
         if not shard_options and not region_options:
-            # Sort by len of node players
-            node = sorted(nodes, key=lambda n: len(n.players))[0]
+            node = self.node_selector.select(nodes, guild_id=guild_id)
             player = cls(self.bot, guild_id, node, **kwargs)
             node.players[guild_id] = player
 
@@ -327,11 +337,11 @@ class Client:
 
         best = [n for n in shard_options if n in region_options]
         if best:
-            node = sorted(best, key=lambda n: len(n.players))[0]
+            node = self.node_selector.select(best, guild_id=guild_id)
         elif shard_options:
-            node = sorted(shard_options, key=lambda n: len(n.players))[0]
+            node = self.node_selector.select(shard_options, guild_id=guild_id)
         else:
-            node = sorted(region_options, key=lambda n: len(n.players))[0]
+            node = self.node_selector.select(region_options, guild_id=guild_id)
 
         player = cls(self.bot, guild_id, node, **kwargs)
         node.players[guild_id] = player
@@ -395,6 +405,7 @@ class Client:
                     user_agent=user_agent,
                     auto_reconnect=auto_reconnect,
                     dumps=self._dumps,
+                    codec=self.codec,
                     version=kwargs.pop("version", 3),
                     **kwargs)
 
@@ -0,0 +1,89 @@
+import json
+import logging
+from typing import Any, Union
+
+__log__ = logging.getLogger(__name__)
+
+
+class JSONCodec:
+    """JSON (de)serializer used by the websocket and REST requests of the nodes.
+
+    ``loads`` accepts both str and bytes (REST responses are parsed straight from the raw body)
+    and ``dumps`` always returns str, ``dumps_bytes`` returns bytes.
+    """
+
+    name = 'json'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, data: Any) -> str:
+        return json.dumps(data)
+
+    def dumps_bytes(self, data: Any) -> bytes:
+        return json.dumps(data).encode('utf-8')
+
+    def __repr__(self):
+        return f'<JSONCodec: {self.name}>'
+
+
+class OrjsonCodec(JSONCodec):
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self.loads = orjson.loads
+        self._dumps = orjson.dumps
+
+    def dumps(self, data: Any) -> str:
+        return self._dumps(data).decode('utf-8')
+
+    def dumps_bytes(self, data: Any) -> bytes:
+        return self._dumps(data)
+
+
+class MsgspecCodec(JSONCodec):
+
+    name = 'msgspec'
+
+    def __init__(self):
+        import msgspec
+        self.loads = msgspec.json.Decoder().decode
+        self._dumps = msgspec.json.Encoder().encode
+
+    def dumps(self, data: Any) -> str:
+        return self._dumps(data).decode('utf-8')
+
+    def dumps_bytes(self, data: Any) -> bytes:
+        return self._dumps(data)
+
+
+codecs = {
+    'orjson': OrjsonCodec,
+    'msgspec': MsgspecCodec,
+    'json': JSONCodec,
+}
+
+
+def get_codec(name: str = 'auto') -> JSONCodec:
+    """Returns a codec by name (``orjson``, ``msgspec`` or ``json``).
+
+    With ``auto`` (or an empty name) the first installed library is used (orjson > msgspec > json).
+    """
+    name = (name or 'auto').lower()
+
+    if name == 'auto':
+        for codec in codecs.values():
+            try:
+                return codec()
+            except ImportError:
+                continue
+
+    try:
+        return codecs[name]()
+    except KeyError:
+        raise ValueError(f'Unknown JSON codec: {name} (available: auto, {", ".join(codecs)})')
+    except ImportError:
+        __log__.warning(f'JSON codec {name} is not installed, using the built-in json module.')
+        return JSONCodec()
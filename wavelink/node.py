@@ -23,18 +23,22 @@ SOFTWARE.
 import asyncio
 import datetime
 import inspect
-import json
 import logging
 import os
 import re
+import time
 import traceback
 from typing import Any, Callable, Dict, Optional, Union
 from urllib.parse import quote
 
+import aiohttp
 from rapidfuzz import fuzz
 
+from utils.music.track_encoder import decode_track
 from utils.music.youtube_trusted_session_generator import Browser
 from .backoff import ExponentialBackoff
+from .breaker import CircuitBreaker
+from .codec import JSONCodec, get_codec
 from .errors import *
 from .player import Player, Track, TrackPlaylist
 from .websocket import WebSocket
@@ -49,6 +53,17 @@ soundcloud_regex = re.compile(r"https://soundcloud\.com/([^/]+)/sets/([^/]+)")
 
 exclude_tags = ["remix", "edit", "extend", "compilation", "mashup", "mixed"]
 
+# resultados de buscas e de músicas individuais (playlists usam o playlist_cache).
+cacheable_load_result = re.compile(rb'"loadType"\s*:\s*"(search|track|SEARCH_RESULT|TRACK_LOADED)"')
+
+
+def normalize_query(query: str) -> str:
+    query = query.strip()
+    prefix, sep, search = query.partition(":")
+    if sep and prefix.endswith("search") and not search.startswith("//"):
+        return f"{prefix.lower()}:{' '.join(search.lower().split())}"
+    return query
+
 class Node:
     """A WaveLink Node instance.
 
@@ -86,7 +101,8 @@ class Node:
                  user_agent: str = None,
                  auto_reconnect: bool = True,
                  resume_key: Optional[str] = None,
-                 dumps: Callable[[Dict[str, Any]], Union[str, bytes]] = json.dumps,
+                 dumps: Optional[Callable[[Dict[str, Any]], Union[str, bytes]]] = None,
+                 codec: Optional[JSONCodec] = None,
                  version: int = 3,
                  **kwargs
                  ):
@@ -107,7 +123,8 @@ class Node:
         self.version = 0
         self.session_id: Optional[int] = None
 
-        self._dumps = dumps
+        self.codec = codec or get_codec()
+        self._dumps = dumps or self.codec.dumps
 
         self.shard_id = shard_id
 
@@ -123,6 +140,9 @@ class Node:
 
         self.stats = None
         self.info = {}
+        self.rest_latency: Optional[float] = None
+        self.breaker = CircuitBreaker(on_open=self._breaker_opened)
+        self._probe_task: Optional[asyncio.Task] = None
 
         self.update_info()
 
@@ -133,6 +153,11 @@ class Node:
         self.original_providers = []
         self.native_sources = kwargs.pop("native_sources", set())
 
+        # resume da sessão (lavalink v4): o servidor mantém os players por resume_timeout segundos após a desconexão.
+        self.resume_timeout = kwargs.pop("resume_timeout", 60)
+        self.resume_session_id: Optional[str] = None
+        self.disconnected_at: Optional[float] = None
+
         self._closing = False
         self._is_connecting = False
 
@@ -173,6 +198,111 @@ class Node:
         """Open the node and make it available."""
         self.available = True
 
+    def mark_disconnected(self):
+        if self.session_id:
+            self.resume_session_id = self.session_id
+        if self.disconnected_at is None:
+            self.disconnected_at = time.monotonic()
+        self.session_id = None
+
+    @property
+    def resume_remaining(self) -> float:
+        """Seconds left to resume the previous session (0 if it can't be resumed)."""
+        if self.version != 4 or not self.resume_session_id or not self.resume_timeout or self.disconnected_at is None:
+            return 0
+        return max(self.resume_timeout - (time.monotonic() - self.disconnected_at), 0)
+
+    @property
+    def can_resume(self) -> bool:
+        return self.resume_remaining > 0
+
+    async def configure_resuming(self):
+        """|coro|
+
+        Enable session resuming on the server (``PATCH /v4/sessions/{sessionId}``).
+        """
+        if self.version != 4 or not self.session_id or not self.resume_timeout:
+            return
+
+        try:
+            async with self.session.patch(f"{self.rest_uri}/v4/sessions/{self.session_id}",
+                                          data=self.codec.dumps_bytes({"resuming": True, "timeout": self.resume_timeout}),
+                                          headers={**self.headers, 'Content-Type': 'application/json'}) as r:
+                if r.status != 200:
+                    __log__.warning(f'NODE | {self.identifier} | Failed to enable session resuming: {r.status} | {await r.text()}')
+        except Exception:
+            traceback.print_exc()
+
+    async def fetch_session_players(self) -> list:
+        """|coro|
+
+        Return the players of the current session on the server (``GET /v4/sessions/{sessionId}/players``).
+        """
+        async with self.session.get(f"{self.rest_uri}/v4/sessions/{self.session_id}/players", headers=self.headers) as r:
+            if r.status != 200:
+                raise WavelinkException(f"{self.identifier}: Failed to fetch session players: {r.status} | {await r.text()}")
+            return self.codec.loads(await r.read())
+
+    @property
+    def event_queue_depth(self) -> int:
+        """Amount of websocket frames waiting to be processed."""
+        try:
+            return self._websocket.dispatcher.queue_depth
+        except AttributeError:
+            return 0
+
+    @property
+    def event_lag(self) -> float:
+        """Time (in seconds) the last processed websocket frame waited in the queue."""
+        try:
+            return self._websocket.dispatcher.last_lag
+        except AttributeError:
+            return 0.0
+
+    @property
+    def event_stats(self) -> Dict[str, Any]:
+        """Metrics of the websocket event dispatcher (queue depth, lag, coalesced/dropped frames)."""
+        try:
+            return self._websocket.dispatcher.stats()
+        except AttributeError:
+            return {}
+
+    def record_rest_latency(self, latency: float):
+        """Updates the (moving average) REST latency used by the node selection."""
+        if self.rest_latency is None:
+            self.rest_latency = latency
+        else:
+            self.rest_latency += (latency - self.rest_latency) * 0.2
+
+    def _breaker_opened(self, breaker: CircuitBreaker):
+        print(f"⚠️ - {self._client.bot.user} - Servidor de música [{self.identifier}] com falhas/lentidão nas requisições "
+              f"(erros: {breaker.error_rate:.0%} | p95: {breaker.p95_latency:.1f}s), "
+              f"ignorando o servidor por {breaker.cooldown:.0f} segundos.")
+        if not self._probe_task or self._probe_task.done():
+            self._probe_task = self._client.loop.create_task(self._probe_rest())
+
+    async def _probe_rest(self):
+
+        while self.breaker.is_open and not self._closing:
+
+            await asyncio.sleep(self.breaker.cooldown)
+
+            started = self._client.loop.time()
+
+            try:
+                async with self.session.get(f"{self.rest_uri}/version", headers={'Authorization': self.password},
+                                            timeout=aiohttp.ClientTimeout(total=self.breaker.latency_threshold)) as r:
+                    ok = r.status == 200
+            except Exception:
+                ok = False
+
+            if ok and self._client.loop.time() - started < self.breaker.latency_threshold:
+                self.breaker.half_open()
+                __log__.info(f'NODE | {self.identifier} | REST probe succeeded, breaker is now half-open.')
+                return
+
+            self.breaker.failed_probe()
+
     @property
     def penalty(self) -> float:
         """Returns the load-balancing penalty for this node."""
@@ -210,7 +340,7 @@ class Node:
                 try:
                     async with self._client.bot.session.get(f"{self.rest_uri}/v4/info", timeout=45, headers={'Authorization': self.password}) as r:
                         if r.status == 200:
-                            self.info = await r.json()
+                            self.info = self.codec.loads(await r.read())
                             self.version = 4
                         elif r.status != 404:
                             raise Exception(f"❌ - {self._client.bot.user} - [{r.status}]: {await r.text()}"[:300])
@@ -302,19 +432,32 @@ class Node:
 
         while retries > 0:
 
-            async with self.session.patch(url=uri, json=data, headers=self._websocket.headers) as resp:
+            started = self._client.loop.time()
 
-                try:
-                    resp_data = await resp.json()
-                except:
-                    resp_data = await resp.text()
+            try:
+                async with self.session.patch(url=uri, data=self.codec.dumps_bytes(data),
+                                              headers={**self._websocket.headers, 'Content-Type': 'application/json'}) as resp:
+                    body = await resp.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self.breaker.record(False, self._client.loop.time() - started)
+                raise
+
+            self.breaker.record(resp.status < 500, self._client.loop.time() - started)
+
+            try:
+                resp_data = self.codec.loads(body)
+            except:
+                resp_data = body.decode(errors='replace')
 
-                if resp.status == 200:
-                    return resp_data
+            if resp.status == 200:
+                return resp_data
 
-                retries -= 1
+            retries -= 1
 
-                await asyncio.sleep(1.5)
+            if self.breaker.is_open:
+                break
+
+            await asyncio.sleep(1.5)
 
         if new_node := self._client.get_best_node(ignore_node=self):
             await self.players[guild_id].change_node(new_node.identifier)
@@ -322,6 +465,95 @@ class Node:
 
         raise WavelinkException(f"{self.identifier}: UpdatePlayer Failed = {resp.status}: {resp_data}")
 
+    async def load_tracks(self, query: str, *, retry_on_failure: bool = False) -> Optional[bytes]:
+        """|coro|
+
+        Request the ``loadtracks`` endpoint and return the raw response body.
+
+        Identical requests in progress for the same server (from any bot of the pool) wait for the same
+        request and successful results are kept for a short time in the pool cache.
+        """
+        key = f"{self.rest_uri}|{normalize_query(query)}"
+        pool = self._client.bot.pool
+
+        try:
+            return pool.loadtracks_cache[key]
+        except KeyError:
+            pass
+
+        try:
+            future = pool.loadtracks_inflight[key]
+        except KeyError:
+            pass
+        else:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        future = self._client.loop.create_future()
+        pool.loadtracks_inflight[key] = future
+
+        try:
+            body = await self._fetch_tracks(query, retry_on_failure=retry_on_failure)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(body)
+            if body is not None and cacheable_load_result.search(body[:200]):
+                pool.loadtracks_cache[key] = body
+            return body
+        finally:
+            if pool.loadtracks_inflight.get(key) is future:
+                del pool.loadtracks_inflight[key]
+
+    async def _fetch_tracks(self, query: str, *, retry_on_failure: bool = False) -> Optional[bytes]:
+
+        backoff = ExponentialBackoff(base=1)
+
+        base_uri = f'{self.rest_uri}/v4' if self.version == 4 else self.rest_uri
+
+        for attempt in range(2):
+
+            started = self._client.loop.time()
+
+            try:
+                async with self.session.get(f"{base_uri}/loadtracks?identifier={quote(query)}", headers={'Authorization': self.password}) as resp:
+
+                    self.record_rest_latency(self._client.loop.time() - started)
+                    # search latency depends on the query (playlists, mirrors etc) and is not used as health signal.
+                    self.breaker.record(resp.status < 500)
+
+                    if resp.status != 200:
+
+                        if not retry_on_failure:
+                            __log__.info(f'REST | {self.identifier} | Status code ({resp.status}) while retrieving tracks. Not retrying.')
+                            return
+
+                        if self.breaker.is_open:
+                            raise WavelinkException(f"{self.identifier}: REST circuit breaker is open "
+                                                    f"(status: {resp.status}).")
+
+                        retry = backoff.delay()
+
+                        __log__.info(f'REST | {self.identifier} | Status code ({resp.status}) while retrieving tracks. '
+                                     f'Attempt {attempt} of 5, retrying in {retry} seconds.')
+
+                        await asyncio.sleep(retry)
+                        continue
+
+                    return await resp.read()
+
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self.breaker.record(False)
+                raise
+
     async def get_tracks(self, query: str, *, retry_on_failure: bool = False, **kwargs) -> Union[list, TrackPlaylist, None]:
         """|coro|
 
@@ -343,8 +575,6 @@ class Node:
             A list of or TrackPlaylist instance of :class:`wavelink.player.Track` objects.
             This could be None if no tracks were found.
         """
-        backoff = ExponentialBackoff(base=1)
-
         ytid = None
         playlist_id = None
 
@@ -377,35 +607,18 @@ class Node:
 
         if not (data:=self._client.bot.pool.playlist_cache.get(cache_key)):
 
-            base_uri = f'{self.rest_uri}/v4' if self.version == 4 else self.rest_uri
-
-            for attempt in range(2):
-
-                async with self.session.get(f"{base_uri}/loadtracks?identifier={quote(query)}", headers={'Authorization': self.password}) as resp:
-
-                    if resp.status != 200:
-
-                        if not retry_on_failure:
-                            __log__.info(f'REST | {self.identifier} | Status code ({resp.status}) while retrieving tracks. Not retrying.')
-                            return
-
-                        retry = backoff.delay()
-
-                        __log__.info(f'REST | {self.identifier} | Status code ({resp.status}) while retrieving tracks. '
-                                     f'Attempt {attempt} of 5, retrying in {retry} seconds.')
-
-                        await asyncio.sleep(retry)
-                        continue
+            body = await self.load_tracks(query, retry_on_failure=retry_on_failure)
 
-                    try:
-                        data = await resp.json()
-                    except Exception as e:
-                        raise WavelinkException(f"{self.identifier}: Failed to parse json result. | Error: {repr(e)}")
+            if body is None:
+                return
 
-                    if isinstance(data, list):
-                        return data
+            try:
+                data = self.codec.loads(body)
+            except Exception as e:
+                raise WavelinkException(f"{self.identifier}: Failed to parse json result. | Error: {repr(e)}")
 
-                    break
+            if isinstance(data, list):
+                return data
 
         loadtype = data.get('loadType')
 
@@ -567,10 +780,16 @@ class Node:
         BuildTrackError
             Decoding and building the track failed.
         """
+        try:
+            return Track(id_=identifier, info=decode_track(identifier))
+        except Exception:
+            # formato desconhecido (ex: campos adicionados em versões futuras do lavaplayer), decodificar via server.
+            pass
+
         async with self.session.get(f'{self.rest_uri}/decodetrack?',
                                     headers={'Authorization': self.password},
                                     params={'track': identifier}) as resp:
-            data = await resp.json()
+            data = self.codec.loads(await resp.read())
 
             if not resp.status == 200:
                 raise BuildTrackError(f'Failed to build track. Status: {data["status"]}, Error: {data["error"]}.'
@@ -605,7 +824,7 @@ class Node:
         async with self.session.get(f"{self.rest_uri}/v4/lyrics/{ytid}", headers=self.headers) as r:
             if r.status not in (200, 404):
                 r.raise_for_status()
-            return await r.json()
+            return self.codec.loads(await r.read())
 
     def get_player(self, guild_id: int) -> Optional[Player]:
         """Retrieve a player object associated with the Node.
@@ -663,6 +882,14 @@ class Node:
         except Exception:
             pass
 
+        try:
+            self._websocket.dispatcher.cancel()
+        except AttributeError:
+            pass
+
+        if self._probe_task:
+            self._probe_task.cancel()
+
         del self._client.nodes[self.identifier]
 
     async def _send(self, **data) -> None:
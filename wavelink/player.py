@@ -525,7 +525,7 @@ class Player:
                     if resp.status != 204:
 
                         try:
-                            data = await resp.json()
+                            data = self.node.codec.loads(await resp.read())
                         except:
                             data = await resp.text()
 
@@ -660,7 +660,7 @@ class Player:
                     async with old.session.delete(url=uri, headers=old.headers) as resp:
                         if resp.status != 204:
                             try:
-                                data = await resp.json()
+                                data = old.codec.loads(await resp.read())
                             except:
                                 data = await resp.text()
                             print(f"Ocorreu um erro ao finalizar player: {data}")
@@ -0,0 +1,86 @@
+import hashlib
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from .node import Node
+
+
+def _players(node: 'Node', **kwargs) -> float:
+    return len(node.players)
+
+
+def _penalty(node: 'Node', **kwargs) -> float:
+    # no stats yet (websocket still connecting): sort these after the others by amount of players.
+    if not node.stats:
+        return 1e9 + len(node.players)
+    return node.stats.penalty.total
+
+
+def _region(node: 'Node', region: Optional[str] = None, **kwargs) -> float:
+    if region and node.region.lower() != region.lower():
+        return 1e12 + _penalty(node)
+    return _penalty(node)
+
+
+def _weighted(node: 'Node', latency_weight: float = 1.0, region: Optional[str] = None, **kwargs) -> float:
+    latency = node.rest_latency
+    # nodes without REST requests yet use a neutral latency.
+    if latency is None:
+        latency = 0.25
+    return _region(node, region=region) + latency * 1000 * latency_weight
+
+
+def _hash(node: 'Node', guild_id: Optional[int] = None, **kwargs) -> float:
+    # rendezvous hashing: a guild always prefers the same node (reusing the server caches) and
+    # adding/removing a node only moves the guilds of that node.
+    if guild_id is None:
+        return _penalty(node)
+    return -int.from_bytes(hashlib.blake2b(f"{node.identifier}:{guild_id}".encode(), digest_size=8).digest(), "big")
+
+
+class NodeSelector:
+    """Sorts the available nodes using a selection strategy.
+
+    Strategies: ``players`` (amount of players), ``penalty`` (load from the node stats: players, cpu and
+    nulled/deficit frames), ``region`` (nodes from the given region first, then penalty), ``weighted``
+    (penalty + REST latency) and ``hash`` (consistent hashing by guild id).
+    New strategies can be added with :meth:`register`.
+    """
+
+    strategies: Dict[str, Callable[..., float]] = {
+        'players': _players,
+        'penalty': _penalty,
+        'region': _region,
+        'weighted': _weighted,
+        'hash': _hash,
+    }
+
+    def __init__(self, strategy: str = 'penalty', region: Optional[str] = None, latency_weight: float = 1.0):
+        strategy = (strategy or 'penalty').lower()
+        if strategy not in self.strategies:
+            raise ValueError(f'Unknown node selection strategy: {strategy} (available: {", ".join(self.strategies)})')
+        self.strategy = strategy
+        self.region = region or None
+        self.latency_weight = latency_weight
+
+    @classmethod
+    def register(cls, name: str, key: Callable[..., float]):
+        cls.strategies[name.lower()] = key
+
+    def sort(self, nodes: Iterable['Node'], *, guild_id: Optional[int] = None, region: Optional[str] = None,
+             strategy: Optional[str] = None) -> List['Node']:
+        key = self.strategies[strategy or self.strategy]
+        region = region or self.region
+        nodes = list(nodes)
+        # nodes with an open REST circuit breaker are only used when there's no other option.
+        nodes = [n for n in nodes if not n.breaker.is_open] or nodes
+        return sorted(
+            nodes,
+            key=lambda n: (key(n, guild_id=guild_id, region=region, latency_weight=self.latency_weight), len(n.players))
+        )
+
+    def select(self, nodes: Iterable['Node'], **kwargs) -> Optional['Node']:
+        try:
+            return self.sort(nodes, **kwargs)[0]
+        except IndexError:
+            return None
@@ -24,7 +24,8 @@ import asyncio
 import logging
 import sys
 import traceback
-from typing import Any, Dict
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
 
 import aiohttp
 
@@ -39,6 +40,115 @@ def remove_suffix(input_string, suffix):
         return input_string[:-len(suffix)]
     return input_string
 
+class EventDispatcher:
+    """Processes the websocket frames of a node in order per guild (one queue per guild).
+
+    Queued ``playerUpdate`` frames are discarded when a newer one for the same guild arrives,
+    each queue is limited to ``max_queue_size`` frames and the amount of frames processed at the
+    same time (for all nodes of the client) is limited by ``client.event_workers``.
+    """
+
+    def __init__(self, websocket: 'WebSocket', max_queue_size: int = 256):
+        self.websocket = websocket
+        self.max_queue_size = max_queue_size
+        self.queues: Dict[Optional[str], Deque[Tuple[Dict[str, Any], float]]] = {}
+        self.tasks: Dict[Optional[str], asyncio.Task] = {}
+        self.coalesced = 0
+        self.dropped = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        client = self.websocket.client
+        if not client._event_semaphore:
+            client._event_semaphore = asyncio.Semaphore(client.event_workers)
+        return client._event_semaphore
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(q) for q in self.queues.values())
+
+    @property
+    def max_queue_depth(self) -> int:
+        return max((len(q) for q in self.queues.values()), default=0)
+
+    def _drop_player_update(self, queue: deque) -> bool:
+        for item in queue:
+            if item[0].get('op') == 'playerUpdate':
+                queue.remove(item)
+                return True
+        return False
+
+    def put(self, data: Dict[str, Any]):
+
+        key = data.get('guildId')
+
+        try:
+            queue = self.queues[key]
+        except KeyError:
+            queue = self.queues[key] = deque()
+
+        op = data.get('op')
+
+        if op in ('playerUpdate', 'stats') and queue:
+            for item in queue:
+                if item[0].get('op') == op:
+                    queue.remove(item)
+                    self.coalesced += 1
+                    break
+
+        if len(queue) >= self.max_queue_size and not self._drop_player_update(queue):
+            queue.popleft()
+            self.dropped += 1
+            __log__.warning(f'WEBSOCKET | {self.websocket._node.identifier} | Event queue full for guild {key}, '
+                            f'dropping the oldest frame.')
+
+        queue.append((data, self.websocket.bot.loop.time()))
+
+        if key not in self.tasks:
+            self.tasks[key] = self.websocket.bot.loop.create_task(self._drain(key, queue))
+
+    async def _drain(self, key: Optional[str], queue: deque):
+
+        task = asyncio.current_task()
+
+        try:
+            while queue:
+                data, received = queue.popleft()
+                async with self.semaphore:
+                    self.last_lag = self.websocket.bot.loop.time() - received
+                    if self.last_lag > self.max_lag:
+                        self.max_lag = self.last_lag
+                    try:
+                        await self.websocket.process_data(data)
+                    except Exception:
+                        traceback.print_exc()
+        finally:
+            # after cancel()/reconnect the key may already belong to a new drain task (and queue).
+            if self.tasks.get(key) is task:
+                del self.tasks[key]
+            if not queue and self.queues.get(key) is queue:
+                del self.queues[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'queued': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'guilds': len(self.queues),
+            'last_lag': self.last_lag,
+            'max_lag': self.max_lag,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+        }
+
+    def cancel(self):
+        for task in self.tasks.values():
+            task.cancel()
+        self.tasks.clear()
+        self.queues.clear()
+
+
 class WebSocket:
 
     def __init__(self, **attrs):
@@ -54,6 +164,8 @@ class WebSocket:
         self.user_agent = attrs.get('user_agent') or ''
         self.auto_reconnect = attrs.get('auto_reconnect', True)
         self._dumps = attrs.get('dumps')
+        self._loads = self._node.codec.loads
+        self.dispatcher = EventDispatcher(self, max_queue_size=attrs.get('event_queue_size') or 256)
 
         self._websocket = None
         self._last_exc = None
@@ -78,8 +190,8 @@ class WebSocket:
             if self._node_started:
                 data['Session-Resumed'] = 'true'
 
-            if self._node.session_id:
-                data["Session-Id"] = self._node.session_id
+            if session_id := (self._node.session_id or (self._node.can_resume and self._node.resume_session_id)):
+                data["Session-Id"] = session_id
 
         if self.user_agent:
             data['User-Agent'] = self.user_agent
@@ -108,7 +220,7 @@ class WebSocket:
                 self._websocket = await self._node.session.ws_connect(uri, headers=self.headers, heartbeat=self._node.heartbeat)
 
         except Exception as error:
-            self._node.session_id = None
+            self._node.mark_disconnected()
             self._last_exc = error
             self._node.available = False
 
@@ -148,7 +260,7 @@ class WebSocket:
                 self._closed = True
 
                 if not self.auto_reconnect:
-                    self._node.session_id = None
+                    self._node.mark_disconnected()
                     self.bot.dispatch('wavelink_node_connection_closed', self._node)
                     continue
 
@@ -165,12 +277,12 @@ class WebSocket:
                 __log__.debug(f'WEBSOCKET | Received Payload:: <{msg.data}>')
 
                 try:
-                    json_data = msg.json()
+                    json_data = self._loads(msg.data)
                 except Exception:
                     traceback.print_exc()
                     print(repr(msg))
                 else:
-                    self.bot.loop.create_task(self.process_data(json_data))
+                    self.dispatcher.put(json_data)
 
     async def process_data(self, data: Dict[str, Any]):
         op = data.get('op', None)
@@ -180,7 +292,14 @@ class WebSocket:
         if op == 'ready':
             if self._node.version == 3:
                 return
+            resumed = bool(data.get("resumed")) and data["sessionId"] == self._node.resume_session_id
             self._node.session_id = data["sessionId"]
+            self._node.resume_session_id = data["sessionId"]
+            self._node.disconnected_at = None
+            if resumed:
+                self.bot.dispatch("wavelink_node_resumed", self._node)
+            else:
+                self.bot.loop.create_task(self._node.configure_resuming())
             self.bot.dispatch("wavelink_node_ready", self._node)
 
         elif op == 'stats':